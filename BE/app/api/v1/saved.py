@@ -1,68 +1,123 @@
 # /app/api/v1/saved.py
 # 저장된 항공편 관련된 CRUD API를 제공하는 라우터 모듈
-# 저장된 항공편 목록 조회(READ), 저장(CREATE), 삭제(DELETE)를 처리
+# 저장된 항공편 목록 조회(READ), 저장(CREATE), 삭제(DELETE), 가격 변동 기록 조회를 처리
 
-# 타입 힌트에 사용할 리스트 제네릭 타입
-from typing import List
+# 출발일 범위 필터 쿼리 파라미터 타입
+from datetime import date
+
+# 정렬 기준/방향 쿼리 파라미터 타입, 가격 변동 기록 리스트 타입
+from typing import List, Literal
 
 # APIRouter는 FastAPI 라우터 생성용 클래스
 # Depends는 FastAPI의 의존성 주입
 # HTTPException는 클라이언트 요청 오류가 있을 시 적절한 HTTP 상태코드를 담아 반환
-from fastapi import APIRouter, Depends, HTTPException
-# Session 타입은 SQLAlchemy DB 세션 객체를 의미
-from sqlalchemy.orm import Session
+# Query는 쿼리 파라미터 검증(범위 등)
+from fastapi import APIRouter, Depends, HTTPException, Query
+# AsyncSession 타입은 SQLAlchemy 비동기 DB 세션 객체를 의미
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # DB 세션을 생성해주는 의존성 함수
 from app.core.dependencies import get_db
 # 저장된 항공편 정보를 DB에서 C, R, D 처리하는 Repository 클래스
-from app.repositories.saved_flight_repo import SavedFlightRepository
+from app.repositories.saved_flight_repo import MAX_PAGE_SIZE, SavedFlightRepository
 # Flight, FlightCreate: API 요청/응답에 사용하는 Pydantic 스키마
-from app.schemas.flight_schema import Flight, FlightCreate
+# SavedFlightQuery, SavedFlightPage: 목록 조회 조건과 한 페이지 응답 스키마
+# SavedFlightPriceChangeOut: 가격 변동 기록 응답 스키마
+from app.schemas.flight_schema import (
+    Flight,
+    FlightCreate,
+    SavedFlightPage,
+    SavedFlightPriceChangeOut,
+    SavedFlightQuery,
+)
 
 # /saved를 기본 경로로 하는 라우터 생성
 router = APIRouter(prefix="/saved")
 
 # 저장된 항공편 리스트 조회 API
 # /v1/saved/flights URL로 GET 요청이 오면 list_saved_flights함수를 실행
-@router.get("/flights", response_model=List[Flight])
-def list_saved_flights(
+# 전체 목록 대신 한 페이지(items)와 다음 페이지 커서(next_cursor)를 반환
+# 예: /v1/saved/flights?destination=NRT&sort=price&limit=20 -> 다음 페이지는 &cursor=<next_cursor>
+@router.get("/flights", response_model=SavedFlightPage)
+async def list_saved_flights(
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    sort: Literal["id", "departure_date", "price"] = "id",
+    order: Literal["asc", "desc"] = "asc",
+    origin: str | None = None,
+    destination: str | None = None,
+    departure_from: date | None = None,
+    departure_to: date | None = None,
+    min_price: int | None = Query(None, ge=0),
+    max_price: int | None = Query(None, ge=0),
 		# FastAPI가 get_db()를 실행하여 DB 세션 만들어서 함수에 넣어준다
-    db: Session = Depends(get_db),
-) -> List[Flight]:
+    db: AsyncSession = Depends(get_db),
+) -> SavedFlightPage:
+    query = SavedFlightQuery(
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        order=order,
+        origin=origin,
+        destination=destination,
+        departure_from=departure_from,
+        departure_to=departure_to,
+        min_price=min_price,
+        max_price=max_price,
+    )
 		# 이 db 세션을 Repository에게 전달
     repository = SavedFlightRepository(db)
-    # Repository가 DB에서 데이터 가져와서 반환
-    return repository.list_flights()
+    # Repository가 DB에서 한 페이지를 가져와서 반환
+    try:
+        return await repository.list_flights(query)
+    # 잘못된 커서(또는 다른 정렬 기준으로 만든 커서)는 400
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 # /v1/saved/flights 주소로 POST 요청이 오면 save_flight함수를 실행
 # 새로운 항공권을 저장하라는 요청을 처리하는 API.
 @router.post("/flights", response_model=Flight, status_code=201)
-def save_flight(
+async def save_flight(
 		# 요청 바디(JSON)를 FlightCreate 스키마로 검증하여 payload로 받는다
     payload: FlightCreate,
     #  FastAPI가 get_db()를 실행하여 DB 세션 만들어서 함수에 넣어준다
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> Flight:
 		# 이 db 세션을 Repository에게 전달
     repository = SavedFlightRepository(db)
     # 저장된 항공편 정보를 Flight 모델 형태로 반환
-    return repository.create_flight(payload)
+    return await repository.create_flight(payload)
 
 # /v1/saved/flights/3 같은 URL로 DELETE 요청이 오면 이 함수가 실행
 # {flight_id}는 삭제할 항공편의 ID
 # 삭제 성공하면 status_code=204(성공응답)
 @router.delete("/flights/{flight_id}", status_code=204)
-def delete_flight(
+async def delete_flight(
 		# 삭제할 객체의 ID
     flight_id: int,
     # #  FastAPI가 get_db()를 실행하여 DB 세션 만들어서 함수에 넣어준다
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> None:
 		# DB 세션을 전달해서 repository를 준비
     repository = SavedFlightRepository(db)
     # Repository에게 이 ID를 가진 항공편 삭제하라고 요청
-    deleted = repository.delete_flight(flight_id)
+    deleted = await repository.delete_flight(flight_id)
     # 삭제 실패시
     if not deleted:
 		    # 404 Not Found 에러를 클라이언트에게 던짐
-        raise HTTPException(status_code=404, detail="Flight not found")
\ No newline at end of file
+        raise HTTPException(status_code=404, detail="Flight not found")
+
+# /v1/saved/flights/3/price-changes 같은 URL로 GET 요청이 오면 이 함수가 실행
+# 백그라운드 가격 갱신이 기록한 가격 변동(이전 가격, 새 가격, 차이)을 최신순으로 반환
+@router.get("/flights/{flight_id}/price-changes", response_model=List[SavedFlightPriceChangeOut])
+async def list_price_changes(
+    flight_id: int,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db),
+) -> List[SavedFlightPriceChangeOut]:
+    repository = SavedFlightRepository(db)
+    changes = await repository.list_price_changes(flight_id, limit)
+    # 항공편이 없으면 404
+    if changes is None:
+        raise HTTPException(status_code=404, detail="Flight not found")
+    return changes
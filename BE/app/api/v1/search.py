@@ -5,33 +5,95 @@
 # Depends는 FastAPI의 의존성 주입
 # HTTPException는 클라이언트 요청 오류가 있을 시 적절한 HTTP 상태코드를 담아 반환
 from fastapi import APIRouter, Depends, HTTPException
+# Flight 객체, 날짜 등을 JSON으로 변환 가능한 값으로 바꿔주는 함수
+from fastapi.encoders import jsonable_encoder
+# 응답 본문을 조금씩 흘려보내는 스트리밍 응답 클래스, 직렬화된 본문을 그대로 보내는 응답 클래스
+from fastapi.responses import Response, StreamingResponse
 
 # 항공편 검색 기능을 FastAPI가 자동으로 만들어서 주입할수 있게 해주는 의존성 함수를 import
-from app.core.dependencies import get_llm_service
+from app.core.dependencies import get_flexible_search_service, get_llm_service
+# 스트리밍 이벤트를 NDJSON 한 줄씩 직렬화하기 위한 함수 (orjson이 있으면 orjson)
+from shared.wire import dumps_json
 # 요청/응답 데이터 형식(Pydantic)을 가져온다
 # FlightSearchRequest: 클라이언트가 보내는 검색 조건(JSON)의 형식을 정의
 # FlightSearchResponse: API가 응답할 때 어떤 형식으로 결과를 반환할지 정의
-from app.schemas.search_schema import FlightSearchRequest, FlightSearchResponse
+# FlexibleSearchRequest: 목적지/월/여행 기간 기반의 유연한 날짜 검색 조건
+from app.schemas.search_schema import FlexibleSearchRequest, FlightSearchRequest, FlightSearchResponse
+# 월 x 여행 기간 검색을 서버에서 처리하는 서비스 클래스
+from app.services.flexible_search_service import FlexibleSearchService
 # 실제 항공편 검색 로직을 수행하는 서비스 클래스
 from app.services.llm_service import LLMService
 
 # /search를 기본 경로로 갖는 라우터 생성
 router = APIRouter(prefix="/search")
 
+# 검색 결과를 JSON 응답 본문으로 직렬화
+# Flight 객체는 LLMService에서 이미 타입을 맞춰 만들었으므로, FastAPI가 response_model로
+# 결과를 dict로 바꿨다가 다시 검증하는 과정을 건너뛰고 한 번에 JSON으로 직렬화한다
+# (response_model은 OpenAPI 문서용으로 그대로 둔다)
+def _search_response(flights) -> Response:
+    body = FlightSearchResponse.construct(results=flights).json()
+    return Response(content=body, media_type="application/json")
+
 # 해당 경로로 POST 요청이 오면 아래 함수 실행
+# 비동기 핸들러라서 MCP 왕복 동안 스레드풀 워커를 점유하지 않음
 @router.post("/flights", response_model=FlightSearchResponse)
-def search_flights(
+async def search_flights(
     # 요청 바디(JSON)를 FlightSearchRequest로 검증 후 받음
     payload: FlightSearchRequest,
     # FastAPI가 get_llm_service()를 실행해서 LLMService 객체(항공편 검색 기능)를 자동으로 함수에 넣음
     # 의존성 주입
     llm_service: LLMService = Depends(get_llm_service),
-) -> FlightSearchResponse: # 함수의 최종 반환 타입은 FlightSearchResponse
+) -> Response: # 함수의 최종 반환 값은 FlightSearchResponse 형식의 JSON 응답
     try:
         # 검색 서비스(LLMService)에게 항공편 검색 결과 요청
-        flights = llm_service.search_flights(payload)
+        flights = await llm_service.search_flights(payload)
     # 예기치 않은 오류가 발생 시 500 Internal Server Error로 반환
     except Exception as exc:  # pragma: no cover - placeholder for real error handling
         raise HTTPException(status_code=500, detail=str(exc)) from exc
     # 검색 결과 flights를 JSON 응답으로 반환
-    return FlightSearchResponse(results=flights)
+    return _search_response(flights)
+
+# /search/flights/stream로 POST 요청이 오면 아래 함수 실행
+# 검색 결과를 MCP 공급자가 응답할 때마다 NDJSON(한 줄에 이벤트 하나)으로 바로 흘려보냄
+# 가장 빠른 공급자의 결과가 먼저 도착하고, 마지막 줄은 최저가와 공급자별 상태를 담은 summary 이벤트
+@router.post("/flights/stream")
+async def stream_search_flights(
+    # 요청 바디(JSON)를 FlightSearchRequest로 검증 후 받음
+    payload: FlightSearchRequest,
+    llm_service: LLMService = Depends(get_llm_service),
+) -> StreamingResponse:
+    async def events():
+        async for event in llm_service.stream_flights(payload):
+            yield dumps_json(jsonable_encoder(event)) + b"\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+# /search/flexible로 POST 요청이 오면 아래 함수 실행
+# 월 안의 여러 날짜 구간을 서버에서 만들어 동시에 검색하고, 가격순 상위 N개를 한 번에 반환
+# (브라우저가 날짜 구간마다 /search/flights를 순차 호출하던 것을 1회 호출로 대체)
+@router.post("/flexible", response_model=FlightSearchResponse)
+async def search_flexible_flights(
+    # 요청 바디(JSON)를 FlexibleSearchRequest로 검증 후 받음
+    payload: FlexibleSearchRequest,
+    # FastAPI가 get_flexible_search_service()를 실행해서 서비스 객체를 자동으로 함수에 넣음
+    flexible_search_service: FlexibleSearchService = Depends(get_flexible_search_service),
+) -> Response:
+    try:
+        flights = await flexible_search_service.search(payload)
+    # 월 형식이 잘못된 경우 400 Bad Request로 반환
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    # 예기치 않은 오류가 발생 시 500 Internal Server Error로 반환
+    except Exception as exc:  # pragma: no cover - placeholder for real error handling
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    # 가격순 상위 N개 결과를 JSON 응답으로 반환
+    return _search_response(flights)
+
+# /search/cache로 DELETE 요청이 오면 검색 결과 캐시를 모두 비움
+# 성공하면 status_code=204(성공응답)
+@router.delete("/cache", status_code=204)
+async def invalidate_search_cache(
+    llm_service: LLMService = Depends(get_llm_service),
+) -> None:
+    llm_service.invalidate_cache()
@@ -18,6 +18,51 @@ class Settings(BaseSettings):
         default="sqlite:///./app.db",
         description="Database connection string",
     )
+    #DB 커넥션 풀 크기 (항상 유지하는 연결 수)
+    db_pool_size: int = Field(
+        default=5,
+        description="Number of connections kept in the database pool",
+    )
+    #풀 크기를 넘어 잠시 더 열 수 있는 연결 수
+    db_max_overflow: int = Field(
+        default=10,
+        description="Connections allowed beyond db_pool_size under load",
+    )
+    #풀에서 연결을 기다리는 최대 시간(초 단위)
+    db_pool_timeout_seconds: float = Field(
+        default=30.0,
+        description="Seconds to wait for a pooled connection before failing",
+    )
+    #연결을 재활용(다시 연결)하는 주기(초 단위), -1이면 재활용하지 않음
+    db_pool_recycle_seconds: int = Field(
+        default=1800,
+        description="Recycle pooled connections older than this many seconds, -1 disables it",
+    )
+    #풀에서 꺼낸 연결이 살아있는지 먼저 확인할지 여부
+    db_pool_pre_ping: bool = Field(
+        default=False,
+        description="Check pooled connections with a ping before use",
+    )
+    #SQLite WAL 모드 사용 여부 (읽기와 쓰기가 서로를 막지 않음)
+    sqlite_wal_enabled: bool = Field(
+        default=True,
+        description="Use SQLite write-ahead logging",
+    )
+    #SQLite synchronous PRAGMA 값 (WAL에서는 NORMAL로도 DB가 깨지지 않음)
+    sqlite_synchronous: str = Field(
+        default="NORMAL",
+        description="SQLite synchronous pragma (OFF, NORMAL, FULL, EXTRA)",
+    )
+    #SQLite 연결당 페이지 캐시 크기(KiB)
+    sqlite_cache_size_kib: int = Field(
+        default=16_384,
+        description="SQLite page cache size per connection in KiB",
+    )
+    #SQLite 잠금 대기 시간(ms), 다른 연결이 쓰는 중이면 바로 실패하지 않고 기다림
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000,
+        description="Milliseconds SQLite waits on a locked database",
+    )
     #LLM 제공자의 API 키, 기본값 None, 설명 포함
     openai_api_key: Optional[str] = Field(
         default=None,
@@ -33,6 +78,76 @@ class Settings(BaseSettings):
         default=10,
         description="Timeout (in seconds) for outbound HTTP requests",
     )
+    #MCP 서버 호출용 커넥션 풀의 최대 연결 수
+    mcp_max_connections: int = Field(
+        default=100,
+        description="Maximum open connections in the MCP client pool",
+    )
+    #커넥션 풀에서 유지(keep-alive)할 유휴 연결 수
+    mcp_max_keepalive_connections: int = Field(
+        default=20,
+        description="Maximum idle keep-alive connections in the MCP client pool",
+    )
+    #유휴 연결을 유지하는 시간(초 단위)
+    mcp_keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        description="Seconds an idle MCP connection is kept alive",
+    )
+    #MCP 응답을 msgpack(설치된 경우) / zstd·gzip 압축으로 받을지 여부 (False면 압축 없는 JSON)
+    mcp_wire_negotiation: bool = Field(
+        default=True,
+        description="Negotiate msgpack bodies and zstd/gzip compression with the MCP server",
+    )
+    #검색 결과 캐시 TTL(초 단위), 0이면 캐시 비활성화
+    search_cache_ttl_seconds: float = Field(
+        default=60.0,
+        description="TTL (in seconds) of the in-process search result cache, 0 disables it",
+    )
+    #검색 결과 캐시에 보관할 최대 검색 수
+    search_cache_max_entries: int = Field(
+        default=1024,
+        description="Maximum number of cached searches",
+    )
+    #검색 결과 캐시에 보관할 최대 항공편 수 (메모리 상한)
+    search_cache_max_flights: int = Field(
+        default=50_000,
+        description="Maximum number of flights held across all cached searches",
+    )
+    #저장된 항공편 가격을 백그라운드에서 주기적으로 다시 확인할지 여부 (MCP_SERVER_URL 필요)
+    saved_price_refresh_enabled: bool = Field(
+        default=False,
+        description="Periodically re-price saved flights through the MCP server",
+    )
+    #저장된 항공편 가격 갱신 주기(초 단위)
+    saved_price_refresh_interval_seconds: float = Field(
+        default=3600.0,
+        description="Seconds between saved-flight price refresh runs",
+    )
+    #JSON-RPC 배치 1회에 담을 노선(출발지, 도착지, 출발일, 귀국일) 수
+    saved_price_refresh_batch_size: int = Field(
+        default=20,
+        description="Distinct routes sent per JSON-RPC batch during a price refresh",
+    )
+    #가격 갱신에서 동시에 보낼 최대 배치 수
+    saved_price_refresh_max_concurrency: int = Field(
+        default=2,
+        description="Maximum JSON-RPC batches in flight during a price refresh",
+    )
+    #새로 시작하는 트레이스 중 기록할 비율 (0~1)
+    trace_sample_rate: float = Field(
+        default=1.0,
+        description="Fraction of new traces that are recorded, incoming traceparent decisions are kept",
+    )
+    #샘플링된 스팬을 추가 기록할 파일 경로, 없으면 내보내지 않음 (MCP 서버로의 traceparent 전달은 계속됨)
+    trace_export_path: Optional[str] = Field(
+        default=None,
+        description="File that sampled spans are appended to, tracing export is disabled when unset",
+    )
+    #스팬 파일 형식: jsonl(스팬 하나당 한 줄) / otlp(OTLP/JSON, Collector otlpjsonfile 수신기 형식)
+    trace_export_format: str = Field(
+        default="jsonl",
+        description="Span file format: jsonl or otlp",
+    )
 
     #Pydantic의 Config 클래스를 사용하여 .env 파일 및 인코딩 설정 지정
     class Config:
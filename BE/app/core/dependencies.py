@@ -1,11 +1,17 @@
-#Generator 타입 힌트를 위해 collections.abc에서 Generator 임포트
-from collections.abc import Generator
+#타입 어노테이션 평가 방식을 변화시키는 모듈
+from __future__ import annotations
 
-#FastAPI의 의존성 주입 기능을 위해 Depends 임포트
-from fastapi import Depends
+#AsyncIterator 타입 힌트를 위해 collections.abc에서 AsyncIterator 임포트
+from collections.abc import AsyncIterator
 
-#SQLAlchemy의 세션 관리를 위해 Session 임포트
-from sqlalchemy.orm import Session
+#공유 HTTP 클라이언트 타입 힌트를 위한 외부 라이브러리
+import httpx
+
+#FastAPI의 의존성 주입 기능을 위해 Depends, 앱 상태 접근을 위해 Request 임포트
+from fastapi import Depends, Request
+
+#SQLAlchemy의 비동기 세션 관리를 위해 AsyncSession 임포트
+from sqlalchemy.ext.asyncio import AsyncSession
 
 #앱 설정 관리용 Settings 클래스 및 설정 객체 반환 함수 임포트
 from app.core.config import Settings, get_settings
@@ -16,21 +22,52 @@ from app.db.database import SessionLocal
 #항공권 검색 서비스 LLMService 클래스 임포트
 from app.services.llm_service import LLMService
 
+#MCP 검색 결과 캐시 임포트
+from app.services.search_cache import SearchResultCache
+
+#월 x 여행 기간 유연한 날짜 검색 서비스 임포트
+from app.services.flexible_search_service import FlexibleSearchService
+
 #데이터베이스 세션을 생성, 관리하는 의존성 주입 함수
-def get_db() -> Generator[Session, None, None]:
+#스레드풀 작업자를 막지 않도록 비동기 세션을 사용
+async def get_db() -> AsyncIterator[AsyncSession]:
     #새 DB 세션 생성
-    #yidld를 사용해 요청 처리 함수에 세션 객체를 전달
-    #세션 사용 후 반드시 닫히도록 finally 블록에서 자원 해제 및 세션 종료
-    db = SessionLocal()
-    try:
+    #yield를 사용해 요청 처리 함수에 세션 객체를 전달
+    #세션 사용 후 반드시 닫히도록 async with 블록에서 자원 해제 및 세션 종료
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
-#LLMService 인스턴스를 생성하여 반환하는 의존성 주입 함수
-def get_llm_service(settings: Settings = Depends(get_settings)) -> LLMService:
+#설정값과 공유 HTTP 클라이언트로 LLMService 인스턴스를 생성하는 함수
+#with_cache가 True이면 앱 전체에서 공유할 검색 결과 캐시를 함께 생성
+def build_llm_service(
+    settings: Settings,
+    client: httpx.AsyncClient | None = None,
+    with_cache: bool = False,
+) -> LLMService:
+    cache = None
+    if with_cache and settings.search_cache_ttl_seconds > 0:
+        cache = SearchResultCache(
+            ttl_seconds=settings.search_cache_ttl_seconds,
+            max_entries=settings.search_cache_max_entries,
+            max_flights=settings.search_cache_max_flights,
+        )
     return LLMService(
         api_key=settings.openai_api_key,
         rpc_url=settings.mcp_server_url,
         timeout_seconds=settings.request_timeout_seconds,
+        client=client,
+        cache=cache,
+        negotiate_wire=settings.mcp_wire_negotiation,
     )
+
+#앱 lifespan에서 만든 LLMService(공유 커넥션 풀 포함)를 반환하는 의존성 주입 함수
+#lifespan 없이 실행된 경우에는 요청마다 새로 생성
+def get_llm_service(request: Request, settings: Settings = Depends(get_settings)) -> LLMService:
+    llm_service = getattr(request.app.state, "llm_service", None)
+    return llm_service if llm_service is not None else build_llm_service(settings)
+
+#유연한 날짜 검색 서비스 인스턴스를 생성하여 반환하는 의존성 주입 함수
+def get_flexible_search_service(
+    llm_service: LLMService = Depends(get_llm_service),
+) -> FlexibleSearchService:
+    return FlexibleSearchService(llm_service=llm_service)
@@ -0,0 +1,17 @@
+#HTTP 요청을 보내기 위한 외부 라이브러리
+import httpx
+
+#앱 설정 관리용 Settings 클래스 임포트
+from app.core.config import Settings
+
+#MCP 서버 호출에 사용할 공유 AsyncClient(커넥션 풀)를 설정값으로 생성
+#앱 lifespan 동안 하나만 만들어 keep-alive 연결을 재사용하고, 종료 시 닫는다
+def create_mcp_client(settings: Settings) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=settings.request_timeout_seconds,
+        limits=httpx.Limits(
+            max_connections=settings.mcp_max_connections,
+            max_keepalive_connections=settings.mcp_max_keepalive_connections,
+            keepalive_expiry=settings.mcp_keepalive_expiry_seconds,
+        ),
+    )
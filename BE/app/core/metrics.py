@@ -0,0 +1,18 @@
+#서비스 공용 지표 레지스트리
+from shared.metrics import Registry
+
+#BE 전역 지표 레지스트리와 지표 정의
+REGISTRY = Registry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "be_http_request_duration_seconds", "HTTP request latency by route", ("route", "method", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge("be_http_requests_in_flight", "HTTP requests currently being served")
+MCP_ROUNDTRIP_DURATION = REGISTRY.histogram(
+    "be_mcp_roundtrip_seconds", "Round-trip time of calls to the MCP server", ("kind", "outcome")
+)
+MCP_REQUESTS_IN_FLIGHT = REGISTRY.gauge("be_mcp_requests_in_flight", "Calls to the MCP server currently in flight")
+FALLBACK_FLIGHTS = REGISTRY.counter(
+    "be_fallback_flights_total", "Placeholder flights returned because the MCP server gave no results"
+)
+SEARCH_CACHE_LOOKUPS = REGISTRY.counter("be_search_cache_lookups_total", "Search result cache lookups", ("result",))
@@ -1,31 +1,104 @@
-# SQLAlchemy 엔진 생성 함수 임포트 (DB와의 실제 연결을 담당)
-from sqlalchemy import create_engine
+# SQLAlchemy 비동기 엔진/세션 생성 함수 임포트 (DB와의 실제 연결을 담당)
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
-# ORM 모델의 기반 클래스와 세션 팩토리 생성 함수 임포트
-from sqlalchemy.orm import declarative_base, sessionmaker
+# 파일/서버 DB에 사용할 비동기 커넥션 풀 클래스
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-# 환경 설정에서 DATABASE_URL 등을 불러오는 함수 임포트
-from app.core.config import get_settings
+# ORM 모델의 기반 클래스 생성 함수 임포트
+from sqlalchemy.orm import declarative_base
 
-# 설정 객체 생성 
+# 연결 문자열의 드라이버 부분을 비동기 드라이버로 바꾸기 위한 URL 파서
+from sqlalchemy.engine import make_url
+
+# 환경 설정에서 DATABASE_URL, 커넥션 풀/SQLite 설정을 불러오는 함수 임포트
+from app.core.config import Settings, get_settings
+
+# 설정 객체 생성
 settings = get_settings()
 
-# 데이터베이스 연결 URL 가져오기
-database_url = settings.database_url
+# 동기 드라이버 이름 -> 비동기 드라이버 이름 (DATABASE_URL은 기존 형식 그대로 사용 가능)
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+# 비동기 드라이버를 쓰는 연결 URL로 변환 (이미 드라이버가 지정되어 있으면 그대로 사용)
+def async_database_url(url: str) -> str:
+    parsed = make_url(url)
+    if "+" in parsed.drivername:
+        return url
+    driver = ASYNC_DRIVERS.get(parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False) if driver else url
+
+# 메모리 SQLite 여부 (연결마다 별도 DB가 되므로 커넥션 풀 설정을 적용하지 않음)
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+# 설정값으로 비동기 엔진 생성
+# - 파일 DB / 서버 DB: 커넥션 풀 크기, 초과 허용 수, 대기 시간, 재활용 주기를 설정값으로 지정
+# - SQLite: 연결될 때마다 WAL 모드와 synchronous / cache_size / busy_timeout PRAGMA 적용
+def create_engine_from_settings(settings: Settings) -> AsyncEngine:
+    url = async_database_url(settings.database_url)
+    options = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if not _is_memory_sqlite(url):
+        options.update(
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pool_recycle=settings.db_pool_recycle_seconds,
+        )
+    engine = create_async_engine(url, **options)
+    if make_url(url).get_backend_name() == "sqlite":
+        event.listen(engine.sync_engine, "connect", _sqlite_pragmas(settings))
+    return engine
 
-# SQLAlchemy 엔진 생성
-# - SQLite의 경우 멀티스레드 접근을 허용하기 위해 check_same_thread 옵션 비활성화
-# - 다른 DB는 별도 옵션 없이 기본 설정 사용
-engine = create_engine(
-    database_url,
-    connect_args={"check_same_thread": False} if database_url.startswith("sqlite") else {},
-)
+# SQLite 연결마다 실행할 PRAGMA
+# - journal_mode=WAL: 읽기와 쓰기가 서로를 막지 않음 (쓰기는 여전히 한 번에 하나)
+# - synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않아도 DB가 깨지지 않음
+# - cache_size: 음수는 KiB 단위 페이지 캐시 크기
+# - busy_timeout: 다른 연결이 쓰는 중이면 바로 실패하지 않고 기다리는 시간(ms)
+def _sqlite_pragmas(settings: Settings):
+    pragmas = [
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA cache_size=-{int(settings.sqlite_cache_size_kib)}",
+        f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA foreign_keys=ON",
+    ]
+    if settings.sqlite_wal_enabled:
+        pragmas.insert(0, "PRAGMA journal_mode=WAL")
+
+    def apply(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return apply
+
+# 비동기 SQLAlchemy 엔진 생성
+engine = create_engine_from_settings(settings)
 
 # 세션 팩토리(SessionLocal) 생성
-# - autocommit=False  → 트랜잭션은 수동으로 commit해야 함
-# - autoflush=False   → flush 자동 실행 방지
-# - bind=engine       → 위에서 생성한 엔진에 연결된 세션 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# - autoflush=False         → flush 자동 실행 방지
+# - expire_on_commit=False  → commit 후에도 객체 속성을 다시 조회하지 않고 사용 (비동기 세션에서는 지연 로딩 불가)
+# - bind=engine             → 위에서 생성한 엔진에 연결된 세션 생성
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 # ORM 모델들이 상속할 기본 Base 클래스
 Base = declarative_base()
+
+# 앱 시작 시(lifespan) 테이블과 없는 인덱스를 생성
+async def init_db() -> None:
+    # 모델을 임포트해야 Base.metadata에 테이블이 등록됨
+    from app.db.models import create_missing_indexes
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.run_sync(create_missing_indexes)
@@ -1,5 +1,5 @@
-# SQLAlchemy에서 컬럼을 정의할 때 사용하는 타입/클래스들 임포트
-from sqlalchemy import Column, Date, Integer, String
+# SQLAlchemy에서 컬럼/인덱스를 정의할 때 사용하는 타입/클래스들 임포트
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, String
 
 # ORM 모델들이 공통으로 상속받는 기반 클래스 임포트
 from app.db.database import Base
@@ -8,10 +8,39 @@ from app.db.database import Base
 class SavedFlight(Base):
     __tablename__ = "saved_flights"
 
+    # 목록 조회(keyset 페이지네이션)의 정렬 기준마다 (정렬 컬럼, id) 복합 인덱스를 둔다
+    # 출발지/도착지 필터 + 출발일 정렬은 (origin, destination, departure_date, id) 인덱스 범위 스캔으로 처리
+    __table_args__ = (
+        Index("ix_saved_flights_departure_date_id", "departure_date", "id"),
+        Index("ix_saved_flights_price_id", "price", "id"),
+        Index("ix_saved_flights_route_departure_date_id", "origin", "destination", "departure_date", "id"),
+    )
+
     id = Column(Integer, primary_key=True, index=True) # 기본 키 컬럼
     origin = Column(String, nullable=False) # 출발지
     destination = Column(String, nullable=False) # 도착지
     departure_date = Column(Date, nullable=False) # 출발일
     return_date = Column(Date, nullable=True) # 돌아오는 날짜
     airline = Column(String, nullable=True) # 항공사
-    price = Column(Integer, nullable=True) # 가격
\ No newline at end of file
+    price = Column(Integer, nullable=True) # 가격
+
+# SavedFlightPriceChange 모델 정의: 백그라운드 가격 갱신으로 바뀐 가격 기록 (saved_price_changes 테이블)
+# 저장된 항공편이 삭제되면 기록도 함께 삭제 (SQLite는 foreign_keys PRAGMA로 적용)
+class SavedFlightPriceChange(Base):
+    __tablename__ = "saved_price_changes"
+
+    # 항공편별 가격 변동 이력을 최신순으로 조회
+    __table_args__ = (Index("ix_saved_price_changes_flight_id_id", "flight_id", "id"),)
+
+    id = Column(Integer, primary_key=True) # 기본 키 컬럼
+    flight_id = Column(Integer, ForeignKey("saved_flights.id", ondelete="CASCADE"), nullable=False) # 저장된 항공편 ID
+    old_price = Column(Integer, nullable=True) # 이전 가격 (없었으면 None)
+    new_price = Column(Integer, nullable=False) # 새 가격
+    delta = Column(Integer, nullable=True) # 새 가격 - 이전 가격 (이전 가격이 없었으면 None)
+    checked_at = Column(DateTime(timezone=True), nullable=False) # 가격을 확인한 시각 (UTC)
+
+# 이미 만들어진 테이블에는 create_all이 새 인덱스를 추가하지 않으므로, 없는 인덱스만 따로 생성
+def create_missing_indexes(bind) -> None:
+    for table in (SavedFlight.__table__, SavedFlightPriceChange.__table__):
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
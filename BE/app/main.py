@@ -1,17 +1,76 @@
+#앱 시작/종료 시점에 자원을 관리하는 lifespan을 만들기 위한 데코레이터
+from contextlib import asynccontextmanager
+
+#lifespan 제너레이터의 타입 힌트
+from typing import AsyncIterator
+
 #FastAPI 프레임워크 임포트
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 
 #API 라우터 및 데이터베이스 설정 임포트
 from app.api import api_router
 
-#DB 베이스 모델 및 엔진 임포트
-from app.db import Base, engine
+#설정 객체, LLMService 생성 함수, MCP 공유 커넥션 풀 생성 함수 임포트
+from app.core.config import get_settings
+from app.core.dependencies import build_llm_service
+from app.core.http_client import create_mcp_client
+
+#Prometheus 형식 지표 레지스트리와 HTTP 지표 미들웨어
+from app.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT, REGISTRY
+from shared.metrics import CONTENT_TYPE, MetricsMiddleware
+
+#요청마다 트레이스를 시작하고 MCP 서버로 traceparent를 전달하는 트레이서
+from app.core.tracing import TRACER
+from shared.tracing import TracingMiddleware
+
+#orjson 기반 기본 응답 클래스 (orjson이 없으면 표준 JSONResponse)
+from shared.wire import FAST_JSON_RESPONSE
 
-#모든 DB 테이블을 엔진에 바인딩하여 생성
-Base.metadata.create_all(bind=engine)
+#DB 엔진과 테이블/인덱스 생성 함수 임포트
+from app.db.database import engine, init_db
+
+#저장된 항공편 가격을 주기적으로 다시 확인하는 백그라운드 작업
+from app.services.price_refresh_service import SavedFlightPriceRefresher
+
+#앱 시작 시 MCP 서버용 공유 커넥션 풀, 검색 결과 캐시, LLMService를 한 번만 만들고, 종료 시 연결을 닫음
+#트레이스 샘플링 비율/내보내기 파일도 여기서 설정하고, 종료 시 남은 스팬을 기록
+#DB 테이블/인덱스는 임포트 시점이 아니라 앱 시작 시 생성하고, 종료 시 커넥션 풀을 닫음
+#SAVED_PRICE_REFRESH_ENABLED이고 MCP 서버가 설정되어 있으면 저장 항공편 가격 갱신 작업을 시작하고, 연결을 닫기 전에 멈춤
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    TRACER.configure(settings)
+    await init_db()
+    try:
+        async with create_mcp_client(settings) as client:
+            app.state.llm_service = build_llm_service(settings, client, with_cache=True)
+            refresher = None
+            if settings.saved_price_refresh_enabled and settings.mcp_server_url:
+                refresher = SavedFlightPriceRefresher.from_settings(settings, app.state.llm_service)
+                refresher.start()
+            try:
+                yield
+            finally:
+                if refresher is not None:
+                    await refresher.stop()
+                app.state.llm_service = None
+    finally:
+        await engine.dispose()
+        TRACER.shutdown()
 
 #FastAPI 애플리케이션 객체 생성
-app = FastAPI(title="Flight Planner API")
+app = FastAPI(title="Flight Planner API", lifespan=lifespan, default_response_class=FAST_JSON_RESPONSE)
 
 #API 라우터를 애플리케이션에 등록하여 엔드포인트를 제공
-app.include_router(api_router)
\ No newline at end of file
+app.include_router(api_router)
+
+#라우트별 요청 처리 시간과 진행 중인 요청 수 기록
+app.add_middleware(MetricsMiddleware, duration=HTTP_REQUEST_DURATION, in_flight=HTTP_REQUESTS_IN_FLIGHT)
+
+#요청마다 루트 스팬 생성, 응답 헤더의 traceparent로 트레이스 ID를 확인할 수 있음
+app.add_middleware(TracingMiddleware, tracer=TRACER)
+
+#Prometheus 스크레이프용 지표 엔드포인트
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
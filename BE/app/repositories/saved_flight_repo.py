@@ -1,60 +1,156 @@
 # /app/repositories/saved_flight_repo.py
 
-# List, Optional 등 타입 힌트 표현을 위한 표준 타입들
-from typing import List, Optional
-# session은 SQLAlchemy에서 DB와 대화하기 위한 핵심 객체
-from sqlalchemy.orm import Session
+# 페이지 커서(정렬 값 + 마지막 id)를 URL에 안전한 문자열로 인코딩하기 위한 모듈
+import base64
+import json
+# 커서에 담긴 출발일 문자열을 date로 되돌리기 위한 모듈
+from datetime import date
+# Any, Optional 등 타입 힌트 표현을 위한 표준 타입들
+from typing import Any, List, Optional, Tuple
+# 조회 쿼리 생성(select)과 여러 조건을 OR / AND로 묶기 위한 SQLAlchemy 함수
+from sqlalchemy import and_, or_, select
+# AsyncSession은 SQLAlchemy에서 DB와 비동기로 대화하기 위한 핵심 객체
+from sqlalchemy.ext.asyncio import AsyncSession
 # DB 테이블과 연결된 ORM 모델들이 들어있는 models.py를 import
 from app.db import models
 # FlightCreate: 클라이언트가 보내는 JSON을 검증하는 "요청용" 스키마
 # Flight: DB ORM 객체를 검증된 API 응답 형태로 변환하는 "응답용" 스키마
 # API 레이어와 DB 레이어를 깔끔히 분리
-from app.schemas.flight_schema import Flight, FlightCreate
+# SavedFlightQuery / SavedFlightPage: 목록 조회 조건과 한 페이지 응답 스키마
+# SavedFlightPriceChangeOut: 백그라운드 가격 갱신으로 기록된 가격 변동 응답 스키마
+from app.schemas.flight_schema import (
+    Flight,
+    FlightCreate,
+    SavedFlightPage,
+    SavedFlightPriceChangeOut,
+    SavedFlightQuery,
+)
+
+# 한 페이지에 담을 수 있는 최대 항목 수
+MAX_PAGE_SIZE = 200
 
 # 저장된 항공편을 조회/생성/삭제하는 기능을 한곳에 모아둔 Repository 패턴 클래스
 # 라우터에서는 직접 DB 쿼리를 하지 않고, Repository에게 맡기는 구조를 만든다
 class SavedFlightRepository:
     # Repository 객체를 만들 때 DB 세션을 넣어줌
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
     
-    # 저장된 항공편들의 리스트를 반환
-    def list_flights(self) -> List[Flight]:
-        # SavedFlight 테이블 전체(모든 항공편 레코드)를 리스트로 가져온다
-        flights = self.session.query(models.SavedFlight).all()
+    # 저장된 항공편 목록의 한 페이지를 반환 (keyset 페이지네이션)
+    # OFFSET 대신 "마지막으로 본 (정렬 값, id) 다음부터" 조건을 사용하므로, 몇 번째 페이지든
+    # (정렬 컬럼, id) 복합 인덱스 범위 스캔으로 limit + 1건만 읽는다
+    # 가격순 정렬에서는 가격이 없는 항공편은 제외된다
+    # 잘못된 커서(또는 다른 정렬 기준으로 만든 커서)는 ValueError
+    async def list_flights(self, query: Optional[SavedFlightQuery] = None) -> SavedFlightPage:
+        query = query or SavedFlightQuery()
+        limit = max(1, min(query.limit, MAX_PAGE_SIZE))
+        model = models.SavedFlight
+        column = getattr(model, query.sort)
+        descending = query.order == "desc"
+
+        # 필터 조건 (출발지/도착지 일치, 출발일/가격 범위)
+        statement = select(model)
+        if query.origin:
+            statement = statement.where(model.origin == query.origin)
+        if query.destination:
+            statement = statement.where(model.destination == query.destination)
+        if query.departure_from is not None:
+            statement = statement.where(model.departure_date >= query.departure_from)
+        if query.departure_to is not None:
+            statement = statement.where(model.departure_date <= query.departure_to)
+        if query.min_price is not None:
+            statement = statement.where(model.price >= query.min_price)
+        if query.max_price is not None:
+            statement = statement.where(model.price <= query.max_price)
+        if query.sort == "price":
+            statement = statement.where(model.price.isnot(None))
+
+        # 커서가 있으면 마지막으로 본 (정렬 값, id) 다음 행부터
+        if query.cursor:
+            value, last_id = _decode_cursor(query.cursor, query.sort)
+            if query.sort == "id":
+                statement = statement.where(model.id < last_id if descending else model.id > last_id)
+            elif descending:
+                statement = statement.where(or_(column < value, and_(column == value, model.id < last_id)))
+            else:
+                statement = statement.where(or_(column > value, and_(column == value, model.id > last_id)))
+
+        # 같은 정렬 값 안에서는 id로 순서를 고정 (커서가 항목을 건너뛰거나 중복하지 않도록)
+        if query.sort == "id":
+            order_by = [model.id.desc() if descending else model.id.asc()]
+        else:
+            order_by = [column.desc(), model.id.desc()] if descending else [column.asc(), model.id.asc()]
+
+        # 다음 페이지가 있는지 확인하기 위해 1건 더 읽음
+        rows = (await self.session.scalars(statement.order_by(*order_by).limit(limit + 1))).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = _encode_cursor(query.sort, getattr(last, query.sort), last.id)
         # ORM 객체를 Pydantic 객체로 변환
-        return [Flight.model_validate(flight) for flight in flights]
+        return SavedFlightPage(items=[Flight.from_orm(flight) for flight in rows], next_cursor=next_cursor)
 
     # 새로운 항공편을 저장하고 저장된 항공편 정보를 반환
-    def create_flight(self, payload: FlightCreate) -> Flight:
+    async def create_flight(self, payload: FlightCreate) -> Flight:
         # 클라이언트가 보낸 값을 그대로 DB 저장형 객체로 만듦
-        flight = models.SavedFlight(**payload.model_dump())
+        flight = models.SavedFlight(**payload.dict())
         # 방금 만든 ORM 객체를 DB에 저장 대기 상태로 올려놓는다
         self.session.add(flight)
         # 올려놓은 객체를 실제 DB에 반영
-        self.session.commit()
+        await self.session.commit()
         # DB가 자동 생성한 ID를 flight 객체에 반영
-        self.session.refresh(flight)
+        await self.session.refresh(flight)
         # DB에 저장된 항공편 정보를 API 응답용 형태로 돌려줌
-        return Flight.model_validate(flight)
+        return Flight.from_orm(flight)
 
     # 주어진 ID의 항공편을 삭제하고 성공 여부를 반환
-    def delete_flight(self, flight_id: int) -> bool:
+    async def delete_flight(self, flight_id: int) -> bool:
         # flight 변수는 해당 ID의 항공편이 있으면 객체, 없으면 None
-        flight: Optional[models.SavedFlight] = (
-            # SavedFlight 테이블을 조회하는 쿼리 시작
-            self.session.query(models.SavedFlight)
-            # ID로 항공편을 찾음
-            .filter(models.SavedFlight.id == flight_id)
-            # 조건에 맞는 첫번째 데이터 1개를 가져온다
-            .first()
-        )
+        # 기본 키로 항공편을 찾음
+        flight: Optional[models.SavedFlight] = await self.session.get(models.SavedFlight, flight_id)
         # 삭제할 데이터가 없으면 False
         if not flight:
             return False
         # DB 세션에서 해당 항공편 삭제 대기 상태로 올려놓음
-        self.session.delete(flight)
+        await self.session.delete(flight)
         # 삭제 확정
-        self.session.commit()
+        await self.session.commit()
         # 삭제 성공하면 True
         return True
+
+    # 주어진 ID의 항공편 가격 변동 기록을 최신순으로 반환, 항공편이 없으면 None
+    # (flight_id, id) 인덱스로 항공편 하나의 기록만 읽는다
+    async def list_price_changes(self, flight_id: int, limit: int = 50) -> Optional[List[SavedFlightPriceChangeOut]]:
+        if await self.session.get(models.SavedFlight, flight_id) is None:
+            return None
+        model = models.SavedFlightPriceChange
+        statement = (
+            select(model)
+            .where(model.flight_id == flight_id)
+            .order_by(model.id.desc())
+            .limit(max(1, min(limit, MAX_PAGE_SIZE)))
+        )
+        rows = (await self.session.scalars(statement)).all()
+        return [SavedFlightPriceChangeOut.from_orm(change) for change in rows]
+
+# 커서 = base64url(JSON [정렬 기준, 마지막 정렬 값, 마지막 id])
+def _encode_cursor(sort: str, value: Any, last_id: int) -> str:
+    if isinstance(value, date):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, last_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def _decode_cursor(cursor: str, sort: str) -> Tuple[Any, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, value, last_id = json.loads(raw)
+        if cursor_sort != sort or not isinstance(last_id, int):
+            raise ValueError("cursor does not match the requested sort")
+        if sort == "departure_date":
+            value = date.fromisoformat(value)
+        elif sort == "price" and not isinstance(value, int):
+            raise ValueError("invalid price cursor")
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor: {exc}") from exc
+    return value, last_id
@@ -1,6 +1,9 @@
 
-# 날짜 타입 사용을 위해 datetime 모듈에서 date를 임포트
-from datetime import date
+# 날짜/시각 타입 사용을 위해 datetime 모듈에서 date, datetime을 임포트
+from datetime import date, datetime
+
+# 페이지 응답의 항목 리스트 타입 힌트
+from typing import List, Literal
 
 # Pydantic 스키마의 기반 클래스 임포트
 from pydantic import BaseModel
@@ -25,4 +28,34 @@ class Flight(FlightBase):
 
 # Pydantic 모델이 ORM 모델과 호환되도록 설정
     class Config: 
-        from_attributes = True # ORM 모델 객체를 Pydantic 모델로 변환하는 기능 활성화
+        orm_mode = True # ORM 모델 객체를 Pydantic 모델로 변환하는 기능 활성화 (from_orm)
+
+# 저장된 항공권 목록 조회 조건 (필터 + 정렬 + keyset 커서)
+class SavedFlightQuery(BaseModel):
+    limit: int = 50 # 한 페이지의 최대 항목 수
+    cursor: str | None = None # 이전 페이지 응답의 next_cursor (없으면 첫 페이지)
+    sort: Literal["id", "departure_date", "price"] = "id" # 정렬 기준 (id는 저장 순서)
+    order: Literal["asc", "desc"] = "asc" # 정렬 방향
+    origin: str | None = None # 출발지 일치 필터
+    destination: str | None = None # 도착지 일치 필터
+    departure_from: date | None = None # 출발일 하한 (포함)
+    departure_to: date | None = None # 출발일 상한 (포함)
+    min_price: int | None = None # 가격 하한 (포함)
+    max_price: int | None = None # 가격 상한 (포함)
+
+# 저장된 항공권 목록의 한 페이지
+# next_cursor를 다음 요청의 cursor로 넘기면 이어지는 페이지를 받으며, 마지막 페이지면 None
+class SavedFlightPage(BaseModel):
+    items: List[Flight]
+    next_cursor: str | None = None
+
+# 저장된 항공권의 가격 변동 기록 한 건 (백그라운드 가격 갱신 결과)
+class SavedFlightPriceChangeOut(BaseModel):
+    flight_id: int # 저장된 항공권 ID
+    old_price: int | None = None # 이전 가격
+    new_price: int # 새 가격
+    delta: int | None = None # 새 가격 - 이전 가격 (음수면 가격 하락)
+    checked_at: datetime # 가격을 확인한 시각
+
+    class Config:
+        orm_mode = True
@@ -4,8 +4,8 @@ from datetime import date
 # 응답에서 Flight 리스트 타입을 위해 임포트
 from typing import List
 
-# Pydantic의 BaseModel 임포트
-from pydantic import BaseModel
+# Pydantic의 BaseModel, 필드 제약 조건을 위한 Field 임포트
+from pydantic import BaseModel, Field
 
 # 검색 결과에 포함될 Flight 스키마 임포트
 from app.schemas.flight_schema import Flight
@@ -19,6 +19,18 @@ class FlightSearchRequest(BaseModel):
     passengers: int = 1             # 승객 수 (기본값 1)
 
 
+# 월 x 여행 기간 기반 유연한 날짜 검색 요청 스키마
+# 서버가 해당 월 안의 여러 날짜 구간을 만들어 한 번에 검색한다
+class FlexibleSearchRequest(BaseModel):
+    origin: str = "ICN"                        # 출발지 (기본값 인천)
+    destination: str                           # 도착지 공항 코드
+    month: str                                 # 출발 월 (YYYY-MM)
+    duration: int = Field(ge=1, le=31)         # 여행 기간(일)
+    passengers: int = 1                        # 승객 수 (기본값 1)
+    windows: int = Field(default=5, ge=1, le=31)  # 월 안에서 검색할 날짜 구간 수
+    limit: int = Field(default=10, ge=1, le=100)  # 가격순 상위 N개만 반환
+
+
 # 항공권 검색 응답 데이터를 정의하는 스키마
 class FlightSearchResponse(BaseModel):
     results: List[Flight]           # 검색된 결과 리스트
@@ -0,0 +1,87 @@
+#타입 어노테이션 평가 방식을 변화시키는 모듈
+from __future__ import annotations
+
+#월의 일 수를 계산하기 위한 표준 모듈
+import calendar
+
+#날짜 데이터 처리를 위한 표준 모듈
+from datetime import date
+
+#타입 힌트로 사용되는 모듈
+from typing import Dict, List, Optional, Tuple
+
+#항공권 도메인 모델 Flight 및 검색 요청 스키마
+from app.schemas.flight_schema import Flight
+from app.schemas.search_schema import FlexibleSearchRequest, FlightSearchRequest
+
+#MCP 서버와 연동하는 항공권 검색 서비스
+from app.services.llm_service import LLMService
+
+#월(YYYY-MM)과 여행 기간으로 (출발일, 귀국일) 구간 목록을 생성
+#FE의 generateDatesForMonth와 같은 규칙: 월 안에서 출발일을 count개로 고르게 나눔
+def generate_date_windows(month: str, duration: int, count: int = 5) -> List[Tuple[date, date]]:
+    try:
+        year, month_number = (int(part) for part in month.split("-"))
+        days_in_month = calendar.monthrange(year, month_number)[1]
+    except (ValueError, calendar.IllegalMonthError) as exc:
+        raise ValueError(f"Invalid month '{month}', expected YYYY-MM") from exc
+
+    windows: List[Tuple[date, date]] = []
+    max_start_day = days_in_month - duration
+    if max_start_day < 1:
+        return windows
+
+    for index in range(count):
+        start_day = (index * max_start_day) // count + 1
+        return_day = min(start_day + duration - 1, days_in_month)
+        window = (date(year, month_number, start_day), date(year, month_number, return_day))
+        #한 달이 짧아 같은 구간이 반복되면 한 번만 검색
+        if window not in windows:
+            windows.append(window)
+    return windows
+
+#월 x 여행 기간 검색을 서버에서 처리하는 서비스 클래스
+#날짜 구간별 검색을 JSON-RPC 배치 1회로 MCP 서버에 보내고, 중복 제거 후 가격순 상위 N개를 반환
+#(배치 안의 호출은 MCP 서버가 RPC_BATCH_MAX_CONCURRENCY 한도 안에서 동시에 실행)
+class FlexibleSearchService:
+
+    #초기화 메서드 / 항공권 검색 서비스 설정
+    def __init__(self, llm_service: LLMService) -> None:
+        self.llm_service = llm_service
+
+    #유연한 날짜 검색 요청을 처리하는 메서드
+    async def search(self, request: FlexibleSearchRequest) -> List[Flight]:
+        #날짜 구간별 단건 검색 요청 생성
+        window_requests = [
+            FlightSearchRequest(
+                origin=request.origin,
+                destination=request.destination,
+                departure_date=departure_date,
+                return_date=return_date,
+                passengers=request.passengers,
+            )
+            for departure_date, return_date in generate_date_windows(
+                request.month, request.duration, request.windows
+            )
+        ]
+
+        #모든 날짜 구간을 BE <-> MCP 간 HTTP 교환 1회로 검색
+        results = await self.llm_service.fetch_flights_batch(window_requests)
+        return self._rank(results, request.limit)
+
+    #구간별 결과를 합쳐 중복을 제거하고 가격순 상위 limit개를 반환 (가격 없는 항목은 뒤로)
+    @staticmethod
+    def _rank(results: List[List[Flight]], limit: int) -> List[Flight]:
+        unique: Dict[Tuple[Optional[str], date, Optional[date], Optional[int]], Flight] = {}
+        for flights in results:
+            for flight in flights:
+                key = (flight.airline, flight.departure_date, flight.return_date, flight.price)
+                unique.setdefault(key, flight)
+
+        ranked = sorted(
+            unique.values(),
+            key=lambda flight: (flight.price is None, flight.price or 0),
+        )[:limit]
+
+        #응답 안에서 id가 겹치지 않도록 순위 기준으로 다시 부여
+        return [flight.copy(update={"id": rank}) for rank, flight in enumerate(ranked, start=1)]
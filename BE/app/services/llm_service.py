@@ -4,50 +4,85 @@ from __future__ import annotations
 #로그 기록에 필요한 표준 로깅 모듈
 import logging
 
+#공유 클라이언트 또는 1회용 클라이언트를 같은 방식으로 쓰기 위한 컨텍스트 매니저 데코레이터
+from contextlib import asynccontextmanager
+
+#날짜 문자열 파싱 결과를 캐시하기 위한 데코레이터
+from functools import lru_cache
+
 #날짜 데이터 처리를 위한 표준 모듈
 from datetime import date
 
 #타입 힌트로 사용되는 모듈
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+#MCP 왕복 시간 측정을 위한 모듈
+import time
 
 #HTTP 요청을 보내기 위한 외부 라이브러리
 import httpx
 
+#MCP 왕복 시간, 대체 항공권, 캐시 적중 지표
+from app.core.metrics import (
+    FALLBACK_FLIGHTS,
+    MCP_REQUESTS_IN_FLIGHT,
+    MCP_ROUNDTRIP_DURATION,
+    SEARCH_CACHE_LOOKUPS,
+)
+
+#MCP 호출 구간 스팬 기록과 traceparent 헤더 전달
+from app.core.tracing import TRACER
+from shared.tracing import Span, trace_headers
+
+#MCP 요청/응답 본문 직렬화(orjson)와 형식(JSON/msgpack)/압축(zstd/gzip) 협상
+from shared.wire import (
+    MEDIA_JSON,
+    accept_encoding_header,
+    accept_header,
+    decode_body,
+    dumps_json,
+    loads_json,
+)
+
+#가격 값 -> (금액, 통화) 파싱 (MCP 서버와 함께 사용하는 공용 모듈)
+from shared.prices import parse_amount
+
 #항공권 도메인 모델 Flight
 from app.schemas.flight_schema import Flight
 from app.schemas.search_schema import FlightSearchRequest
 
+#MCP 검색 결과를 보관하는 프로세스 내 캐시
+from app.services.search_cache import SearchResultCache
+
 #항공권 검색 기능을 MCP 버서와 연동하는 주요 서비스 클래스
 class LLMService:
 
     #초기화 메서드 / API 키, RPC URL, 타임아웃 시간 초기화
+    #client: 앱 lifespan 동안 유지되는 공유 AsyncClient (커넥션 풀), 없으면 호출마다 1회용 클라이언트 사용
+    #cache: MCP 검색 결과 캐시, 없으면 매번 MCP 서버를 호출
+    #negotiate_wire: MCP 응답을 msgpack / 압축(zstd, gzip)으로 받을 수 있다고 알릴지 여부 (False면 압축 없는 JSON)
     def __init__(
         self,
         api_key: str | None = None,
         rpc_url: str | None = None,
         timeout_seconds: int = 10,
+        client: httpx.AsyncClient | None = None,
+        cache: SearchResultCache | None = None,
+        negotiate_wire: bool = True,
     ) -> None:
         self.api_key = api_key
         self.rpc_url = rpc_url
         self.timeout_seconds = timeout_seconds
+        self.client = client
+        self.cache = cache
+        self.negotiate_wire = negotiate_wire
         self.logger = logging.getLogger(__name__)
 
     #항공권 검색 요청 처리 메서드
     #MCP와 통신하여 항공권 정보를 가져오거나, 실패 시 기본 항공권 정보를 반환
-    def search_flights(self, request: FlightSearchRequest) -> List[Flight]:
-        #결과 항공권 리스트 초기화
-        flights: List[Flight] = []
-
-        #MCP URL이 설정된 경우 MCP로부터 항공권 정보 요청
-        if self.rpc_url:
-            try:
-                flights = self._fetch_from_mcp(request)
-           #호출 실패 시 경고 로그 기록
-           #혹시 모를 예외 상황에 대비한 방어적 코드
-            except Exception as exc:  # pragma: no cover - defensive
-                self.logger.warning(
-                    "Falling back to local flight suggestion due to MCP error: %s", exc
-                )
+    async def search_flights(self, request: FlightSearchRequest) -> List[Flight]:
+        #MCP로부터 항공권 정보 요청
+        flights = await self.fetch_flights(request)
 
         #MCP 호출 실패 또는 결과가 없을 경우 기본 항공권 정보 생성
         if not flights:
@@ -56,8 +91,30 @@ class LLMService:
         #최종 항공권 리스트 반환
         return flights
 
+    #MCP 서버의 검색 결과만 반환 (대체 항공권 없음)
+    #캐시에 같은 검색 결과가 있으면 네트워크 호출 없이 반환
+    #MCP URL이 없거나 호출에 실패하면 빈 리스트 반환 (대체 항공권은 캐시되지 않음)
+    async def fetch_flights(self, request: FlightSearchRequest) -> List[Flight]:
+        if not self.rpc_url:
+            return []
+        cached = self._cache_get(request)
+        if cached is not None:
+            return cached
+        try:
+            flights = await self._fetch_from_mcp(request)
+            if self.cache is not None:
+                self.cache.set(request, flights)
+            return flights
+        #호출 실패 시 경고 로그 기록
+        #혹시 모를 예외 상황에 대비한 방어적 코드
+        except Exception as exc:  # pragma: no cover - defensive
+            self.logger.warning(
+                "Falling back to local flight suggestion due to MCP error: %s", exc
+            )
+            return []
+
     #MCP 서버에 JSON-RPC 요청을 보내 항공권 정보를 받아 Flight 객체 리스트로 변환 및 반환
-    def _fetch_from_mcp(self, request: FlightSearchRequest) -> List[Flight]:
+    async def _fetch_from_mcp(self, request: FlightSearchRequest) -> List[Flight]:
         #JSON-RPC 요청 메시지 구성
         payload = {
             "jsonrpc": "2.0",
@@ -66,23 +123,10 @@ class LLMService:
             "id": "flight-search",
         }
 
-        #Content-Type 헤더 지정 
-        #API 키가 있으면 Authorization 헤더 추가
-        headers: Dict[str, str] = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-
         #MCP 서버에 POST 요청 전송
-        response = httpx.post(
-            self.rpc_url,
-            json=payload,
-            headers=headers,
-            timeout=self.timeout_seconds,
-        )
-        response.raise_for_status()
+        data = await self._post_rpc(payload)
 
         #응답 중 에러 정보 확인 및 예외 처리
-        data = response.json()
         error = data.get("error")
         if error:
             message = error.get("message", "Unknown MCP error")
@@ -90,7 +134,237 @@ class LLMService:
 
         #결과 데이터에서 항공권 정보 추출 및 매핑
         flights_data = data.get("result", {}).get("flights", [])
-        return self._map_flights(request, flights_data)
+        with TRACER.span("llm_service.map_flights", {"flights": len(flights_data)}):
+            return self._map_flights(request, flights_data)
+
+    #여러 검색 요청을 JSON-RPC 배치 1회로 MCP 서버에 보내고, 요청 순서대로 결과 리스트를 반환
+    #MCP 결과가 없는 요청에는 기본 항공권 정보를 채워 넣음
+    async def search_flights_batch(self, requests: List[FlightSearchRequest]) -> List[List[Flight]]:
+        results = await self.fetch_flights_batch(requests)
+        return [
+            flights or [self._build_fallback_flight(request)]
+            for request, flights in zip(requests, results)
+        ]
+
+    #여러 검색 요청의 MCP 결과만 반환 (대체 항공권 없음)
+    #MCP URL이 없거나 배치 호출 자체가 실패하면 모든 요청에 빈 리스트 반환
+    #캐시에 있는 요청은 제외하고 나머지만 배치로 보냄
+    async def fetch_flights_batch(self, requests: List[FlightSearchRequest]) -> List[List[Flight]]:
+        if not self.rpc_url or not requests:
+            return [[] for _ in requests]
+
+        results: List[Optional[List[Flight]]] = [
+            self._cache_get(request) for request in requests
+        ]
+        missing = [index for index, flights in enumerate(results) if flights is None]
+        if missing:
+            try:
+                fetched = await self._fetch_batch_from_mcp([requests[index] for index in missing])
+            except Exception as exc:  # pragma: no cover - defensive
+                self.logger.warning("MCP batch search failed: %s", exc)
+                fetched = [[] for _ in missing]
+            for index, flights in zip(missing, fetched):
+                results[index] = flights
+                if self.cache is not None:
+                    self.cache.set(requests[index], flights)
+        return [flights or [] for flights in results]
+
+    #캐시 조회 + 적중/미스 지표 기록 (캐시가 없으면 None)
+    def _cache_get(self, request: FlightSearchRequest) -> Optional[List[Flight]]:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(request)
+        SEARCH_CACHE_LOOKUPS.inc("hit" if cached is not None else "miss")
+        return cached
+
+    #캐시된 검색 결과를 무효화 (request가 없으면 전체)
+    def invalidate_cache(self, request: FlightSearchRequest | None = None) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(request)
+
+    #JSON-RPC 배치 요청을 보내고 응답 배열을 id로 요청과 짝지어 Flight 리스트로 변환
+    async def _fetch_batch_from_mcp(self, requests: List[FlightSearchRequest]) -> List[List[Flight]]:
+        #요청마다 고유 id를 붙인 JSON-RPC 배치 메시지 구성
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "method": "searchFlights",
+                "params": self._build_params(request),
+                "id": f"flight-search-{index}",
+            }
+            for index, request in enumerate(requests)
+        ]
+        data = await self._post_rpc(payload)
+
+        #배치 전체가 단건 오류로 돌아온 경우 (예: Invalid Request)
+        if isinstance(data, dict):
+            message = (data.get("error") or {}).get("message", "Unknown MCP error")
+            raise RuntimeError(message)
+
+        #응답 순서는 보장되지 않으므로 id 기준으로 매칭
+        responses = {item.get("id"): item for item in data if isinstance(item, dict)}
+        results: List[List[Flight]] = []
+        for index, request in enumerate(requests):
+            item = responses.get(f"flight-search-{index}") or {}
+            if item.get("error") or not item.get("result"):
+                self.logger.warning(
+                    "MCP batch entry %s failed: %s", index, (item.get("error") or {}).get("message")
+                )
+                results.append([])
+                continue
+            results.append(self._map_flights(request, item["result"].get("flights", [])))
+        return results
+
+    #MCP 서버에 JSON-RPC 메시지(단건 또는 배치)를 POST하고 파싱된 JSON을 반환
+    #왕복 시간은 kind(single/batch)와 결과(ok/error)별로 기록
+    #호출 구간을 mcp.rpc 스팬으로 기록하고 traceparent 헤더로 MCP 서버에 트레이스를 이어 줌
+    #요청은 orjson으로 직렬화하고, 응답은 Content-Type(JSON/msgpack)에 맞게 파싱 (압축은 httpx가 해제)
+    async def _post_rpc(self, payload: Any) -> Any:
+        kind = "batch" if isinstance(payload, list) else "single"
+        outcome = "error"
+        started = time.perf_counter()
+        MCP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            with TRACER.span("mcp.rpc", {"kind": kind}):
+                async with self._client_scope() as client:
+                    response = await client.post(
+                        self.rpc_url,
+                        content=dumps_json(payload),
+                        headers=self._headers(),
+                        timeout=self.timeout_seconds,
+                    )
+                response.raise_for_status()
+                data = decode_body(response.content, response.headers.get("content-type"))
+            outcome = "ok"
+            return data
+        finally:
+            MCP_REQUESTS_IN_FLIGHT.dec()
+            MCP_ROUNDTRIP_DURATION.observe(time.perf_counter() - started, kind, outcome)
+
+    #MCP 스트리밍 검색 결과를 공급자 응답 단위로 Flight 객체로 변환해서 내보내는 제너레이터
+    #이벤트: {"event": "flights", "provider", "status", "results", "updated"} 여러 개 + 마지막 {"event": "summary"}
+    #results는 처음 받은 여정, updated는 앞서 보낸 여정 중 더 싼 판매처가 온 여정 (같은 id로 교체)
+    #MCP 결과가 하나도 없으면 기본 항공권 정보를 내보냄 (완료된 스트림의 MCP 결과만 캐시)
+    async def stream_flights(self, request: FlightSearchRequest) -> AsyncIterator[Dict[str, Any]]:
+        cached = self._cache_get(request) if self.rpc_url else None
+        if cached is not None:
+            yield {"event": "flights", "provider": "cache", "status": None, "results": cached, "updated": []}
+            yield self._summary_event(cached, [])
+            return
+
+        collected: List[Flight] = []
+        summary: Optional[Dict[str, Any]] = None
+        if self.rpc_url:
+            try:
+                async for event in self._stream_from_mcp(request):
+                    if event.get("event") == "provider":
+                        status = event.get("provider") or {}
+                        flights = self._map_flights(
+                            request, event.get("flights", []), start_id=len(collected) + 1
+                        )
+                        collected.extend(flights)
+                        #이미 보낸 항공편의 가격이 바뀐 경우 같은 id로 다시 보내고, 캐시할 결과도 교체
+                        updated: List[Flight] = []
+                        for change in event.get("updated", []):
+                            position = change.get("index")
+                            if type(position) is int and 0 <= position < len(collected):
+                                flight = self._map_flights(request, [change.get("flight") or {}], start_id=position + 1)[0]
+                                collected[position] = flight
+                                updated.append(flight)
+                        yield {
+                            "event": "flights",
+                            "provider": status.get("provider"),
+                            "status": status,
+                            "results": flights,
+                            "updated": updated,
+                        }
+                    elif event.get("event") == "summary":
+                        summary = event
+            except Exception as exc:  # pragma: no cover - defensive
+                self.logger.warning("MCP stream failed: %s", exc)
+
+        if not collected:
+            collected = [self._build_fallback_flight(request)]
+            yield {"event": "flights", "provider": "fallback", "status": None, "results": collected, "updated": []}
+        elif summary is not None and self.cache is not None:
+            self.cache.set(request, collected)
+
+        yield self._summary_event(collected, summary.get("providers", []) if summary else [])
+
+    #MCP 서버의 스트리밍 엔드포인트(rpc_url + /stream)를 호출해 NDJSON 이벤트를 하나씩 반환
+    async def _stream_from_mcp(self, request: FlightSearchRequest) -> AsyncIterator[Dict[str, Any]]:
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "searchFlights",
+            "params": self._build_params(request),
+            "id": "flight-search-stream",
+        }
+        url = f"{self.rpc_url.rstrip('/')}/stream"
+        #스트림 전체(마지막 줄까지)의 왕복 시간을 기록
+        #제너레이터가 yield로 멈춰 있는 동안 호출자의 활성 스팬이 바뀌지 않도록 스팬은 활성화하지 않음
+        outcome = "error"
+        started = time.perf_counter()
+        span = TRACER.start("mcp.stream", {"kind": "stream"})
+        error: BaseException | None = None
+        MCP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            async with self._client_scope() as client:
+                async with client.stream(
+                    "POST", url, content=dumps_json(payload), headers=self._headers(span), timeout=self.timeout_seconds
+                ) as response:
+                    response.raise_for_status()
+                    #스트림 대신 JSON-RPC 오류 응답(JSON 또는 msgpack)이 온 경우
+                    content_type = response.headers.get("content-type", "")
+                    if not content_type.startswith("application/x-ndjson"):
+                        error = decode_body(await response.aread(), content_type).get("error") or {}
+                        raise RuntimeError(error.get("message", "Unknown MCP error"))
+                    async for line in response.aiter_lines():
+                        if line.strip():
+                            yield loads_json(line)
+            outcome = "ok"
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            MCP_REQUESTS_IN_FLIGHT.dec()
+            MCP_ROUNDTRIP_DURATION.observe(time.perf_counter() - started, "stream", outcome)
+            TRACER.finish(span, error)
+
+    #스트림 마지막에 보내는 요약 이벤트 (전체 개수, 최저가 항공편, 공급자별 상태)
+    @staticmethod
+    def _summary_event(flights: List[Flight], providers: List[Dict[str, Any]]) -> Dict[str, Any]:
+        priced = [flight for flight in flights if flight.price is not None]
+        return {
+            "event": "summary",
+            "count": len(flights),
+            "cheapest": min(priced, key=lambda flight: flight.price) if priced else None,
+            "providers": providers,
+        }
+
+    #공유 커넥션 풀이 있으면 그대로 사용하고, 없으면 1회용 클라이언트를 열고 닫음
+    @asynccontextmanager
+    async def _client_scope(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self.client is not None:
+            yield self.client
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
+                yield client
+
+    #Content-Type 헤더 지정, 받을 수 있는 응답 형식/압축(Accept, Accept-Encoding) 지정
+    #API 키가 있으면 Authorization 헤더 추가
+    #span: traceparent로 전달할 스팬, 없으면 현재 활성 스팬
+    def _headers(self, span: Span | None = None) -> Dict[str, str]:
+        headers: Dict[str, str] = {"Content-Type": MEDIA_JSON}
+        if self.negotiate_wire:
+            headers["Accept"] = accept_header()
+            headers["Accept-Encoding"] = accept_encoding_header()
+        else:
+            headers["Accept"] = MEDIA_JSON
+            headers["Accept-Encoding"] = "identity"
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        headers.update(trace_headers(span))
+        return headers
 
     #FlightSearchRequest 객체를 JSON-RPC 호출에 필요한 파라미터 딕셔너리로 변환
     def _build_params(self, request: FlightSearchRequest) -> Dict[str, Any]:
@@ -105,44 +379,56 @@ class LLMService:
         #None 값이 아닌 파라미터만 필터링하여 반환
         return {key: value for key, value in params.items() if value is not None}
 
-    #MCP로부터 받은 항공권 데이터를 Flight 객체 리스트로 매핑
+    #MCP로부터 받은 항공권 데이터를 Flight 객체 리스트로 매핑 (id는 start_id부터 부여)
+    #항공편마다 필드를 하나씩 변환하지 않고 열(column) 단위로 한 번에 변환한다
+    #- 날짜: 결과 안의 서로 다른 날짜 문자열은 몇 개뿐이므로 문자열별로 한 번만 파싱 (_iso_date 캐시)
+    #- 가격: 정수(MCP가 정규화한 값)는 그대로 사용하고, 그 외 값만 _parse_price로 변환
+    #- Flight: 모든 값의 타입을 여기서 맞췄으므로 검증 없이 construct로 생성
     def _map_flights(
         self,
         request: FlightSearchRequest,
         flights: Iterable[Dict[str, Any]],
+        start_id: int = 1,
     ) -> List[Flight]:
-        #매핑된 Flight 객체를 담을 리스트 초기화
-        mapped: List[Flight] = []
-
-        #각 항공권 데이터를 순회하며 Flight 객체로 변환
-        for index, flight_data in enumerate(flights, start=1):
-            mapped.append(
-                Flight(
-                    id=index,
-                    origin=self._coalesce(flight_data.get("origin"), request.origin),
-                    destination=self._coalesce(
-                        flight_data.get("destination"), request.destination
-                    ),
-                    departure_date=self._parse_date(
-                        flight_data.get("departure_date"),
-                        request.departure_date,
-                    ),
-                    return_date=self._parse_optional_date(
-                        flight_data.get("return_date"), request.return_date
-                    ),
-                    airline=self._coalesce(
-                        flight_data.get("airline") or flight_data.get("carrier"),
-                        "Unknown Airline",
-                    ),
-                    price=self._parse_price(flight_data.get("price")),
-                )
-            )
+        rows = flights if isinstance(flights, list) else list(flights)
+        if not rows:
+            return []
 
-        #매핑된 Flight 객체 리스트 반환
-        return mapped
+        origins = _text_column([row.get("origin") for row in rows], request.origin)
+        destinations = _text_column([row.get("destination") for row in rows], request.destination)
+        departure_dates = _date_column([row.get("departure_date") for row in rows], request.departure_date)
+        return_dates = _date_column([row.get("return_date") for row in rows], request.return_date)
+        airlines = _text_column([row.get("airline") or row.get("carrier") for row in rows], "Unknown Airline")
+        prices = [
+            price if type(price) is int else self._parse_price(price)
+            for price in (row.get("price") for row in rows)
+        ]
+
+        construct = Flight.construct
+        return [
+            construct(
+                id=flight_id,
+                origin=origin,
+                destination=destination,
+                departure_date=departure_date,
+                return_date=return_date,
+                airline=airline,
+                price=price,
+            )
+            for flight_id, origin, destination, departure_date, return_date, airline, price in zip(
+                range(start_id, start_id + len(rows)),
+                origins,
+                destinations,
+                departure_dates,
+                return_dates,
+                airlines,
+                prices,
+            )
+        ]
 
     #MCP 오류 시 기본 대체용 Flight 객체 생성
     def _build_fallback_flight(self, request: FlightSearchRequest) -> Flight:
+        FALLBACK_FLIGHTS.inc()
         #기본 대체용 Flight 객체 생성 및 반환
         return Flight(
             id=0,
@@ -154,49 +440,37 @@ class LLMService:
             price=0,
         )
 
-    #입력값이 None 또는 빈 문자열일 경우 기본값 반환
-    @staticmethod
-    def _coalesce(value: Optional[Any], default: Any) -> Any:
-        return value if value not in (None, "") else default
-
-    #입력 값이 date 객체인지 확인, 문자열이면 ISO 형식으로 파싱
-    #변환 실패 혹은 유효하지 않은 타입일 경우 기본값 반환
-    @staticmethod
-    def _parse_date(value: Any, default: date) -> date:
-        if isinstance(value, date):
-            return value
-        if isinstance(value, str):
-            try:
-                return date.fromisoformat(value)
-            except ValueError:
-                return default
-        return default
-
-    #입력값이 None일 경우 기본값 반환
-    #날짜 객체 또는 ISO 형식 문자열일 경우 date 객체로 안전하게 변환 및 반환
-    @staticmethod
-    def _parse_optional_date(value: Any, default: Optional[date]) -> Optional[date]:
-        if value is None:
-            return default
-        if isinstance(value, date):
-            return value
-        if isinstance(value, str):
-            try:
-                return date.fromisoformat(value)
-            except ValueError:
-                return default
-        return default
-
     #가격 필드 값이 None일 경우 None 반환
-    #정수, 실수, 문자열 형태의 숫자 값을 안전하게 정수로 변환하여 반환
+    #숫자, {"amount", "currency"} dict, "1,234.50 EUR" 같은 문자열을 MCP 서버와 같은 규칙(parse_amount)으로 해석해 반올림한 정수로 반환
+    #통화 변환은 MCP 서버가 DEFAULT_CURRENCY로 정규화하며 끝내므로 여기서는 금액만 사용
     @staticmethod
     def _parse_price(value: Any) -> Optional[int]:
-        if value is None:
-            return None
-        if isinstance(value, (int, float)):
-            return int(value)
-        if isinstance(value, str):
-            digits = "".join(ch for ch in value if ch.isdigit())
-            if digits:
-                return int(digits)
+        amount, _ = parse_amount(value, None)
+        return int(round(amount)) if amount is not None else None
+
+#ISO 형식 날짜 문자열을 date로 변환, 형식이 잘못되면 None
+#검색 결과의 날짜 종류는 적으므로 문자열별 결과를 캐시해서 같은 문자열은 다시 파싱하지 않음
+@lru_cache(maxsize=4096)
+def _iso_date(value: str) -> Optional[date]:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
         return None
+
+#날짜 열 변환: date는 그대로, 문자열은 ISO 형식으로 파싱, None/잘못된 값은 기본값(요청의 날짜)
+def _date_column(values: List[Any], default: Optional[date]) -> List[Optional[date]]:
+    parsed: List[Optional[date]] = []
+    for value in values:
+        if type(value) is str:
+            value = _iso_date(value)
+        elif not isinstance(value, date):
+            value = None
+        parsed.append(value if value is not None else default)
+    return parsed
+
+#문자열 열 변환: None 또는 빈 문자열은 기본값, 문자열이 아닌 값은 문자열로
+def _text_column(values: List[Any], default: str) -> List[str]:
+    return [
+        default if value is None or value == "" else value if type(value) is str else str(value)
+        for value in values
+    ]
@@ -0,0 +1,216 @@
+#타입 어노테이션 평가 방식을 변화시키는 모듈
+from __future__ import annotations
+
+#배치 동시 실행 수 제한과 주기 실행 태스크를 위한 비동기 모듈
+import asyncio
+
+#로그 기록에 필요한 표준 로깅 모듈
+import logging
+
+#실행 소요 시간 측정을 위한 모듈
+import time
+
+#태스크 취소 시 CancelledError를 무시하기 위한 모듈
+from contextlib import suppress
+
+#출발일 비교와 가격 확인 시각 기록을 위한 표준 모듈
+from datetime import date, datetime, timezone
+
+#타입 힌트로 사용되는 모듈
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+#조회/일괄 수정/일괄 추가 쿼리 생성 함수
+from sqlalchemy import insert, select, update
+
+#설정 클래스
+from app.core.config import Settings
+
+#가격 갱신 한 번을 트레이스로 기록 (MCP 배치 호출 스팬의 부모)
+from app.core.tracing import TRACER
+
+#비동기 세션 팩토리와 ORM 모델
+from app.db.database import SessionLocal
+from app.db.models import SavedFlight, SavedFlightPriceChange
+
+#항공권 도메인 모델 Flight 및 검색 요청 스키마
+from app.schemas.flight_schema import Flight
+from app.schemas.search_schema import FlightSearchRequest
+
+#MCP 서버와 연동하는 항공권 검색 서비스
+from app.services.llm_service import LLMService
+
+#같은 검색으로 가격을 확인할 수 있는 저장 항공편 묶음의 키 (출발지, 도착지, 출발일, 귀국일)
+RouteKey = Tuple[str, str, date, Optional[date]]
+
+#한 번에 IN 조건으로 조회할 최대 id 수
+_ID_CHUNK = 500
+
+#저장된 항공편의 가격을 주기적으로 다시 확인하는 백그라운드 작업
+#같은 (출발지, 도착지, 출발일, 귀국일)을 저장한 항공편은 사용자 수와 관계없이 MCP 검색 1회로 확인하고,
+#검색은 batch_size개씩 JSON-RPC 배치로 묶어 최대 max_concurrency개 배치만 동시에 보낸다
+#바뀐 가격은 트랜잭션 1회로 일괄 수정하고, 변동 내역(이전 가격, 새 가격, 차이)을 saved_price_changes에 기록
+class SavedFlightPriceRefresher:
+
+    def __init__(
+        self,
+        llm_service: LLMService,
+        session_factory: Callable[[], Any] = SessionLocal,
+        batch_size: int = 20,
+        max_concurrency: int = 2,
+        interval_seconds: float = 3600.0,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        self.llm_service = llm_service
+        self.session_factory = session_factory
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.interval_seconds = interval_seconds
+        self.today = today
+        self.logger = logging.getLogger(__name__)
+        self._task: Optional[asyncio.Task] = None
+        #마지막 실행 통계
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    #설정값으로 생성
+    @classmethod
+    def from_settings(cls, settings: Settings, llm_service: LLMService) -> "SavedFlightPriceRefresher":
+        return cls(
+            llm_service,
+            batch_size=settings.saved_price_refresh_batch_size,
+            max_concurrency=settings.saved_price_refresh_max_concurrency,
+            interval_seconds=settings.saved_price_refresh_interval_seconds,
+        )
+
+    #가격 갱신 1회 실행, 출발일이 지나지 않은 저장 항공편만 대상
+    #MCP 결과가 없는 노선(호출 실패 포함)의 항공편은 가격을 바꾸지 않는다
+    async def refresh_once(self) -> Dict[str, Any]:
+        started = time.perf_counter()
+        with TRACER.span("saved_price_refresh.run") as span:
+            groups = await self._load_groups()
+            keys = list(groups)
+            quotes = await self._fetch_quotes(keys)
+
+            checked_at = datetime.now(timezone.utc)
+            updates: List[Dict[str, Any]] = []
+            changes: List[Dict[str, Any]] = []
+            for key, flights in zip(keys, quotes):
+                for flight_id, airline, old_price in groups[key]:
+                    new_price = _best_price(flights, airline)
+                    if new_price is None or new_price == old_price:
+                        continue
+                    updates.append({"id": flight_id, "price": new_price})
+                    changes.append(
+                        {
+                            "flight_id": flight_id,
+                            "old_price": old_price,
+                            "new_price": new_price,
+                            "delta": new_price - old_price if old_price is not None else None,
+                            "checked_at": checked_at,
+                        }
+                    )
+            updated = await self._apply(updates, changes)
+            span.set("routes", len(keys))
+            span.set("updated", updated)
+
+        self.last_run = {
+            "checked_at": checked_at.isoformat(),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            "flights": sum(len(rows) for rows in groups.values()),
+            "routes": len(keys),
+            "routes_priced": sum(1 for flights in quotes if flights),
+            "updated": updated,
+        }
+        self.logger.info("Saved flight price refresh: %s", self.last_run)
+        return self.last_run
+
+    #앱 lifespan에서 호출, interval_seconds마다 refresh_once 실행 (한 번의 실패는 다음 실행에 영향 없음)
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.refresh_once()
+            except Exception as exc:
+                self.logger.error("Saved flight price refresh failed: %s", exc)
+            await asyncio.sleep(self.interval_seconds)
+
+    #출발일이 지나지 않은 저장 항공편을 노선 키별로 묶음: 키 -> [(id, 항공사, 가격)]
+    #ORM 객체 대신 필요한 컬럼만 읽음
+    async def _load_groups(self) -> Dict[RouteKey, List[Tuple[int, Optional[str], Optional[int]]]]:
+        statement = (
+            select(
+                SavedFlight.id,
+                SavedFlight.origin,
+                SavedFlight.destination,
+                SavedFlight.departure_date,
+                SavedFlight.return_date,
+                SavedFlight.airline,
+                SavedFlight.price,
+            )
+            .where(SavedFlight.departure_date >= self.today())
+            .order_by(SavedFlight.origin, SavedFlight.destination, SavedFlight.departure_date)
+        )
+        groups: Dict[RouteKey, List[Tuple[int, Optional[str], Optional[int]]]] = {}
+        async with self.session_factory() as session:
+            for flight_id, origin, destination, departure_date, return_date, airline, price in await session.execute(statement):
+                key = (origin, destination, departure_date, return_date)
+                groups.setdefault(key, []).append((flight_id, airline, price))
+        return groups
+
+    #노선 키마다 MCP 검색 1회, batch_size개씩 JSON-RPC 배치로 묶어 최대 max_concurrency개 동시 실행
+    #결과는 keys 순서와 같은 항공편 리스트 목록
+    async def _fetch_quotes(self, keys: List[RouteKey]) -> List[List[Flight]]:
+        requests = [
+            FlightSearchRequest(origin=origin, destination=destination, departure_date=departure_date, return_date=return_date)
+            for origin, destination, departure_date, return_date in keys
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(chunk: List[FlightSearchRequest]) -> List[List[Flight]]:
+            async with semaphore:
+                return await self.llm_service.fetch_flights_batch(chunk)
+
+        chunks = [requests[index : index + self.batch_size] for index in range(0, len(requests), self.batch_size)]
+        results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return [flights for chunk_results in results for flights in chunk_results]
+
+    #가격 일괄 수정 + 변동 기록 추가를 트랜잭션 1회로 실행, 수정한 항공편 수를 반환
+    #조회 이후 삭제된 항공편은 건너뜀
+    async def _apply(self, updates: List[Dict[str, Any]], changes: List[Dict[str, Any]]) -> int:
+        if not updates:
+            return 0
+        async with self.session_factory() as session:
+            async with session.begin():
+                ids = [row["id"] for row in updates]
+                existing = set()
+                for index in range(0, len(ids), _ID_CHUNK):
+                    chunk = ids[index : index + _ID_CHUNK]
+                    existing.update(await session.scalars(select(SavedFlight.id).where(SavedFlight.id.in_(chunk))))
+                updates = [row for row in updates if row["id"] in existing]
+                changes = [row for row in changes if row["flight_id"] in existing]
+                if updates:
+                    #기본 키 기준 ORM 일괄 UPDATE (executemany)
+                    await session.execute(update(SavedFlight), updates)
+                    await session.execute(insert(SavedFlightPriceChange), changes)
+        return len(updates)
+
+#검색 결과 중 저장 항공편에 해당하는 최저가
+#항공사가 저장되어 있으면 같은 항공사(대소문자 무시)의 최저가, 없으면 전체 최저가, 해당 항공편이 없으면 None
+def _best_price(flights: List[Flight], airline: Optional[str]) -> Optional[int]:
+    wanted = airline.strip().casefold() if airline else None
+    prices = [
+        flight.price
+        for flight in flights
+        if flight.price is not None and (wanted is None or (flight.airline or "").strip().casefold() == wanted)
+    ]
+    return min(prices) if prices else None
@@ -0,0 +1,104 @@
+#타입 어노테이션 평가 방식을 변화시키는 모듈
+from __future__ import annotations
+
+#검색 조건으로 고정 길이 캐시 키를 만들기 위한 해시 모듈
+import hashlib
+
+#검색 조건을 정렬된 JSON 문자열로 직렬화하기 위한 모듈
+import json
+
+#TTL 계산에 사용하는 단조 증가 시계
+import time
+
+#LRU 순서를 유지하기 위한 순서 있는 딕셔너리
+from collections import OrderedDict
+
+#타입 힌트로 사용되는 모듈
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+#항공권 도메인 모델 Flight 및 검색 요청 스키마
+from app.schemas.flight_schema import Flight
+from app.schemas.search_schema import FlightSearchRequest
+
+#FlightSearchRequest를 정규화해서 같은 검색이면 항상 같은 해시를 반환
+def request_key(request: FlightSearchRequest) -> str:
+    canonical = {
+        "origin": request.origin.strip().upper(),
+        "destination": request.destination.strip().upper(),
+        "departure_date": request.departure_date.isoformat(),
+        "return_date": request.return_date.isoformat() if request.return_date else None,
+        "passengers": request.passengers,
+    }
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+#MCP 검색 결과를 프로세스 메모리에 보관하는 TTL + LRU 캐시
+#항목 수와 보관 중인 Flight 총 개수로 메모리 사용량을 제한
+class SearchResultCache:
+
+    #초기화 메서드 / TTL(초), 최대 항목 수, 최대 Flight 수 설정
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 1024,
+        max_flights: int = 50_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_flights = max_flights
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, List[Flight]]]" = OrderedDict()
+        self._flight_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    #검색 조건으로 캐시를 조회, 없거나 만료되었으면 None 반환
+    def get(self, request: FlightSearchRequest) -> Optional[List[Flight]]:
+        key = request_key(request)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self.clock():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return list(entry[1])
+
+    #검색 결과를 저장, 한도를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    #빈 결과나 한도보다 큰 결과는 저장하지 않음
+    def set(self, request: FlightSearchRequest, flights: List[Flight]) -> None:
+        if self.ttl_seconds <= 0 or not flights or len(flights) > self.max_flights:
+            return
+        key = request_key(request)
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (self.clock() + self.ttl_seconds, list(flights))
+        self._flight_count += len(flights)
+        while len(self._entries) > self.max_entries or self._flight_count > self.max_flights:
+            self._remove(next(iter(self._entries)))
+
+    #특정 검색 조건 또는 전체 캐시를 명시적으로 무효화
+    def invalidate(self, request: FlightSearchRequest | None = None) -> None:
+        if request is None:
+            self._entries.clear()
+            self._flight_count = 0
+            return
+        key = request_key(request)
+        if key in self._entries:
+            self._remove(key)
+
+    #캐시 사용량과 히트/미스 통계 반환
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "flights": self._flight_count,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    #항목을 삭제하고 보관 중인 Flight 수를 갱신
+    def _remove(self, key: str) -> None:
+        _, flights = self._entries.pop(key)
+        self._flight_count -= len(flights)
@@ -0,0 +1,9 @@
+# BE 단위 테스트 공통 설정: app 패키지(BE/)와 공유 패키지(shared/, 저장소 루트)를 임포트 경로에 추가
+import sys
+from pathlib import Path
+
+BE_DIR = Path(__file__).resolve().parent
+
+for path in (BE_DIR, BE_DIR.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
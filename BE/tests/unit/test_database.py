@@ -0,0 +1,59 @@
+# BE 내부의 db/database.py의 비동기 드라이버 URL 변환과 엔진 설정(커넥션 풀, SQLite PRAGMA)을 테스트하는 단위 테스트 모듈
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import Settings
+from app.db.database import async_database_url, create_engine_from_settings
+
+
+# 드라이버 없이 적은 URL은 비동기 드라이버로 바꾸고, 드라이버가 지정된 URL과 알 수 없는 DB는 그대로 두는지 검증
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("sqlite:///./app.db", "sqlite+aiosqlite:///./app.db"),
+        ("sqlite://", "sqlite+aiosqlite://"),
+        ("postgresql://user:p%40ss@db:5432/flights", "postgresql+asyncpg://user:p%40ss@db:5432/flights"),
+        ("mysql://user:secret@db/flights", "mysql+aiomysql://user:secret@db/flights"),
+        ("postgresql+psycopg://user@db/flights", "postgresql+psycopg://user@db/flights"),
+        ("oracle://user@db/flights", "oracle://user@db/flights"),
+    ],
+)
+def test_async_database_url(url: str, expected: str) -> None:
+    assert async_database_url(url) == expected
+
+
+# 파일 SQLite는 설정값으로 커넥션 풀을 만들고, 연결마다 WAL 모드와 PRAGMA를 적용하는지 검증
+def test_file_sqlite_engine_uses_pool_settings_and_pragmas(tmp_path) -> None:
+    settings = Settings(
+        database_url=f"sqlite:///{tmp_path / 'app.db'}",
+        db_pool_size=3,
+        db_max_overflow=4,
+        sqlite_synchronous="NORMAL",
+        sqlite_busy_timeout_ms=1234,
+    )
+    engine = create_engine_from_settings(settings)
+
+    async def pragmas():
+        async with engine.connect() as connection:
+            values = [
+                (await connection.execute(text(f"PRAGMA {name}"))).scalar()
+                for name in ("journal_mode", "synchronous", "busy_timeout")
+            ]
+        await engine.dispose()
+        return values
+
+    assert isinstance(engine.pool, AsyncAdaptedQueuePool)
+    assert (engine.pool.size(), engine.pool._max_overflow) == (3, 4)
+    # synchronous=NORMAL은 1
+    assert asyncio.run(pragmas()) == ["wal", 1, 1234]
+
+
+# 메모리 SQLite는 연결마다 별도 DB가 되므로 커넥션 풀 설정을 적용하지 않는지 검증
+def test_memory_sqlite_engine_skips_pool_settings() -> None:
+    engine = create_engine_from_settings(Settings(database_url="sqlite://"))
+
+    assert not isinstance(engine.pool, AsyncAdaptedQueuePool)
+    asyncio.run(engine.dispose())
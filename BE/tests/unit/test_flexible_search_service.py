@@ -0,0 +1,63 @@
+# BE 내부의 services/flexible_search_service.py의 날짜 구간 생성과 배치 검색/중복 제거/순위화를 테스트하는 단위 테스트 모듈
+import asyncio
+from datetime import date
+
+import pytest
+
+from app.schemas.flight_schema import Flight
+from app.schemas.search_schema import FlexibleSearchRequest
+from app.services.flexible_search_service import FlexibleSearchService, generate_date_windows
+
+
+# 월 안에서 출발일을 고르게 나누고, 같은 구간은 한 번만 만들며, 여행 기간이 월보다 길면 빈 목록인지 검증
+def test_generate_date_windows() -> None:
+    windows = generate_date_windows("2026-11", 7, 3)
+
+    assert windows == [
+        (date(2026, 11, 1), date(2026, 11, 7)),
+        (date(2026, 11, 8), date(2026, 11, 14)),
+        (date(2026, 11, 16), date(2026, 11, 22)),
+    ]
+    # 2월(28일) - 26일 = 출발 가능일 2일뿐이므로 구간 5개를 요청해도 2개
+    assert len(generate_date_windows("2026-02", 26, 5)) == 2
+    assert generate_date_windows("2026-02", 28) == []
+
+
+# 형식이 잘못된 월은 ValueError
+@pytest.mark.parametrize("month", ["2026-13", "2026/11", "november"])
+def test_generate_date_windows_rejects_invalid_month(month: str) -> None:
+    with pytest.raises(ValueError, match="Invalid month"):
+        generate_date_windows(month, 5)
+
+
+# 구간별 검색 결과를 돌려주고 받은 배치 요청을 기록하는 가짜 LLMService
+class FakeLLMService:
+    def __init__(self) -> None:
+        self.batches = []
+
+    async def fetch_flights_batch(self, requests):
+        self.batches.append(requests)
+        results = []
+        for index, request in enumerate(requests):
+            flight = dict(origin="ICN", destination=request.destination, departure_date=request.departure_date, return_date=request.return_date)
+            results.append(
+                [
+                    Flight(id=1, airline="KE", price=500000 - index * 10000, **flight),
+                    Flight(id=2, airline="KE", price=500000 - index * 10000, **flight),  # 같은 구간 안의 중복
+                    Flight(id=3, airline="OZ", price=None, **flight),
+                ]
+            )
+        return results
+
+
+# 모든 날짜 구간을 배치 1회로 검색하고, 중복을 제거한 뒤 가격순 상위 limit개에 순위 id를 다시 부여하는지 검증
+def test_search_batches_windows_and_ranks_unique_flights() -> None:
+    llm_service = FakeLLMService()
+    request = FlexibleSearchRequest(destination="NRT", month="2026-11", duration=7, windows=3, limit=4)
+
+    flights = asyncio.run(FlexibleSearchService(llm_service).search(request))
+
+    assert len(llm_service.batches) == 1 and len(llm_service.batches[0]) == 3
+    assert [flight.id for flight in flights] == [1, 2, 3, 4]
+    assert [(flight.airline, flight.price) for flight in flights] == [("KE", 480000), ("KE", 490000), ("KE", 500000), ("OZ", None)]
+    assert flights[0].departure_date == date(2026, 11, 16)
@@ -0,0 +1,92 @@
+# BE 내부의 services/llm_service.py의 비동기 MCP 클라이언트(공유 커넥션 풀, 헤더, 본문 협상, 배치 응답 매칭)를 테스트하는 단위 테스트 모듈
+import asyncio
+import json
+from datetime import date
+
+import httpx
+
+from app.schemas.search_schema import FlightSearchRequest
+from app.services.llm_service import LLMService
+from shared.wire import accept_encoding_header, accept_header, encode_body
+
+REQUESTS = [
+    FlightSearchRequest(origin="ICN", destination=destination, departure_date=date(2026, 11, 2))
+    for destination in ("NRT", "KIX", "CDG")
+]
+
+
+def run(handler, scenario, **options):
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            service = LLMService(rpc_url="http://mcp.test/rpc", client=client, **options)
+            return await scenario(service)
+
+    return asyncio.run(main())
+
+
+# 공유 클라이언트로 요청하고, API 키/형식 협상 헤더를 붙이며, 협상된 msgpack + 압축 응답을 해석하는지 검증
+def test_single_search_negotiates_wire_format_on_shared_client() -> None:
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        call = json.loads(request.content)
+        result = {"flights": [{"airline": "KE", "price": 320000 + index} for index in range(50)]}
+        body, headers = encode_body(
+            {"jsonrpc": "2.0", "id": call["id"], "result": result},
+            request.headers.get("accept"),
+            request.headers.get("accept-encoding"),
+            min_bytes=0,
+        )
+        return httpx.Response(200, content=body, headers=headers)
+
+    flights = run(handler, lambda service: service.search_flights(REQUESTS[0]), api_key="secret")
+
+    request = seen[0]
+    assert request.headers["authorization"] == "Bearer secret"
+    assert "traceparent" in request.headers
+    assert (request.headers["accept"], request.headers["accept-encoding"]) == (accept_header(), accept_encoding_header())
+    assert json.loads(request.content)["params"]["destination"] == "NRT"
+    assert [flight.price for flight in flights[:2]] == [320000, 320001] and len(flights) == 50
+
+
+# negotiate_wire=False면 압축 없는 JSON만 받겠다고 알리는지 검증
+def test_wire_negotiation_can_be_disabled() -> None:
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": "flight-search", "result": {"flights": []}})
+
+    run(handler, lambda service: service.fetch_flights(REQUESTS[0]), negotiate_wire=False)
+
+    assert (seen[0].headers["accept"], seen[0].headers["accept-encoding"]) == ("application/json", "identity")
+
+
+# 배치 응답은 순서와 관계없이 id로 요청과 짝짓고, 실패한 호출에만 대체 항공편을 채우는지 검증
+def test_batch_matches_responses_by_id() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls = json.loads(request.content)
+        answers = {
+            "NRT": {"result": {"flights": [{"airline": "KE", "price": 320000}]}},
+            "KIX": {"error": {"code": -32603, "message": "provider down"}},
+            "CDG": {"result": {"flights": [{"airline": "AF", "price": 910000}]}},
+        }
+        body = [{"jsonrpc": "2.0", "id": call["id"], **answers[call["params"]["destination"]]} for call in reversed(calls)]
+        return httpx.Response(200, json=body)
+
+    results = run(handler, lambda service: service.search_flights_batch(REQUESTS))
+
+    assert [[flight.airline for flight in flights] for flights in results] == [["KE"], ["Demo Airline"], ["AF"]]
+
+
+# 배치 전체가 단건 오류로 돌아오거나 HTTP 오류가 나면 모든 요청에 빈 결과를 돌려주는지 검증
+def test_failed_batch_returns_empty_results() -> None:
+    def invalid(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}})
+
+    def unavailable(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    for handler in (invalid, unavailable):
+        assert run(handler, lambda service: service.fetch_flights_batch(REQUESTS)) == [[], [], []]
@@ -0,0 +1,95 @@
+# BE 내부의 services/llm_service.py가 MCP 검색 결과를 Flight 객체로 매핑하는 과정을 테스트하는 단위 테스트 모듈
+import asyncio
+from datetime import date
+
+from app.schemas.flight_schema import Flight
+from app.schemas.search_schema import FlightSearchRequest, FlightSearchResponse
+from app.services.llm_service import LLMService
+
+REQUEST = FlightSearchRequest(
+    origin="ICN",
+    destination="NRT",
+    departure_date=date(2026, 11, 2),
+    return_date=date(2026, 11, 9),
+)
+
+
+# 필드가 빠지거나 형식이 잘못된 항목은 요청 값과 기본값으로 채우고, id는 start_id부터 차례로 부여하는지 검증
+def test_map_flights_fills_missing_fields_from_request() -> None:
+    rows = [
+        {"origin": "GMP", "destination": "HND", "departure_date": "2026-11-03", "airline": "KE", "price": 320000},
+        {"carrier": "OZ", "departure_date": "not-a-date", "return_date": None, "price": "₩410,000"},
+        {},
+    ]
+
+    flights = LLMService()._map_flights(REQUEST, rows, start_id=7)
+
+    assert [flight.id for flight in flights] == [7, 8, 9]
+    assert all(isinstance(flight, Flight) for flight in flights)
+    assert (flights[0].origin, flights[0].destination, flights[0].departure_date) == ("GMP", "HND", date(2026, 11, 3))
+    assert (flights[1].origin, flights[1].destination, flights[1].departure_date) == ("ICN", "NRT", REQUEST.departure_date)
+    assert flights[1].return_date == REQUEST.return_date
+    assert [flight.airline for flight in flights] == ["KE", "OZ", "Unknown Airline"]
+    assert [flight.price for flight in flights] == [320000, 410000, None]
+
+
+# 검증 없이 만든 Flight도 일반 생성자로 만든 객체와 같은 값으로 직렬화되는지 검증
+def test_mapped_flights_serialize_like_validated_models() -> None:
+    row = {"origin": "ICN", "destination": "NRT", "departure_date": "2026-11-02", "airline": "KE", "price": 320000}
+
+    mapped = LLMService()._map_flights(REQUEST, [row])
+    validated = Flight(id=1, return_date=REQUEST.return_date, **row)
+
+    assert mapped[0].dict() == validated.dict()
+    assert FlightSearchResponse.construct(results=mapped).json() == FlightSearchResponse(results=[validated]).json()
+
+
+# 빈 결과는 빈 리스트로 매핑
+def test_map_flights_of_empty_result_is_empty() -> None:
+    assert LLMService()._map_flights(REQUEST, iter([])) == []
+
+
+# 소수점/천 단위 구분자/통화 표기가 섞인 가격을 MCP 서버와 같은 규칙으로 해석해 반올림하는지 검증
+def test_parse_price_handles_decimals_and_currency() -> None:
+    parse = LLMService._parse_price
+
+    assert parse("1,234.50 EUR") == 1234
+    assert parse("€1.234,50") == 1234
+    assert parse("₩750,000") == 750000
+    assert parse({"amount": "99.9", "currency": "USD"}) == 100
+    assert parse(320000.6) == 320001
+    assert parse("sold out") is None
+    assert parse(None) is None
+
+
+# 스트림의 updated 항목은 이미 보낸 항공편을 같은 id로 교체하고, 요약에도 교체된 가격이 반영되는지 검증
+def test_stream_replaces_updated_flights_in_place() -> None:
+    mcp_events = [
+        {"event": "provider", "provider": {"provider": "skyscanner"}, "flights": [{"airline": "KE", "price": 500000}, {"airline": "OZ", "price": 450000}]},
+        {
+            "event": "provider",
+            "provider": {"provider": "provider_b"},
+            "flights": [{"airline": "JL", "price": 470000}],
+            "updated": [{"index": 0, "flight": {"airline": "KE", "price": 400000}}, {"index": 9, "flight": {}}],
+        },
+        {"event": "summary", "providers": []},
+    ]
+
+    service = LLMService(rpc_url="http://mcp.test/rpc")
+
+    async def stream_from_mcp(request):
+        for event in mcp_events:
+            yield event
+
+    service._stream_from_mcp = stream_from_mcp
+
+    async def collect():
+        return [event async for event in service.stream_flights(REQUEST)]
+
+    first, second, summary = asyncio.run(collect())
+
+    assert [(flight.id, flight.airline) for flight in first["results"]] == [(1, "KE"), (2, "OZ")]
+    assert [(flight.id, flight.airline) for flight in second["results"]] == [(3, "JL")]
+    assert [(flight.id, flight.price) for flight in second["updated"]] == [(1, 400000)]
+    assert summary["count"] == 3
+    assert (summary["cheapest"].id, summary["cheapest"].price) == (1, 400000)
@@ -0,0 +1,93 @@
+# BE 내부의 services/price_refresh_service.py의 노선별 배치 가격 갱신과 변동 기록을 테스트하는 단위 테스트 모듈
+import asyncio
+from datetime import date
+from typing import List
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.database import Base
+from app.db.models import SavedFlight, SavedFlightPriceChange
+from app.schemas.flight_schema import Flight
+from app.schemas.search_schema import FlightSearchRequest
+from app.services.price_refresh_service import SavedFlightPriceRefresher, _best_price
+
+TODAY = date(2026, 11, 1)
+
+
+def quote(airline, price) -> Flight:
+    return Flight(id=1, origin="ICN", destination="NRT", departure_date=date(2026, 11, 2), airline=airline, price=price)
+
+
+# 저장된 항공사가 있으면 같은 항공사(대소문자/공백 무시)의 최저가, 없으면 전체 최저가를 고르는지 검증
+@pytest.mark.parametrize(
+    "airline, expected",
+    [(None, 280000), ("korean air", 350000), (" Korean Air ", 350000), ("JAL", None)],
+)
+def test_best_price_matches_saved_airline(airline, expected) -> None:
+    flights = [quote("Korean Air", 410000), quote("KOREAN AIR", 350000), quote("Asiana", 280000), quote("JAL", None)]
+
+    assert _best_price(flights, airline) == expected
+
+
+# MCP 검색 결과 대신 노선별 견적을 돌려주고, 받은 배치 요청을 기록하는 가짜 LLMService
+class FakeLLMService:
+    def __init__(self, quotes) -> None:
+        self.quotes = quotes
+        self.batches: List[List[FlightSearchRequest]] = []
+
+    async def fetch_flights_batch(self, requests):
+        self.batches.append(requests)
+        return [self.quotes.get((request.destination, request.departure_date), []) for request in requests]
+
+
+# 같은 노선은 한 번만 검색하고, 지난 출발일은 건너뛰며, 바뀐 가격만 수정하고 변동 내역을 기록하는지 검증
+def test_refresh_once_updates_changed_prices_per_route(tmp_path) -> None:
+    nov2, nov9 = date(2026, 11, 2), date(2026, 11, 9)
+    saved = [
+        SavedFlight(origin="ICN", destination="NRT", departure_date=nov2, airline="Korean Air", price=400000),
+        SavedFlight(origin="ICN", destination="NRT", departure_date=nov2, airline=None, price=300000),
+        SavedFlight(origin="ICN", destination="KIX", departure_date=nov9, airline="Asiana", price=250000),
+        SavedFlight(origin="ICN", destination="CDG", departure_date=nov9, airline=None, price=900000),
+        SavedFlight(origin="ICN", destination="NRT", departure_date=date(2026, 10, 1), airline=None, price=1),
+    ]
+    llm_service = FakeLLMService(
+        {
+            ("NRT", nov2): [quote("Korean Air", 380000), quote("Asiana", 310000)],
+            ("KIX", nov9): [quote("Asiana", 250000)],
+        }
+    )
+
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            session.add_all(saved)
+            await session.commit()
+
+        refresher = SavedFlightPriceRefresher(
+            llm_service, session_factory=session_factory, batch_size=2, today=lambda: TODAY
+        )
+        stats = await refresher.refresh_once()
+        async with session_factory() as session:
+            prices = dict((await session.execute(select(SavedFlight.id, SavedFlight.price))).all())
+            changes = (
+                await session.execute(
+                    select(SavedFlightPriceChange.flight_id, SavedFlightPriceChange.old_price, SavedFlightPriceChange.new_price, SavedFlightPriceChange.delta)
+                    .order_by(SavedFlightPriceChange.flight_id)
+                )
+            ).all()
+        await engine.dispose()
+        return stats, prices, changes
+
+    stats, prices, changes = asyncio.run(scenario())
+
+    # 노선 3개(NRT, KIX, CDG)를 배치 크기 2로 나눠 보냄 (지난 출발일 항공편은 제외)
+    assert sorted(len(batch) for batch in llm_service.batches) == [1, 2]
+    assert (stats["flights"], stats["routes"], stats["routes_priced"], stats["updated"]) == (4, 3, 2, 2)
+    # Korean Air는 같은 항공사 최저가, 항공사가 없는 항공편은 전체 최저가, 견적이 없는 CDG와 지난 항공편은 그대로
+    assert prices == {1: 380000, 2: 310000, 3: 250000, 4: 900000, 5: 1}
+    assert [tuple(change) for change in changes] == [(1, 400000, 380000, -20000), (2, 300000, 310000, 10000)]
@@ -0,0 +1,70 @@
+# BE 내부의 repositories/saved_flight_repo.py의 keyset 페이지 커서와 페이지 조회를 테스트하는 단위 테스트 모듈
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.database import Base
+from app.repositories.saved_flight_repo import SavedFlightRepository, _decode_cursor, _encode_cursor
+from app.schemas.flight_schema import FlightCreate, SavedFlightQuery
+
+
+# 정렬 기준별 커서가 (정렬 값, 마지막 id)로 그대로 복원되는지 검증
+@pytest.mark.parametrize(
+    "sort, value",
+    [("id", 17), ("departure_date", date(2026, 11, 2)), ("price", 320000)],
+)
+def test_cursor_round_trips_sort_value_and_id(sort: str, value) -> None:
+    cursor = _encode_cursor(sort, value, 17)
+
+    assert "=" not in cursor
+    assert _decode_cursor(cursor, sort) == (value, 17)
+
+
+# 깨진 문자열, 다른 정렬 기준의 커서, 형식이 맞지 않는 값은 ValueError로 거부하는지 검증
+@pytest.mark.parametrize(
+    "cursor, sort",
+    [
+        ("not-a-cursor", "id"),
+        (_encode_cursor("price", 1000, 3), "departure_date"),
+        (_encode_cursor("price", "1000", 3), "price"),
+        (_encode_cursor("departure_date", "2026-13-40", 3), "departure_date"),
+        (_encode_cursor("id", 3, "3"), "id"),
+    ],
+)
+def test_decode_cursor_rejects_invalid_cursors(cursor: str, sort: str) -> None:
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _decode_cursor(cursor, sort)
+
+
+# 가격이 같은 항목이 페이지 경계에 걸쳐도 커서를 따라가면 빠지거나 겹치는 항목 없이 모두 한 번씩 받는지 검증
+def test_pages_follow_cursor_without_gaps_or_duplicates() -> None:
+    prices = [500, 300, 300, 300, 100, 700, 300]
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            repo = SavedFlightRepository(session)
+            for price in prices:
+                await repo.create_flight(
+                    FlightCreate(origin="ICN", destination="NRT", departure_date=date(2026, 11, 2), price=price)
+                )
+            pages, cursor = [], None
+            while True:
+                page = await repo.list_flights(SavedFlightQuery(limit=2, sort="price", order="desc", cursor=cursor))
+                pages.append(page.items)
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+        await engine.dispose()
+        return pages
+
+    pages = asyncio.run(scenario())
+
+    flights = [flight for page in pages for flight in page]
+    assert [len(page) for page in pages] == [2, 2, 2, 1]
+    assert [flight.price for flight in flights] == sorted(prices, reverse=True)
+    assert sorted(flight.id for flight in flights) == list(range(1, len(prices) + 1))
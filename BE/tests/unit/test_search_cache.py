@@ -0,0 +1,113 @@
+# BE 내부의 services/search_cache.py의 검색 결과 캐시(키 정규화, TTL, LRU, 메모리 한도)를 테스트하는 단위 테스트 모듈
+import asyncio
+from datetime import date
+
+import httpx
+
+from app.schemas.flight_schema import Flight
+from app.schemas.search_schema import FlightSearchRequest
+from app.services.llm_service import LLMService
+from app.services.search_cache import SearchResultCache, request_key
+
+
+# 테스트에서 직접 움직이는 시계
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def search(destination: str = "NRT", **fields) -> FlightSearchRequest:
+    return FlightSearchRequest(origin="ICN", destination=destination, departure_date=date(2026, 11, 2), **fields)
+
+
+def flights(count: int) -> list:
+    return [
+        Flight(id=index, origin="ICN", destination="NRT", departure_date=date(2026, 11, 2), price=100000 + index)
+        for index in range(1, count + 1)
+    ]
+
+
+# 공항 코드의 대소문자/공백만 다른 검색은 같은 키, 승객 수나 날짜가 다르면 다른 키인지 검증
+def test_request_key_normalizes_airport_codes() -> None:
+    assert request_key(search(" nrt ")) == request_key(search("NRT"))
+    assert request_key(search(passengers=2)) != request_key(search())
+    assert request_key(search(return_date=date(2026, 11, 9))) != request_key(search())
+
+
+# TTL이 지나면 미스로 처리하고 항목을 지우며, 히트/미스 통계를 세는지 검증
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    cache = SearchResultCache(ttl_seconds=60, clock=clock)
+    cache.set(search(), flights(2))
+
+    clock.now = 59.9
+    assert len(cache.get(search())) == 2
+    clock.now = 60.0
+    assert cache.get(search()) is None
+    assert cache.stats() == {"entries": 0, "flights": 0, "hits": 1, "misses": 1}
+
+
+# 항목 수나 Flight 총 개수 한도를 넘으면 가장 오래 사용되지 않은 항목부터 지우는지 검증
+def test_least_recently_used_entries_are_evicted() -> None:
+    cache = SearchResultCache(max_entries=2, max_flights=5)
+    cache.set(search("NRT"), flights(2))
+    cache.set(search("KIX"), flights(2))
+    cache.get(search("NRT"))
+
+    # 항목 수 한도: 최근에 조회한 NRT는 남고 KIX가 제거됨
+    cache.set(search("CDG"), flights(1))
+    assert cache.get(search("KIX")) is None
+    assert cache.get(search("NRT")) is not None
+
+    # Flight 수 한도: 3건을 더하면 5건을 넘으므로 오래된 CDG부터 제거
+    cache.set(search("FCO"), flights(3))
+    assert cache.get(search("CDG")) is None
+    assert cache.stats()["flights"] == 5
+
+
+# 빈 결과, 한도보다 큰 결과, TTL 0(비활성화)은 저장하지 않고, invalidate는 한 검색 또는 전체를 지우는지 검증
+def test_set_skips_uncacheable_results_and_invalidate_clears() -> None:
+    cache = SearchResultCache(max_flights=3)
+    cache.set(search("NRT"), [])
+    cache.set(search("KIX"), flights(4))
+    SearchResultCache(ttl_seconds=0).set(search(), flights(1))
+    assert cache.stats()["entries"] == 0
+
+    cache.set(search("NRT"), flights(1))
+    cache.set(search("KIX"), flights(1))
+    cache.invalidate(search("NRT"))
+    assert (cache.get(search("NRT")), len(cache.get(search("KIX")))) == (None, 1)
+    cache.invalidate()
+    assert cache.stats()["entries"] == 0
+
+
+# LLMService는 같은 검색의 MCP 결과를 캐시에서 돌려주고, MCP 실패 시의 대체 항공편은 캐시하지 않는지 검증
+def test_llm_service_caches_mcp_results_but_not_fallbacks() -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if b"KIX" in request.content:
+            return httpx.Response(500)
+        body = {"jsonrpc": "2.0", "id": "flight-search", "result": {"flights": [{"airline": "KE", "price": 320000}]}}
+        return httpx.Response(200, json=body)
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            service = LLMService(rpc_url="http://mcp.test/rpc", client=client, cache=SearchResultCache(), negotiate_wire=False)
+            first = await service.search_flights(search("NRT"))
+            second = await service.search_flights(search("nrt"))
+            fallback = await service.search_flights(search("KIX"))
+            retry = await service.search_flights(search("KIX"))
+            return first, second, fallback, retry, service.cache.stats()
+
+    first, second, fallback, retry, stats = asyncio.run(scenario())
+
+    assert [flight.price for flight in first] == [flight.price for flight in second] == [320000]
+    assert fallback[0].airline == retry[0].airline == "Demo Airline"
+    # NRT 1회 + KIX 2회 (대체 항공편은 캐시되지 않으므로 다시 호출)
+    assert len(calls) == 3
+    assert (stats["entries"], stats["hits"]) == (1, 1)
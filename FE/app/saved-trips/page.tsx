@@ -3,23 +3,33 @@
 import { useState, useEffect } from "react";
 import { useRouter } from "next/navigation";
 import { useDeleteTrip } from "@/hooks/useSavedTrips";
-import { getSavedTrips } from "@/lib/api";
+import { getSavedTripsPage } from "@/lib/api";
 import type { SavedTrip } from "@/types";
 import { SavedTripCard } from "@/components/SavedTripCard";
 
+// 한 번에 불러오는 저장된 여행 수 (다음 페이지는 "더 보기"로 요청)
+const PAGE_SIZE = 20;
+
 export default function SavedTrips() {
   const router = useRouter();
   const deleteTrip = useDeleteTrip();
   const [savedTrips, setSavedTrips] = useState<SavedTrip[]>([]);
   const [selectedTrip, setSelectedTrip] = useState<string>("");
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  // 지금까지 받은 여행 수 (삭제와 관계없이 다음 페이지의 시작 index로 사용)
+  const [loadedCount, setLoadedCount] = useState(0);
 
+  // 첫 페이지만 불러오고, 이어지는 페이지는 nextCursor로 필요할 때 요청
   useEffect(() => {
     const loadSavedTrips = async () => {
       setLoading(true);
       try {
-        const trips = await getSavedTrips();
-        setSavedTrips(trips);
+        const page = await getSavedTripsPage({ limit: PAGE_SIZE });
+        setSavedTrips(page.trips);
+        setNextCursor(page.nextCursor);
+        setLoadedCount(page.trips.length);
       } catch (error) {
         console.error("저장된 여행 목록 로드 중 오류:", error);
       } finally {
@@ -30,6 +40,24 @@ export default function SavedTrips() {
     loadSavedTrips();
   }, []);
 
+  const handleLoadMore = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const page = await getSavedTripsPage(
+        { limit: PAGE_SIZE, cursor: nextCursor },
+        loadedCount
+      );
+      setSavedTrips((trips) => [...trips, ...page.trips]);
+      setNextCursor(page.nextCursor);
+      setLoadedCount((count) => count + page.trips.length);
+    } catch (error) {
+      console.error("저장된 여행 다음 페이지 로드 중 오류:", error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleDeleteTripWithRefresh = async (tripId: string) => {
     const success = await deleteTrip(tripId);
     if (success) {
@@ -138,6 +166,19 @@ export default function SavedTrips() {
           </div>
         )}
 
+        {/* Load More */}
+        {!loading && nextCursor && (
+          <div className="text-center mt-8">
+            <button
+              onClick={handleLoadMore}
+              disabled={loadingMore}
+              className="px-6 py-3 bg-white border border-purple-200 text-purple-600 rounded-lg hover:bg-purple-50 transition-all duration-300 whitespace-nowrap disabled:opacity-50"
+            >
+              {loadingMore ? "불러오는 중..." : "더 보기"}
+            </button>
+          </div>
+        )}
+
         {/* Bottom Actions */}
         {!loading && savedTrips.length > 0 && (
           <div className="text-center mt-12">
@@ -19,6 +19,26 @@ interface BESearchResponse {
   results: BEFlight[];
 }
 
+// GET /api/v1/saved/flights 응답 (한 페이지 + 다음 페이지 커서)
+interface BESavedFlightPage {
+  items: BEFlight[];
+  next_cursor: string | null;
+}
+
+// 저장된 여행 목록 조회 조건 (BE 쿼리 파라미터와 동일)
+export interface SavedTripsQuery {
+  limit?: number;
+  cursor?: string;
+  sort?: "id" | "departure_date" | "price";
+  order?: "asc" | "desc";
+  origin?: string;
+  destination?: string;
+  departure_from?: string;
+  departure_to?: string;
+  min_price?: number;
+  max_price?: number;
+}
+
 // 항공사 코드 매핑 (항공사 이름에서 코드 추출)
 const getAirlineCode = (airlineName: string): string => {
   const airlineMap: Record<string, string> = {
@@ -92,37 +112,6 @@ const transformBEFlightToFlightData = (
   };
 };
 
-// 날짜 생성 헬퍼 함수
-const generateDatesForMonth = (
-  month: string,
-  duration: number,
-  count: number = 5
-): Array<{ departureDate: string; returnDate: string }> => {
-  const [year, monthNum] = month.split("-").map(Number);
-  const daysInMonth = new Date(year, monthNum, 0).getDate();
-  const dates: Array<{ departureDate: string; returnDate: string }> = [];
-
-  // 월 중에서 여러 날짜 구간 생성
-  for (let i = 0; i < count; i++) {
-    const maxStartDay = daysInMonth - duration;
-    if (maxStartDay < 1) break;
-
-    const startDay = Math.floor((i * maxStartDay) / count) + 1;
-    const departureDate = `${year}-${monthNum
-      .toString()
-      .padStart(2, "0")}-${startDay.toString().padStart(2, "0")}`;
-
-    const returnDay = Math.min(startDay + duration - 1, daysInMonth);
-    const returnDate = `${year}-${monthNum
-      .toString()
-      .padStart(2, "0")}-${returnDay.toString().padStart(2, "0")}`;
-
-    dates.push({ departureDate, returnDate });
-  }
-
-  return dates;
-};
-
 export const searchFlightsViaMCP = async (
   destination: string,
   duration: number,
@@ -135,67 +124,41 @@ export const searchFlightsViaMCP = async (
       destinationInfo?.airport || destination.toUpperCase();
     const origin = "ICN"; // 기본 출발지는 인천
 
-    // 월과 기간을 기반으로 여러 날짜 구간 생성
-    const dateRanges = generateDatesForMonth(month, duration, 5);
-
-    // 각 날짜 구간에 대해 BE API 호출
-    const allFlights: FlightData[] = [];
-
-    for (const dateRange of dateRanges) {
-      try {
-        // BE API 요청 생성
-        const searchRequest = {
-          origin: origin,
-          destination: destinationAirport,
-          departure_date: dateRange.departureDate,
-          return_date: dateRange.returnDate,
-          passengers: 1,
-        };
-
-        // BE API에 요청 전송
-        const response = await fetch(`${BE_SERVER_URL}/api/v1/search/flights`, {
-          method: "POST",
-          headers: {
-            "Content-Type": "application/json",
-          },
-          body: JSON.stringify(searchRequest),
-        });
-
-        if (!response.ok) {
-          console.warn(
-            `BE 서버 응답 오류 (${response.status}): ${response.statusText}`
-          );
-          continue;
-        }
-
-        const data: BESearchResponse = await response.json();
-
-        // 응답 데이터 변환
-        if (data.results && data.results.length > 0) {
-          const transformedFlights = data.results.map((flight, index) =>
-            transformBEFlightToFlightData(
-              flight,
-              allFlights.length + index,
-              duration
-            )
-          );
-          allFlights.push(...transformedFlights);
-        }
-      } catch (error) {
-        console.error(
-          `날짜 구간 ${dateRange.departureDate} 처리 중 오류:`,
-          error
+    // 월 x 여행 기간 검색을 BE에 한 번에 요청
+    // 날짜 구간 생성, 동시 검색, 중복 제거, 가격순 정렬은 BE에서 처리
+    const searchRequest = {
+      origin: origin,
+      destination: destinationAirport,
+      month: month,
+      duration: duration,
+      passengers: 1,
+      windows: 5,
+      limit: 10, // 최대 10개 반환
+    };
+
+    const response = await fetch(`${BE_SERVER_URL}/api/v1/search/flexible`, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+      },
+      body: JSON.stringify(searchRequest),
+    });
+
+    if (!response.ok) {
+      console.warn(
+        `BE 서버 응답 오류 (${response.status}): ${response.statusText}`
+      );
+    } else {
+      const data: BESearchResponse = await response.json();
+
+      // 결과가 있으면 (이미 가격순으로 정렬된) 응답 데이터를 변환하여 반환
+      if (data.results && data.results.length > 0) {
+        return data.results.map((flight, index) =>
+          transformBEFlightToFlightData(flight, index, duration)
         );
-        // 개별 날짜 구간 실패 시 계속 진행
-        continue;
       }
     }
 
-    // 결과가 있으면 가격순으로 정렬하여 반환
-    if (allFlights.length > 0) {
-      return allFlights.sort((a, b) => a.price - b.price).slice(0, 10); // 최대 10개 반환
-    }
-
     // 결과가 없으면 폴백: mock 데이터 반환
     console.warn(
       "BE 서버에서 결과를 받지 못했습니다. Mock 데이터를 사용합니다."
@@ -283,30 +246,47 @@ const generateMockFlights = (
 // ==================== 저장된 여행 관련 API ====================
 
 /**
- * 저장된 여행 목록 조회
+ * 저장된 여행 목록 한 페이지 조회
+ * nextCursor를 다음 호출의 cursor로 넘기면 이어지는 페이지를 받음 (마지막 페이지면 null)
+ * startIndex: 앞 페이지까지 받은 여행 수 (항공편 시간/기종 생성용 index가 페이지마다 반복되지 않도록 이어서 부여)
+ * 첫 페이지 조회에 실패하면 localStorage 폴백, 다음 페이지 조회 실패는 호출한 쪽으로 전달
  */
-export const getSavedTrips = async (): Promise<SavedTrip[]> => {
+export const getSavedTripsPage = async (
+  query: SavedTripsQuery = {},
+  startIndex: number = 0
+): Promise<{ trips: SavedTrip[]; nextCursor: string | null }> => {
   try {
-    const response = await fetch(`${BE_SERVER_URL}/api/v1/saved/flights`, {
-      method: "GET",
-      headers: {
-        "Content-Type": "application/json",
-      },
+    const params = new URLSearchParams();
+    Object.entries(query).forEach(([key, value]) => {
+      if (value !== undefined && value !== null && value !== "") {
+        params.set(key, String(value));
+      }
     });
+    const queryString = params.toString();
+
+    const response = await fetch(
+      `${BE_SERVER_URL}/api/v1/saved/flights${queryString ? `?${queryString}` : ""}`,
+      {
+        method: "GET",
+        headers: {
+          "Content-Type": "application/json",
+        },
+      }
+    );
 
     if (!response.ok) {
       if (response.status === 404) {
         // 엔드포인트가 없으면 빈 배열 반환 (BE가 아직 구현되지 않은 경우)
-        return [];
+        return { trips: [], nextCursor: null };
       }
       throw new Error(`서버 오류: ${response.status}`);
     }
 
-    const data: BEFlight[] = await response.json();
+    const data: BESavedFlightPage = await response.json();
     // BE의 Flight 배열을 SavedTrip 배열로 변환
     // BE에는 SavedTrip 개념이 없으므로, Flight 데이터를 기반으로 변환
     // 실제로는 BE에 SavedTrip 스키마가 필요할 수 있음
-    return data.map((flight, index) => {
+    const trips = data.items.map((flight, index) => {
       // Flight에서 목적지 정보 추출 (destination 필드 사용)
       const destinationInfo = destinations.find(
         (d) => d.airport === flight.destination
@@ -326,14 +306,18 @@ export const getSavedTrips = async (): Promise<SavedTrip[]> => {
             )
           : 0,
         month: flight.departure_date.substring(0, 7), // YYYY-MM 형식
-        flight: transformBEFlightToFlightData(flight, index, 0),
+        flight: transformBEFlightToFlightData(flight, startIndex + index, 0),
         savedAt: new Date().toISOString(), // BE에 savedAt이 없으므로 현재 시간 사용
       };
     });
+    return { trips, nextCursor: data.next_cursor };
   } catch (error) {
+    if (query.cursor) {
+      throw error;
+    }
     console.error("저장된 여행 목록 조회 중 오류:", error);
     // BE 서버가 없거나 오류 발생 시 localStorage 폴백
-    return getSavedTripsFromLocalStorage();
+    return { trips: getSavedTripsFromLocalStorage(), nextCursor: null };
   }
 };
 
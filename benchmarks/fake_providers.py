@@ -0,0 +1,92 @@
+# 타입 힌트를 문자열로 처리하여 순방향 참조 문제 해결
+from __future__ import annotations
+
+# 응답 지연을 흉내 내기 위한 비동기 모듈
+import asyncio
+
+# 지연 시간/오류/항공편 데이터를 재현 가능하게 만들기 위한 난수 모듈
+import random
+
+# 공급자 동작 설정을 묶어 두기 위한 데이터 클래스
+from dataclasses import dataclass
+
+# 타입 힌트로 사용되는 모듈
+from typing import Any, Dict, List
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+# 가짜 응답에 사용할 항공사 (코드, 이름)
+_AIRLINES = [("KE", "Korean Air"), ("OZ", "Asiana Airlines"), ("7C", "Jeju Air"), ("LJ", "Jin Air"), ("JL", "Japan Airlines")]
+
+""" 가짜 공급자 한 곳의 응답 지연/오류율/응답 크기 설정 """
+
+@dataclass(slots=True)
+class ProviderProfile:
+    # 응답 지연의 중앙값(ms)
+    latency_ms: float = 100.0
+    # 로그 정규분포의 표준편차 (0이면 항상 latency_ms, 클수록 꼬리가 길어짐)
+    latency_sigma: float = 0.5
+    # 503으로 응답할 비율 (0~1)
+    error_rate: float = 0.0
+    # 요청마다 돌려줄 항공편 수
+    itineraries: int = 50
+    # 가격 통화 (MCP 서버의 통화 변환 경로까지 측정하기 위함)
+    currency: str = "KRW"
+
+    # 이번 요청의 지연 시간(초)을 뽑음
+    def sample_latency(self, rng: random.Random) -> float:
+        if self.latency_sigma <= 0:
+            return self.latency_ms / 1000
+        return rng.lognormvariate(0.0, self.latency_sigma) * self.latency_ms / 1000
+
+# 검색 조건으로 가짜 항공편 목록을 만드는 함수
+# 같은 편명이 두 공급자에 모두 나오도록 편명은 공급자와 무관하게 만든다 (중복 병합 경로 측정)
+def make_itineraries(params: Dict[str, Any], profile: ProviderProfile, rng: random.Random) -> List[Dict[str, Any]]:
+    scale = 1 if profile.currency in ("KRW", "JPY") else 0.00069
+    flights = []
+    for index in range(profile.itineraries):
+        code, name = _AIRLINES[index % len(_AIRLINES)]
+        flights.append(
+            {
+                "origin": params.get("origin", "ICN"),
+                "destination": params.get("destination", "NRT"),
+                "departure_date": params.get("departure_date"),
+                "return_date": params.get("return_date"),
+                "airline": name,
+                "flight_numbers": [f"{code}{100 + index}"],
+                "duration_minutes": rng.randint(90, 900),
+                "stops": rng.choice((0, 0, 0, 1, 1, 2)),
+                "price": round(rng.randint(150_000, 1_500_000) * scale, 2),
+                "currency": profile.currency,
+            }
+        )
+    return flights
+
+# SkyScanner 응답 형식({"itineraries": [...]})을 흉내 내는 가짜 서버 앱
+def create_skyscanner_app(profile: ProviderProfile, seed: int = 0) -> FastAPI:
+    rng = random.Random(seed)
+    app = FastAPI(title="Fake SkyScanner")
+
+    @app.get("/flights/live/search")
+    async def search(request: Request) -> JSONResponse:
+        await asyncio.sleep(profile.sample_latency(rng))
+        if rng.random() < profile.error_rate:
+            return JSONResponse({"error": "unavailable"}, status_code=503)
+        return JSONResponse({"itineraries": make_itineraries(dict(request.query_params), profile, rng)})
+
+    return app
+
+# Provider B 응답 형식({"results": [...]})을 흉내 내는 가짜 서버 앱
+def create_provider_b_app(profile: ProviderProfile, seed: int = 0) -> FastAPI:
+    rng = random.Random(seed + 1)
+    app = FastAPI(title="Fake Provider B")
+
+    @app.get("/")
+    async def search(request: Request) -> JSONResponse:
+        await asyncio.sleep(profile.sample_latency(rng))
+        if rng.random() < profile.error_rate:
+            return JSONResponse({"error": "unavailable"}, status_code=503)
+        return JSONResponse({"results": make_itineraries(dict(request.query_params), profile, rng)})
+
+    return app
@@ -0,0 +1,309 @@
+# 로컬 가짜 공급자 서버를 띄우고 MCP 서버 /rpc 와 BE /api/v1/search/flights 에 고정 동시성 부하를 주는 벤치마크
+# 외부 네트워크 없이 실행되며 결과(req/s, p50/p95/p99, 오류율)를 JSON으로 저장하고 기준선(baseline)과 비교한다
+#
+# 사용 예 (저장소 루트에서):
+#   python -m benchmarks.load_test --targets mcp,be --concurrency 1,8,32 --duration 10 \
+#       --baseline benchmarks/baselines/load.json
+
+# 타입 힌트를 문자열로 처리하여 순방향 참조 문제 해결
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+import uvicorn
+
+from benchmarks.fake_providers import ProviderProfile, create_provider_b_app, create_skyscanner_app
+
+# 저장소 루트 / BE 디렉터리
+ROOT = Path(__file__).resolve().parent.parent
+BE_DIR = ROOT / "BE"
+
+# 부하 요청에 돌려 쓸 도착지 (캐시가 켜져 있어도 한 키만 반복되지 않도록)
+_DESTINATIONS = ["NRT", "HND", "KIX", "FUK", "CTS", "OKA", "TPE", "HKG", "BKK", "SIN", "DAD", "CEB"]
+
+# 사용 가능한 로컬 포트 하나를 고름
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+# 같은 이벤트 루프 안에서 가짜 공급자 앱을 uvicorn으로 띄움
+async def serve_in_background(app: Any, port: int) -> Tuple[uvicorn.Server, asyncio.Task]:
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", access_log=False))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+    return server, task
+
+# 요청 1건의 결과 (성공 / 일부 공급자 실패로 부분 결과 / 실패)
+OK = "ok"
+DEGRADED = "degraded"
+ERROR = "error"
+
+# MCP 서버 / BE를 별도 프로세스로 띄움 (실제 배포와 같은 uvicorn 워커 1개)
+# verbose가 아니면 서버 로그(공급자 오류 경고 등)는 버림
+def spawn(app_path: str, port: int, cwd: Path, env: Dict[str, str], verbose: bool) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app_path, "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=cwd,
+        env={**os.environ, **env},
+        stderr=None if verbose else subprocess.DEVNULL,
+    )
+
+# 서버가 요청을 받을 수 있을 때까지 기다림
+async def wait_until_ready(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited early while waiting for {url}")
+            try:
+                if (await client.get(url)).status_code < 500:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server did not become ready: {url}")
+
+# 요청 번호로 검색 조건을 만듦 (도착지 x 출발일 조합을 routes개까지 돌려 씀)
+def search_params(index: int, routes: int) -> Dict[str, Any]:
+    slot = index % max(1, routes)
+    departure = date.today() + timedelta(days=30 + slot // len(_DESTINATIONS))
+    return {
+        "origin": "ICN",
+        "destination": _DESTINATIONS[slot % len(_DESTINATIONS)],
+        "departure_date": departure.isoformat(),
+    }
+
+# MCP 서버 /rpc 요청 1건 (JSON-RPC 오류는 실패, 공급자 일부가 ok가 아니면 부분 결과로 집계)
+def mcp_request(base_url: str, routes: int) -> Callable[[httpx.AsyncClient, int], Any]:
+    async def send(client: httpx.AsyncClient, index: int) -> str:
+        payload = {"jsonrpc": "2.0", "method": "searchFlights", "params": search_params(index, routes), "id": index}
+        response = await client.post(f"{base_url}/rpc", json=payload)
+        if response.status_code != 200 or response.json().get("error") is not None:
+            return ERROR
+        providers = response.json()["result"].get("providers", [])
+        return OK if all(provider["status"] == "ok" for provider in providers) else DEGRADED
+
+    return send
+
+# BE /api/v1/search/flights 요청 1건
+def be_request(base_url: str, routes: int) -> Callable[[httpx.AsyncClient, int], Any]:
+    async def send(client: httpx.AsyncClient, index: int) -> str:
+        response = await client.post(f"{base_url}/api/v1/search/flights", json=search_params(index, routes))
+        return OK if response.status_code == 200 else ERROR
+
+    return send
+
+# concurrency개의 작업자가 duration초 동안 쉬지 않고 요청을 보내며 지연 시간과 성공 여부를 기록
+async def drive(send: Callable, concurrency: int, duration: float, warmup: float) -> Dict[str, Any]:
+    latencies: List[float] = []
+    outcomes = {OK: 0, DEGRADED: 0, ERROR: 0}
+    counter = iter(range(10**9))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=60.0) as client:
+        measure_from = time.perf_counter() + warmup
+        stop_at = measure_from + duration
+
+        async def worker() -> None:
+            while True:
+                started = time.perf_counter()
+                if started >= stop_at:
+                    return
+                try:
+                    outcome = await send(client, next(counter))
+                except httpx.HTTPError:
+                    outcome = ERROR
+                if started < measure_from:
+                    continue
+                latencies.append((time.perf_counter() - started) * 1000)
+                outcomes[outcome] += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, outcomes, duration)
+
+# 지연 시간 목록으로 처리량/백분위수/오류율 계산
+def summarize(latencies: List[float], outcomes: Dict[str, int], duration: float) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+
+    def percentile(p: float) -> Optional[float]:
+        if not ordered:
+            return None
+        return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 2)
+
+    return {
+        "requests": len(ordered),
+        "rps": round(len(ordered) / duration, 2),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "error_rate": round(outcomes[ERROR] / len(ordered), 4) if ordered else None,
+        "degraded_rate": round(outcomes[DEGRADED] / len(ordered), 4) if ordered else None,
+    }
+
+# 기준선과 비교해서 처리량 감소 / p95·p99 증가가 허용 범위를 넘는 항목을 반환
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    previous = {(row["target"], row["concurrency"]): row for row in baseline.get("results", [])}
+    regressions = []
+    for row in results:
+        old = previous.get((row["target"], row["concurrency"]))
+        if not old:
+            continue
+        label = f"{row['target']} c={row['concurrency']}"
+        if old["rps"] and row["rps"] < old["rps"] * (1 - tolerance):
+            regressions.append(f"{label}: rps {old['rps']} -> {row['rps']}")
+        for key in ("p95_ms", "p99_ms"):
+            if old.get(key) and row.get(key) and row[key] > old[key] * (1 + tolerance):
+                regressions.append(f"{label}: {key} {old[key]} -> {row[key]}")
+    return regressions
+
+# 현재 커밋 해시 (git이 없으면 None)
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    targets = [target.strip() for target in args.targets.split(",") if target.strip()]
+    skyscanner_profile = ProviderProfile(
+        latency_ms=args.skyscanner_latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        itineraries=args.itineraries,
+        currency="KRW",
+    )
+    provider_b_profile = ProviderProfile(
+        latency_ms=args.provider_b_latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        itineraries=args.itineraries,
+        currency="USD",
+    )
+
+    # 1) 가짜 공급자 서버
+    skyscanner_port, provider_b_port, mcp_port, be_port = free_port(), free_port(), free_port(), free_port()
+    fakes = [
+        await serve_in_background(create_skyscanner_app(skyscanner_profile, args.seed), skyscanner_port),
+        await serve_in_background(create_provider_b_app(provider_b_profile, args.seed), provider_b_port),
+    ]
+
+    processes: List[subprocess.Popen] = []
+    results: List[Dict[str, Any]] = []
+    try:
+        # 2) 실제 어댑터가 가짜 공급자를 호출하도록 설정한 MCP 서버
+        mcp_env = {
+            "SKYSCANNER_API_KEY": "benchmark",
+            "PROVIDER_B_API_KEY": "benchmark",
+            "ENABLE_MOCK_PROVIDERS": "false",
+            "FARE_CACHE_ENABLED": "true" if args.cache else "false",
+            "PROVIDER_BASE_URLS": json.dumps(
+                {
+                    "skyscanner": f"http://127.0.0.1:{skyscanner_port}",
+                    "provider_b": f"http://127.0.0.1:{provider_b_port}",
+                }
+            ),
+        }
+        mcp_url = f"http://127.0.0.1:{mcp_port}"
+        processes.append(spawn("mcp_server.main:app", mcp_port, ROOT, mcp_env, args.verbose))
+        await wait_until_ready(f"{mcp_url}/health", processes[-1])
+        senders = {"mcp": mcp_request(mcp_url, args.routes)}
+
+        # 3) MCP 서버를 호출하는 BE (임시 SQLite DB 사용)
+        if "be" in targets:
+            database = Path(tempfile.mkdtemp()) / "benchmark.db"
+            be_env = {
+                "MCP_SERVER_URL": f"{mcp_url}/rpc",
+                "DATABASE_URL": f"sqlite:///{database}",
+                "SEARCH_CACHE_TTL_SECONDS": "60" if args.cache else "0",
+                # BE는 저장소 루트의 shared 패키지를 import
+                "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])),
+            }
+            be_url = f"http://127.0.0.1:{be_port}"
+            processes.append(spawn("app.main:app", be_port, BE_DIR, be_env, args.verbose))
+            await wait_until_ready(f"{be_url}/openapi.json", processes[-1])
+            senders["be"] = be_request(be_url, args.routes)
+
+        # 4) 대상 x 동시성 수준별 측정
+        for target in targets:
+            for concurrency in args.concurrency:
+                summary = await drive(senders[target], concurrency, args.duration, args.warmup)
+                row = {"target": target, "concurrency": concurrency, **summary}
+                results.append(row)
+                print(json.dumps(row), flush=True)
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait(timeout=10)
+        for server, task in fakes:
+            server.should_exit = True
+            await task
+
+    return {
+        "benchmark": "load",
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "config": {
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "routes": args.routes,
+            "cache": args.cache,
+            "seed": args.seed,
+            "skyscanner": {"latency_ms": args.skyscanner_latency_ms, "currency": "KRW"},
+            "provider_b": {"latency_ms": args.provider_b_latency_ms, "currency": "USD"},
+            "latency_sigma": args.latency_sigma,
+            "error_rate": args.error_rate,
+            "itineraries": args.itineraries,
+        },
+        "results": results,
+    }
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline load benchmark for the MCP server and BE search path")
+    parser.add_argument("--targets", default="mcp,be", help="comma separated: mcp, be")
+    parser.add_argument("--concurrency", default=[1, 8, 32], type=lambda value: [int(v) for v in value.split(",")])
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds per concurrency level")
+    parser.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds before each level")
+    parser.add_argument("--routes", type=int, default=48, help="distinct search keys to rotate through")
+    parser.add_argument("--cache", action="store_true", help="enable the MCP fare cache and BE search cache")
+    parser.add_argument("--skyscanner-latency-ms", type=float, default=120.0)
+    parser.add_argument("--provider-b-latency-ms", type=float, default=250.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.01)
+    parser.add_argument("--itineraries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--verbose", action="store_true", help="show MCP/BE server logs")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="compare against this results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed relative regression vs. baseline")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    report = asyncio.run(run(args))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.baseline and args.baseline.exists():
+        regressions = compare(report["results"], json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
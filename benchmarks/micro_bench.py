@@ -0,0 +1,256 @@
+# 항공편 1건마다 실행되는 핫패스 함수의 마이크로 벤치마크
+# 시드 고정 합성 데이터(10 ~ 100k건)로 각 함수의 호출당 시간을 재고, 저장된 기준선과 비교한다
+#
+# 사용 예 (저장소 루트에서):
+#   python -m benchmarks.micro_bench --output benchmarks/results/micro.json
+#   python -m benchmarks.micro_bench --baseline benchmarks/baselines/micro.json --tolerance 0.25
+
+# 타입 힌트를 문자열로 처리하여 순방향 참조 문제 해결
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.load_test import git_commit
+from benchmarks.synthetic import generate_itineraries, generate_normalized_itineraries
+
+ROOT = Path(__file__).resolve().parent.parent
+BE_DIR = ROOT / "BE"
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000]
+
+""" 벤치마크 하나: setup(size, seed)가 측정할 함수(인자 없음)를 돌려줌 """
+
+@dataclass(slots=True)
+class Bench:
+    name: str
+    setup: Callable[[int, int], Callable[[], Any]]
+
+# MCP 서버 쪽 핫패스 (분석기, 가격 정규화, 중복 병합, JSON-RPC 직렬화)
+def mcp_benches() -> List[Bench]:
+    from shared.wire import MEDIA_JSON, MEDIA_MSGPACK, decode_body, encode_body, msgpack, zstandard
+    from mcp_server.main import _response_dict
+    from mcp_server.protocols.json_rpc import JSONRPCResponse
+    from mcp_server.services.flight_analyzer import FlightAnalyzer
+    from mcp_server.services.itinerary_merger import merge_itineraries
+    from mcp_server.services.price_normalizer import PriceNormalizer, load_rates
+
+    analyzer = FlightAnalyzer()
+    normalizer = PriceNormalizer("KRW", load_rates())
+
+    def find_cheapest(size: int, seed: int) -> Callable[[], Any]:
+        flights = generate_normalized_itineraries(size, seed)
+        return lambda: analyzer.find_cheapest(flights)
+
+    def average_price(size: int, seed: int) -> Callable[[], Any]:
+        flights = generate_normalized_itineraries(size, seed)
+        return lambda: analyzer.average_price(flights)
+
+    def rank_top_20(size: int, seed: int) -> Callable[[], Any]:
+        flights = generate_normalized_itineraries(size, seed)
+        return lambda: analyzer.rank(flights, top_k=20)
+
+    def normalize_prices(size: int, seed: int) -> Callable[[], Any]:
+        flights = generate_itineraries(size, seed)
+        return lambda: normalizer.normalize(flights, "KRW")
+
+    def merge(size: int, seed: int) -> Callable[[], Any]:
+        flights = generate_normalized_itineraries(size, seed)
+        half = len(flights) // 2
+        return lambda: merge_itineraries([("skyscanner", flights[:half]), ("provider_b", flights[half:])])
+
+    # /rpc 응답 경로(_rpc_response)와 같은 순서: 응답 dict 변환 -> 협상된 형식으로 직렬화 -> 압축
+    def jsonrpc_encoder(accept: str, accept_encoding: str) -> Callable[[int, int], Callable[[], Any]]:
+        def setup(size: int, seed: int) -> Callable[[], Any]:
+            result = {"flights": generate_normalized_itineraries(size, seed), "cheapest": None, "providers": []}
+            response = JSONRPCResponse(result=result, id="bench")
+            return lambda: encode_body(_response_dict(response), accept, accept_encoding)
+
+        return setup
+
+    def jsonrpc_decoder(accept: str, accept_encoding: str) -> Callable[[int, int], Callable[[], Any]]:
+        encode = jsonrpc_encoder(accept, accept_encoding)
+
+        def setup(size: int, seed: int) -> Callable[[], Any]:
+            body, headers = encode(size, seed)()
+            return lambda: decode_body(body, headers["content-type"], headers.get("content-encoding"))
+
+        return setup
+
+    #압축 없는 JSON, JSON + gzip, (설치되어 있으면) msgpack + zstd
+    wire_formats = [("", MEDIA_JSON, ""), ("_gzip", MEDIA_JSON, "gzip")]
+    if msgpack is not None and zstandard is not None:
+        wire_formats.append(("_msgpack_zstd", MEDIA_MSGPACK, "zstd"))
+    jsonrpc = [
+        bench
+        for suffix, accept, accept_encoding in wire_formats
+        for bench in (
+            Bench(f"jsonrpc.encode{suffix}", jsonrpc_encoder(accept, accept_encoding)),
+            Bench(f"jsonrpc.decode{suffix}", jsonrpc_decoder(accept, accept_encoding)),
+        )
+    ]
+
+    return [
+        Bench("analyzer.find_cheapest", find_cheapest),
+        Bench("analyzer.average_price", average_price),
+        Bench("analyzer.rank_top_20", rank_top_20),
+        Bench("price_normalizer.normalize", normalize_prices),
+        Bench("itinerary_merger.merge", merge),
+        *jsonrpc,
+    ]
+
+# BE 쪽 핫패스 (MCP 응답 -> Flight 열 단위 변환과 값 파싱), BE 의존성이 없으면 건너뜀
+def be_benches() -> List[Bench]:
+    sys.path.insert(0, str(BE_DIR))
+    try:
+        from app.schemas.search_schema import FlightSearchRequest
+        from app.services.llm_service import LLMService, _date_column, _iso_date
+    except Exception as exc:  # BE 의존성이 설치되지 않은 환경
+        print(f"Skipping BE benchmarks: {exc}", file=sys.stderr)
+        return []
+
+    service = LLMService(api_key=None, rpc_url="", timeout_seconds=1)
+    request = FlightSearchRequest(origin="ICN", destination="NRT", departure_date=date(2025, 1, 1))
+
+    def map_flights(size: int, seed: int) -> Callable[[], Any]:
+        flights = generate_normalized_itineraries(size, seed)
+        return lambda: service._map_flights(request, flights)
+
+    def parse_price(size: int, seed: int) -> Callable[[], Any]:
+        prices = [flight["price"] for flight in generate_itineraries(size, seed)]
+        parse = LLMService._parse_price
+        return lambda: [parse(price) if not isinstance(price, dict) else None for price in prices]
+
+    #_map_flights의 날짜 열 변환, 같은 날짜 문자열은 _iso_date 캐시로 한 번만 파싱
+    #date_column_cold: 캐시를 비운 상태에서 한 번 변환 (처음 보는 날짜들), date_column: 캐시가 채워진 상태
+    def date_column(size: int, seed: int) -> Callable[[], Any]:
+        dates = [flight["departure_date"] for flight in generate_itineraries(size, seed)]
+        default = request.departure_date
+        return lambda: _date_column(dates, default)
+
+    def date_column_cold(size: int, seed: int) -> Callable[[], Any]:
+        convert = date_column(size, seed)
+
+        def run() -> Any:
+            _iso_date.cache_clear()
+            return convert()
+
+        return run
+
+    return [
+        Bench("llm_service.map_flights", map_flights),
+        Bench("llm_service.parse_price", parse_price),
+        Bench("llm_service.date_column", date_column),
+        Bench("llm_service.date_column_cold", date_column_cold),
+    ]
+
+# 한 크기에 대해 min_time초 이상, 최소 repeat번 반복 실행해서 호출당 시간 통계를 구함
+def measure(func: Callable[[], Any], min_time: float, repeat: int) -> Dict[str, float]:
+    samples: List[float] = []
+    budget_end = time.perf_counter() + min_time
+    while len(samples) < repeat or time.perf_counter() < budget_end:
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return {"best_ms": min(samples) * 1000, "median_ms": statistics.median(samples) * 1000, "runs": len(samples)}
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    benches = mcp_benches() + ([] if args.skip_be else be_benches())
+    if args.only:
+        benches = [bench for bench in benches if any(pattern in bench.name for pattern in args.only)]
+
+    results = []
+    for bench in benches:
+        for size in args.sizes:
+            func = bench.setup(size, args.seed)
+            func()  # 워밍업
+            stats = measure(func, args.min_time, args.repeat)
+            row = {
+                "name": bench.name,
+                "size": size,
+                "best_ms": round(stats["best_ms"], 4),
+                "median_ms": round(stats["median_ms"], 4),
+                "ns_per_row": round(stats["median_ms"] * 1e6 / size, 1),
+                "runs": stats["runs"],
+            }
+            results.append(row)
+            print(json.dumps(row), flush=True)
+
+    return {
+        "benchmark": "micro",
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {"python": platform.python_version(), "platform": platform.platform()},
+        "config": {"seed": args.seed, "sizes": args.sizes, "min_time_s": args.min_time, "repeat": args.repeat},
+        "results": results,
+    }
+
+# 기준선보다 중앙값이 tolerance 이상 느려진 항목을 반환
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    previous = {(row["name"], row["size"]): row for row in baseline.get("results", [])}
+    regressions = []
+    for row in results:
+        old = previous.get((row["name"], row["size"]))
+        if old and old["median_ms"] and row["median_ms"] > old["median_ms"] * (1 + tolerance):
+            regressions.append(f"{row['name']} n={row['size']}: {old['median_ms']}ms -> {row['median_ms']}ms")
+    return regressions
+
+# 기준선과 결과의 (이름, 크기)가 맞지 않는 항목: (기준선이 없는 결과, 결과가 없는 기준선 항목)
+# 벤치마크 이름이 바뀌거나 추가/삭제되었는데 기준선을 다시 만들지 않은 경우를 알려 준다
+def unmatched(results: List[Dict[str, Any]], baseline: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    measured = {(row["name"], row["size"]) for row in results}
+    recorded = {(row["name"], row["size"]) for row in baseline.get("results", [])}
+    label = lambda key: f"{key[0]} n={key[1]}"
+    return [label(key) for key in sorted(measured - recorded)], [label(key) for key in sorted(recorded - measured)]
+
+# 이번 실행에서 고른 벤치마크/크기(--only, --sizes, --skip-be)에 해당하는 기준선 항목만 남김
+def baseline_rows(baseline: Dict[str, Any], args: argparse.Namespace) -> Dict[str, Any]:
+    def selected(row: Dict[str, Any]) -> bool:
+        if row["size"] not in args.sizes or (args.skip_be and row["name"].startswith("llm_service.")):
+            return False
+        return not args.only or any(pattern in row["name"] for pattern in args.only)
+
+    return {**baseline, "results": [row for row in baseline.get("results", []) if selected(row)]}
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for per-itinerary hot paths")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, type=lambda value: [int(v) for v in value.split(",")])
+    parser.add_argument("--only", nargs="*", help="run benchmarks whose name contains any of these")
+    parser.add_argument("--skip-be", action="store_true", help="skip BE (LLMService) benchmarks")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds spent per benchmark and size")
+    parser.add_argument("--repeat", type=int, default=5, help="minimum runs per benchmark and size")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="compare against this results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown vs. baseline")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    report = run(args)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.baseline and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(report["results"], baseline, args.tolerance)
+        missing, stale = unmatched(report["results"], baseline_rows(baseline, args))
+        for line in missing:
+            print(f"NO BASELINE {line}", file=sys.stderr)
+        for line in stale:
+            print(f"NOT MEASURED {line}", file=sys.stderr)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+# 마이크로 벤치마크용 합성 항공편 데이터 생성기
+# 같은 시드와 개수면 항상 같은 데이터가 만들어져 커밋 간 비교가 가능하다
+
+# 타입 힌트를 문자열로 처리하여 순방향 참조 문제 해결
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+_AIRLINES = [("KE", "Korean Air"), ("OZ", "Asiana Airlines"), ("7C", "Jeju Air"), ("LJ", "Jin Air"), ("JL", "Japan Airlines"), ("CX", "Cathay Pacific")]
+_DESTINATIONS = ["NRT", "HND", "KIX", "FUK", "TPE", "HKG", "BKK", "SIN", "DAD", "CEB"]
+
+# 공급자 원본 응답처럼 가격 형식이 섞인 항공편 dict 목록 생성
+# 가격: 대부분 KRW 정수, 일부는 "1,234.50 EUR" 같은 문자열, 일부는 {"amount", "currency"}, 소수는 None
+# duplicate_ratio만큼은 앞쪽 항공편과 같은 편명/날짜를 가져서 공급자 간 중복 병합 경로도 측정된다
+def generate_itineraries(count: int, seed: int = 42, duplicate_ratio: float = 0.2) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    flights: List[Dict[str, Any]] = []
+    for index in range(count):
+        if flights and rng.random() < duplicate_ratio:
+            source = flights[rng.randrange(len(flights))]
+            flights.append({**source, "price": _price(rng)})
+            continue
+        code, name = rng.choice(_AIRLINES)
+        departure = start + timedelta(days=rng.randrange(365))
+        flights.append(
+            {
+                "origin": "ICN",
+                "destination": rng.choice(_DESTINATIONS),
+                "departure_date": departure.isoformat(),
+                "return_date": (departure + timedelta(days=rng.randint(2, 14))).isoformat(),
+                "airline": name,
+                "flight_numbers": [f"{code}{rng.randint(100, 999)}"],
+                "duration_minutes": rng.randint(90, 900),
+                "stops": rng.choice((0, 0, 0, 1, 1, 2)),
+                "price": _price(rng),
+            }
+        )
+    return flights
+
+# 정규화된(MCP 서버가 내보내는) 형식: 가격은 정수 KRW, currency 포함
+def generate_normalized_itineraries(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {**flight, "price": rng.randint(150_000, 1_500_000), "currency": "KRW"}
+        for flight in generate_itineraries(count, seed)
+    ]
+
+def _price(rng: random.Random) -> Any:
+    roll = rng.random()
+    if roll < 0.02:
+        return None
+    if roll < 0.12:
+        return f"{rng.randint(100, 1500):,}.{rng.randint(0, 99):02d} EUR"
+    if roll < 0.17:
+        return {"amount": rng.randint(100, 1200), "currency": "USD"}
+    return rng.randint(150_000, 1_500_000)
@@ -0,0 +1,211 @@
+#타입 어노테이션 평가 방식을 변화시키는 모듈
+from __future__ import annotations
+
+#헤지 요청(같은 요청을 한 번 더 보내기)을 동시에 기다리기 위한 비동기 모듈
+import asyncio
+
+#로그를 분류하고 관리하기 위한 모듈
+import logging
+
+#공급자 호출 소요 시간을 측정하기 위한 모듈
+import time
+
+#타입 힌트로 사용되는 모듈
+from typing import Any, Dict, List, Optional
+
+#HTTP 클라이언트 라이브러리
+import httpx
+
+#공급자별 회로 차단기 (오류가 잦거나 느린 공급자는 바로 건너뜀)
+from mcp_server.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+#프로젝트 환경설정 값을 가져오는 모듈
+from mcp_server.core.config import get_settings
+
+#모의 응답 대체 횟수 지표
+from mcp_server.core.metrics import PROVIDER_MOCK_FALLBACKS
+
+#공급자별 호출 속도 제한 (토큰 버킷 + 우선순위 대기열)
+from mcp_server.core.rate_limiter import PriorityRateLimiter
+
+#호출 한도 대기와 실제 HTTP 요청(헤지 포함)을 스팬으로 기록
+from mcp_server.core.tracing import TRACER
+
+#모든 항공편 공급자 어댑터가 공통으로 사용하는 기반 클래스
+#API 키 확인, 공유 HTTP 클라이언트 사용, 실패 시 모의 응답 대체 흐름을 한곳에서 처리
+class BaseFlightAdapter:
+
+    #통합기와 상태 메타데이터에서 사용하는 공급자 이름
+    NAME = ""
+
+    #로그에 표시할 공급자 이름
+    DISPLAY_NAME = ""
+
+    #공급자 API의 기본 URL
+    BASE_URL = ""
+
+    #가격에 통화 표시가 없을 때 가정할 공급자 통화 (None이면 DEFAULT_CURRENCY)
+    CURRENCY: Optional[str] = None
+
+    #어댑터 초기화 메서드 / 앱 lifespan이 관리하는 공유 AsyncClient를 주입받을 수 있음
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        self.settings = get_settings()
+        self.logger = logging.getLogger(type(self).__module__)
+        self.client = client
+        #회로 차단기 (비활성화 시 None)
+        self.breaker = CircuitBreaker.from_settings(self.settings) if self.settings.circuit_breaker_enabled else None
+        #공급자 호출 속도 제한기 (PROVIDER_RATE_LIMITS에 없으면 None = 제한 없음)
+        self.limiter = PriorityRateLimiter.for_provider(self.settings, self.NAME)
+        #보낸 헤지 요청 수 / 그중 먼저 도착해서 사용된 수
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    #비동기적으로 항공편을 검색하는 메서드
+    async def search_flights(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+
+        #API 키가 없으면 경고 로그를 남기고 모의 응답(또는 빈 리스트)을 반환
+        api_key = self._api_key()
+        if not api_key:
+            self.logger.warning("%s API key missing. Using mock response.", self.DISPLAY_NAME)
+            return self._fallback(params, "missing_key") if self.settings.enable_mock_providers else []
+
+        #회로가 열려 있으면 마감 시간까지 기다리지 않고 바로 모의 응답(또는 오류)으로 처리
+        if self.breaker is not None and not self.breaker.allow():
+            self.logger.warning("%s circuit is open. Skipping provider call.", self.DISPLAY_NAME)
+            if self.settings.enable_mock_providers:
+                return self._fallback(params, "circuit_open")
+            raise CircuitOpenError(f"{self.DISPLAY_NAME} circuit is open")
+
+        #호출 한도 토큰을 기다림 (사용자 검색이 백그라운드 갱신/사전 캐싱보다 먼저 처리됨)
+        if self.limiter is not None:
+            try:
+                with TRACER.span("provider.rate_limit_wait", {"provider": self.NAME}):
+                    await self.limiter.acquire()
+            except asyncio.CancelledError:
+                if self.breaker is not None:
+                    self.breaker.abandon()
+                raise
+
+        started = time.perf_counter()
+        try:
+            flights = await self._fetch_hedged(params, api_key)
+
+        #HTTP 요청 중 오류가 발생하면 로그를 남기고, 모의 응답 기능 활성화 시 모의 응답 반환
+        except httpx.HTTPError as exc:
+            self._record(started, failed=True)
+            self.logger.error("%s API call failed: %s", self.DISPLAY_NAME, exc)
+            if self.settings.enable_mock_providers:
+                return self._fallback(params, "http_error")
+            raise
+
+        #통합기의 마감 시간 초과로 취소된 호출도 실패로 기록
+        except asyncio.CancelledError:
+            self._record(started, failed=True)
+            raise
+
+        #응답 본문 파싱 오류 등 그 밖의 예외도 실패로 기록 (HALF_OPEN 시험 호출이 끝나지 않은 채로 남지 않도록)
+        except Exception as exc:
+            self._record(started, failed=True)
+            self.logger.error("%s API response handling failed: %s", self.DISPLAY_NAME, exc)
+            raise
+        self._record(started, failed=False)
+        return flights
+
+    #실제 호출에 사용할 기본 URL (PROVIDER_BASE_URLS에 지정되어 있으면 그 값을 사용)
+    @property
+    def base_url(self) -> str:
+        return self.settings.provider_base_urls.get(self.NAME, self.BASE_URL).rstrip("/")
+
+    #/health에 노출할 회로 차단기 상태, 헤지 요청 통계, 호출 한도 대기 시간
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "breaker": self.breaker.stats() if self.breaker is not None else None,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "rate_limit": self.limiter.stats() if self.limiter is not None else None,
+        }
+
+    #첫 요청이 최근 지연 백분위수를 넘도록 끝나지 않으면 같은 요청을 한 번 더 보내고 먼저 성공한 응답을 사용
+    #헤지가 꺼져 있거나 지연 표본이 부족하면 요청을 한 번만 보냄
+    async def _fetch_hedged(self, params: Dict[str, Any], api_key: str) -> List[Dict[str, Any]]:
+        delay = self._hedge_delay()
+        if delay is None:
+            return await self._traced_fetch(params, api_key, hedge=False)
+
+        primary = asyncio.ensure_future(self._traced_fetch(params, api_key, hedge=False))
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            #헤지 요청은 호출 한도에 여유가 있을 때만 보냄 (토큰을 기다리지 않음)
+            if not done and (self.limiter is None or self.limiter.try_acquire()):
+                self.hedges += 1
+                pending.add(asyncio.ensure_future(self._traced_fetch(params, api_key, hedge=True)))
+            error: BaseException | None = None
+            while done or pending:
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    #공급자 HTTP 요청 1회를 스팬으로 감싸서 실행 (취소된 헤지 요청은 error=CancelledError로 기록)
+    async def _traced_fetch(self, params: Dict[str, Any], api_key: str, hedge: bool) -> List[Dict[str, Any]]:
+        with TRACER.span("provider.http", {"provider": self.NAME, "hedge": hedge}):
+            return await self._fetch(params, api_key)
+
+    #헤지 요청을 보내기 전 대기 시간(초), 헤지를 하지 않으면 None
+    def _hedge_delay(self) -> Optional[float]:
+        if not self.settings.hedge_enabled or self.breaker is None:
+            return None
+        percentile = self.breaker.latency_percentile(self.settings.hedge_percentile)
+        if percentile is None:
+            return None
+        return max(percentile, self.settings.hedge_min_delay_ms) / 1000
+
+    #호출 결과를 회로 차단기에 기록
+    def _record(self, started: float, failed: bool) -> None:
+        if self.breaker is None:
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if failed:
+            self.breaker.record_failure(elapsed_ms)
+        else:
+            self.breaker.record_success(elapsed_ms)
+
+    #모의 응답을 반환, 캐시 등에서 실제 응답과 구분할 수 있도록 is_mock 표시를 붙임
+    #reason: 대체 사유 (missing_key / circuit_open / http_error), 지표에 기록
+    def _fallback(self, params: Dict[str, Any], reason: str) -> List[Dict[str, Any]]:
+        PROVIDER_MOCK_FALLBACKS.inc(self.NAME, reason)
+        return [{**flight, "is_mock": True} for flight in self._mock_response(params)]
+
+    #공유 클라이언트로 GET 요청을 보내고 HTTP 오류는 예외로 처리
+    #클라이언트가 주입되지 않은 경우(단독 사용, 테스트)에는 1회용 클라이언트를 사용
+    async def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        timeout = self.settings.provider_timeout_seconds
+        if self.client is not None:
+            response = await self.client.get(url, timeout=timeout, **kwargs)
+        else:
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                response = await client.get(url, **kwargs)
+        response.raise_for_status()
+        return response
+
+    #설정에서 공급자 API 키를 가져오는 메서드 (하위 클래스에서 구현)
+    def _api_key(self) -> Optional[str]:
+        raise NotImplementedError
+
+    #실제 공급자 API를 호출해 항공편 목록을 반환하는 메서드 (하위 클래스에서 구현)
+    async def _fetch(self, params: Dict[str, Any], api_key: str) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    #모의 응답 생성 메서드 (하위 클래스에서 구현)
+    def _mock_response(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        raise NotImplementedError
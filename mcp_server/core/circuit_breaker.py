@@ -0,0 +1,137 @@
+#타입 어노테이션 평가 방식을 변화시키는 모듈
+from __future__ import annotations
+
+#최근 호출 결과를 고정 크기 창(window)으로 보관하기 위한 자료구조
+from collections import deque
+
+#OPEN 상태 유지 시간을 측정하기 위한 모듈
+import time
+
+#타입 힌트로 사용되는 모듈
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+#프로젝트 환경설정 클래스
+from mcp_server.core.config import MCPSettings
+
+#회로 차단기 상태 (정상 호출 / 호출 차단 / 시험 호출 1건 허용)
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+#회로가 열려 있어 공급자 호출을 건너뛸 때 발생하는 예외
+class CircuitOpenError(Exception):
+    pass
+
+#공급자 한 곳의 최근 호출 오류율/지연으로 호출 여부를 결정하는 회로 차단기
+#최근 window개 호출 중 오류 비율 또는 느린 호출 비율이 임계값을 넘으면 OPEN이 되어 open_seconds 동안 호출을 건너뛰고,
+#그 뒤 HALF_OPEN에서 시험 호출 1건이 성공하면 CLOSED, 실패하면 다시 OPEN
+class CircuitBreaker:
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 5,
+        error_rate_threshold: float = 0.5,
+        slow_call_ms: float = 5000.0,
+        slow_rate_threshold: float = 0.8,
+        open_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.slow_call_ms = slow_call_ms
+        self.slow_rate_threshold = slow_rate_threshold
+        self.open_seconds = open_seconds
+        self.clock = clock
+        self.state = CLOSED
+        #최근 호출 결과 (실패 여부, 느린 호출 여부)
+        self._calls: Deque[Tuple[bool, bool]] = deque(maxlen=window)
+        #최근 성공 호출의 소요 시간(ms), 헤지 요청 지연 계산에 사용
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.trips = 0
+        self.rejected = 0
+
+    #설정값으로 차단기 생성
+    @classmethod
+    def from_settings(cls, settings: MCPSettings) -> "CircuitBreaker":
+        return cls(
+            window=settings.circuit_breaker_window,
+            min_calls=settings.circuit_breaker_min_calls,
+            error_rate_threshold=settings.circuit_breaker_error_rate,
+            slow_call_ms=settings.circuit_breaker_slow_call_ms,
+            slow_rate_threshold=settings.circuit_breaker_slow_rate,
+            open_seconds=settings.circuit_breaker_open_seconds,
+        )
+
+    #이번 호출을 보내도 되는지 확인 (False면 공급자를 호출하지 않음)
+    def allow(self) -> bool:
+        if self.state == OPEN and self.clock() - self._opened_at >= self.open_seconds:
+            self.state = HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    #allow()로 허가받은 호출을 보내지 못했을 때 (HALF_OPEN 시험 호출 기회를 되돌림)
+    def abandon(self) -> None:
+        if self.state == HALF_OPEN:
+            self._probe_in_flight = False
+
+    #성공한 호출 기록
+    def record_success(self, elapsed_ms: float) -> None:
+        self._latencies.append(elapsed_ms)
+        self._record(False, elapsed_ms)
+
+    #실패한 호출 기록 (마감 시간 초과로 취소된 호출 포함)
+    def record_failure(self, elapsed_ms: float) -> None:
+        self._record(True, elapsed_ms)
+
+    #최근 성공 호출 소요 시간의 백분위수(ms), 표본이 min_calls보다 적으면 None
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        if len(self._latencies) < self.min_calls:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(percentile * len(ordered)))]
+
+    #/health에 노출할 상태 정보
+    def stats(self) -> Dict[str, Any]:
+        calls = len(self._calls)
+        return {
+            "state": self.state,
+            "calls": calls,
+            "error_rate": round(sum(failed for failed, _ in self._calls) / calls, 4) if calls else 0.0,
+            "slow_rate": round(sum(slow for _, slow in self._calls) / calls, 4) if calls else 0.0,
+            "trips": self.trips,
+            "rejected": self.rejected,
+        }
+
+    def _record(self, failed: bool, elapsed_ms: float) -> None:
+        slow = elapsed_ms >= self.slow_call_ms
+        if self.state == HALF_OPEN:
+            self._probe_in_flight = False
+            if failed or slow:
+                self._open()
+            else:
+                self.state = CLOSED
+                self._calls.clear()
+            return
+
+        self._calls.append((failed, slow))
+        if self.state == CLOSED and len(self._calls) >= self.min_calls:
+            calls = len(self._calls)
+            error_rate = sum(failed for failed, _ in self._calls) / calls
+            slow_rate = sum(slow for _, slow in self._calls) / calls
+            if error_rate >= self.error_rate_threshold or slow_rate >= self.slow_rate_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self._opened_at = self.clock()
+        self._calls.clear()
+        self.trips += 1
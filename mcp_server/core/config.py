@@ -2,7 +2,7 @@
 from functools import lru_cache
 
 #typing: 파이썬의 타입 힌트(type hint) 기능을 위한 내장 모듈 / Optional: 값이 None일 수도 있음을 나타내는 타입 힌트
-from typing import Optional
+from typing import Dict, List, Optional
 
 #pydantic: 데이터 유효성 검사 및 설정 관리를 위한 파이썬 라이브러리 / BaseSettings: 환경설정 관리를 위한 기본 클래스 / Field: 필드 설정을 할 수 있는 도구
 from pydantic import BaseSettings, Field
@@ -15,7 +15,74 @@ class MCPSettings(BaseSettings):
     skyscanner_api_key: Optional[str] = Field(default=None, description="SkyScanner API key")
     provider_b_api_key: Optional[str] = Field(default=None, description="임시 외부 API key 식별자")
     provider_timeout_seconds: int = Field(default=10, description="외부 API를 호출할 때의 타임아웃(시간 제한)")
-    default_currency: str = Field(default="USD", description="가격 정규화를 위한 통화(currency) 설정값")
+    provider_base_urls: Dict[str, str] = Field(
+        default_factory=dict,
+        description="공급자 이름별 API 기본 URL 재정의, 예: {\"skyscanner\": \"http://127.0.0.1:9101\"} (벤치마크/테스트용)",
+    )
+    provider_deadlines: Dict[str, float] = Field(
+        default_factory=dict,
+        description="공급자 이름별 마감 시간(초), 예: {\"skyscanner\": 3}. 없으면 provider_timeout_seconds 사용",
+    )
+    http_max_connections: int = Field(default=100, description="공유 HTTP 커넥션 풀 전체의 최대 연결 수")
+    http_max_keepalive_connections: int = Field(default=20, description="유지(keep-alive)할 유휴 연결의 최대 수")
+    http_max_connections_per_host: int = Field(default=20, description="공급자 호스트 한 곳당 최대 연결 수")
+    http_keepalive_expiry_seconds: float = Field(default=30.0, description="유휴 연결을 유지하는 시간(초)")
+    http2_enabled: bool = Field(default=False, description="공급자 호출에 HTTP/2 사용 여부 (h2 패키지 필요)")
+    rpc_batch_max_concurrency: int = Field(default=8, description="JSON-RPC 배치 요청 안에서 동시에 실행할 최대 호출 수")
+    rpc_compress_min_bytes: int = Field(default=1024, description="이 크기(바이트) 이상인 /rpc 응답만 Accept-Encoding(zstd/gzip)에 따라 압축")
+    rpc_max_body_bytes: int = Field(default=10 * 1024 * 1024, description="/rpc 요청 본문의 최대 크기(바이트, 압축 해제 후 기준), 넘으면 413")
+    fare_cache_enabled: bool = Field(default=True, description="공급자 응답 캐시 사용 여부")
+    fare_cache_ttl_seconds: float = Field(default=300.0, description="공급자 응답 캐시의 기본 TTL(초)")
+    fare_cache_provider_ttls: Dict[str, float] = Field(
+        default_factory=dict,
+        description="공급자 이름별 캐시 TTL(초), 예: {\"skyscanner\": 120}. 없으면 fare_cache_ttl_seconds 사용",
+    )
+    fare_cache_stale_seconds: float = Field(default=600.0, description="TTL 경과 후에도 백그라운드 갱신 동안 제공할 시간(초)")
+    fare_cache_max_entries: int = Field(default=2048, description="캐시에 보관할 최대 항목 수 (LRU 제거)")
+    fare_cache_max_bytes: int = Field(default=32 * 1024 * 1024, description="캐시가 사용할 대략적인 최대 메모리(바이트)")
+    fare_history_enabled: bool = Field(default=True, description="공급자 견적을 운임 이력/최저가 달력에 기록할지 여부")
+    fare_history_path: Optional[str] = Field(default=None, description="운임 이력 SQLite 파일 경로, 없으면 프로세스 메모리에만 보관")
+    prewarm_enabled: bool = Field(default=False, description="인기 노선의 다가오는 날짜 구간을 백그라운드에서 주기적으로 미리 캐싱할지 여부")
+    prewarm_routes: List[str] = Field(
+        default_factory=lambda: ["ICN-CDG", "ICN-NRT", "ICN-JTR", "ICN-DPS", "ICN-KEF", "ICN-MLE"],
+        description="사전 캐싱할 노선 목록(\"출발지-도착지\"), 기본값은 FE 추천 여행지",
+    )
+    prewarm_months_ahead: int = Field(default=2, description="사전 캐싱할 개월 수 (이번 달 포함)")
+    prewarm_durations: List[int] = Field(default_factory=lambda: [3, 5, 7], description="사전 캐싱할 여행 기간(일) 목록")
+    prewarm_windows_per_month: int = Field(default=5, description="월 x 여행 기간마다 사전 캐싱할 출발일 수 (BE 유연 검색과 같은 값이어야 함)")
+    prewarm_interval_seconds: float = Field(default=240.0, description="사전 캐싱 주기(초), 캐시 TTL보다 짧아야 항상 신선한 항목이 남음")
+    prewarm_jitter_seconds: float = Field(default=30.0, description="검색마다/주기마다 더하는 무작위 지연의 최대값(초), 공급자 호출이 한꺼번에 몰리지 않도록 함")
+    prewarm_max_concurrency: int = Field(default=2, description="사전 캐싱에서 동시에 실행할 최대 검색 수")
+    provider_rate_limits: Dict[str, float] = Field(
+        default_factory=dict,
+        description="공급자 이름별 초당 최대 호출 수, 예: {\"skyscanner\": 5}. 없으면 제한 없음",
+    )
+    provider_rate_bursts: Dict[str, int] = Field(
+        default_factory=dict,
+        description="공급자 이름별 순간 최대 호출 수(토큰 버킷 크기), 없으면 초당 호출 수와 같음",
+    )
+    circuit_breaker_enabled: bool = Field(default=True, description="공급자별 회로 차단기 사용 여부")
+    circuit_breaker_window: int = Field(default=20, description="오류율/지연을 계산할 최근 호출 수")
+    circuit_breaker_min_calls: int = Field(default=5, description="회로를 열기 전에 필요한 최소 호출 수")
+    circuit_breaker_error_rate: float = Field(default=0.5, description="회로를 여는 최근 오류 비율 (0~1)")
+    circuit_breaker_slow_call_ms: float = Field(default=5000.0, description="느린 호출로 간주할 소요 시간(ms)")
+    circuit_breaker_slow_rate: float = Field(default=0.8, description="회로를 여는 최근 느린 호출 비율 (0~1)")
+    circuit_breaker_open_seconds: float = Field(default=30.0, description="회로가 열린 뒤 시험 호출을 보내기까지 기다리는 시간(초)")
+    hedge_enabled: bool = Field(default=False, description="첫 요청이 지연 백분위수를 넘으면 같은 요청을 한 번 더 보낼지 여부")
+    hedge_percentile: float = Field(default=0.95, description="헤지 요청을 보낼 기준 지연 백분위수 (0~1)")
+    hedge_min_delay_ms: float = Field(default=50.0, description="헤지 요청을 보내기 전 최소 대기 시간(ms)")
+    ranking_top_k: int = Field(default=20, description="searchFlights 결과에 담을 기본 상위 항공편 수")
+    ranking_max_top_k: int = Field(default=200, description="요청 파라미터 top_k로 지정할 수 있는 최대값")
+    ranking_weights: Dict[str, float] = Field(
+        default_factory=dict,
+        description="랭킹 기준별 기본 가중치, 예: {\"price\": 1, \"duration\": 0.3, \"stops\": 0.2, \"airline\": 0.1}",
+    )
+    preferred_airlines: List[str] = Field(default_factory=list, description="랭킹에서 벌점을 받지 않는 선호 항공사 이름 목록")
+    default_currency: str = Field(default="KRW", description="가격 정규화를 위한 통화(currency) 설정값, 모든 가격을 이 통화의 정수 보조 단위로 변환")
+    fx_rates_path: Optional[str] = Field(default=None, description="환율표 JSON 파일 경로, 없으면 mcp_server/data/fx_rates.json 사용")
+    trace_sample_rate: float = Field(default=1.0, description="새로 시작하는 트레이스 중 기록할 비율(0~1), traceparent로 받은 트레이스는 상위 서비스의 결정을 따름")
+    trace_export_path: Optional[str] = Field(default=None, description="샘플링된 스팬을 추가 기록할 파일 경로, 없으면 내보내지 않음 (traceparent 전달은 계속됨)")
+    trace_export_format: str = Field(default="jsonl", description="스팬 파일 형식: jsonl(스팬 하나당 한 줄) / otlp(OTLP/JSON, Collector otlpjsonfile 수신기 형식)")
     enable_mock_providers: bool = Field(
         default=True,
         description="외부 제공자 호출 실패 또는 키 누락 시 합성(가짜) 데이터 반환",
@@ -0,0 +1,66 @@
+#타입 어노테이션 평가 방식을 변화시키는 모듈
+from __future__ import annotations
+
+#선택적 의존성(h2) 설치 여부를 확인하기 위한 모듈
+import importlib.util
+
+#로그를 분류하고 관리하기 위한 모듈
+import logging
+
+#타입 힌트로 사용되는 모듈
+from typing import Dict, Iterable
+
+#URL에서 scheme/host/port만 뽑아내기 위한 모듈
+from urllib.parse import urlsplit
+
+#HTTP 클라이언트 라이브러리
+import httpx
+
+#MCP 서버 설정 클래스
+from mcp_server.core.config import MCPSettings
+
+logger = logging.getLogger(__name__)
+
+"""모든 어댑터가 함께 쓰는 커넥션 풀(httpx.AsyncClient)을 만드는 모듈"""
+
+#HTTP/2 사용 여부 결정, h2 패키지가 없으면 경고 후 HTTP/1.1로 동작
+def _http2_available(settings: MCPSettings) -> bool:
+    if not settings.http2_enabled:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP2_ENABLED is set but the 'h2' package is not installed. Falling back to HTTP/1.1.")
+        return False
+    return True
+
+#URL에서 httpx mount 패턴으로 쓸 origin(scheme://host[:port])만 추출
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+#공급자 호스트별로 연결 수를 제한하는 공유 AsyncClient 생성
+#각 공급자 origin마다 별도 transport를 mount해서 호스트당 최대 연결 수를 보장하고,
+#그 외 호스트는 전체 풀(http_max_connections)을 사용한다
+def create_http_client(settings: MCPSettings, base_urls: Iterable[str] = ()) -> httpx.AsyncClient:
+    http2 = _http2_available(settings)
+    keepalive_expiry = settings.http_keepalive_expiry_seconds
+
+    #호스트 한 곳에 대한 연결 제한
+    host_limits = httpx.Limits(
+        max_connections=settings.http_max_connections_per_host,
+        max_keepalive_connections=min(settings.http_max_keepalive_connections, settings.http_max_connections_per_host),
+        keepalive_expiry=keepalive_expiry,
+    )
+    mounts: Dict[str, httpx.AsyncBaseTransport] = {
+        _origin(url): httpx.AsyncHTTPTransport(limits=host_limits, http2=http2) for url in base_urls if url
+    }
+
+    return httpx.AsyncClient(
+        timeout=settings.provider_timeout_seconds,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        http2=http2,
+        mounts=mounts,
+    )
@@ -0,0 +1,22 @@
+#서비스 공용 지표 레지스트리
+from shared.metrics import Registry
+
+#MCP 서버 전역 지표 레지스트리와 지표 정의
+REGISTRY = Registry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "mcp_http_request_duration_seconds", "HTTP request latency by route", ("route", "method", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge("mcp_http_requests_in_flight", "HTTP requests currently being served")
+RPC_METHOD_DURATION = REGISTRY.histogram(
+    "mcp_rpc_method_duration_seconds", "JSON-RPC method latency", ("method", "outcome")
+)
+PROVIDER_CALL_DURATION = REGISTRY.histogram(
+    "mcp_provider_call_duration_seconds", "Provider adapter call latency by result status", ("provider", "status")
+)
+PROVIDER_MOCK_FALLBACKS = REGISTRY.counter(
+    "mcp_provider_mock_fallbacks_total", "Mock responses served instead of a provider response", ("provider", "reason")
+)
+FARE_CACHE_LOOKUPS = REGISTRY.counter(
+    "mcp_fare_cache_lookups_total", "Fare cache lookups by result", ("provider", "state")
+)
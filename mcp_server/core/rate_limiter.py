@@ -0,0 +1,132 @@
+#타입 어노테이션 평가 방식을 변화시키는 모듈
+from __future__ import annotations
+
+#대기 중인 호출을 깨우기 위한 비동기 모듈
+import asyncio
+
+#우선순위가 높은(값이 작은) 호출부터 꺼내기 위한 힙 모듈
+import heapq
+
+#같은 우선순위 안에서 먼저 온 호출이 먼저 나가도록 순번을 매기기 위한 모듈
+import itertools
+
+#토큰 충전량과 대기 시간을 측정하기 위한 모듈
+import time
+
+#현재 요청의 우선순위를 호출 경로 전체에 전달하기 위한 컨텍스트 변수
+from contextvars import ContextVar
+
+#타입 힌트로 사용되는 모듈
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+#프로젝트 환경설정 클래스
+from mcp_server.core.config import MCPSettings
+
+#호출 우선순위 (값이 작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_REFRESH = 5
+PRIORITY_PREWARM = 10
+
+#현재 작업의 공급자 호출 우선순위 (기본값: 사용자 검색)
+#백그라운드 갱신/사전 캐싱 태스크는 시작할 때 자신의 우선순위로 바꿔 둔다
+request_priority: ContextVar[int] = ContextVar("request_priority", default=PRIORITY_INTERACTIVE)
+
+#공급자 한 곳의 호출 속도를 제한하는 토큰 버킷 + 우선순위 대기열
+#초당 rate개씩 토큰이 쌓이고(최대 burst개), 토큰이 없으면 우선순위 순서대로 기다린다
+class PriorityRateLimiter:
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        #대기열 항목: (우선순위, 순번, 토큰을 받으면 완료되는 future)
+        self._queue: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+        #대기 시간 통계
+        self.acquired = 0
+        self.queued = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    #설정에 공급자 호출 속도가 지정되어 있을 때만 제한기 생성 (없으면 None = 제한 없음)
+    @classmethod
+    def for_provider(cls, settings: MCPSettings, name: str) -> Optional["PriorityRateLimiter"]:
+        rate = settings.provider_rate_limits.get(name)
+        if not rate:
+            return None
+        return cls(rate, settings.provider_rate_bursts.get(name, max(1, int(rate))))
+
+    #토큰 1개를 받을 때까지 기다림, priority가 없으면 현재 컨텍스트의 우선순위 사용
+    async def acquire(self, priority: Optional[int] = None) -> None:
+        started = self.clock()
+        if not self._queue and self._take():
+            self._record_wait(0.0)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        priority = request_priority.get() if priority is None else priority
+        heapq.heappush(self._queue, (priority, next(self._sequence), future))
+        self.queued += 1
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        #취소된 경우 future도 취소되어 대기열에서 건너뜀
+        #토큰을 이미 받은 뒤(future 완료 후 깨어나기 전)에 취소되면 쓰지 않은 토큰을 버킷에 돌려줌
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+        self._record_wait((self.clock() - started) * 1000)
+
+    #기다리지 않고 토큰을 받을 수 있을 때만 True (헤지 요청처럼 생략 가능한 호출용)
+    def try_acquire(self) -> bool:
+        if self._queue or not self._take():
+            return False
+        self._record_wait(0.0)
+        return True
+
+    #/health에 노출할 대기열/대기 시간 통계
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "queue_length": sum(1 for _, _, future in self._queue if not future.done()),
+            "acquired": self.acquired,
+            "queued": self.queued,
+            "avg_wait_ms": round(self.total_wait_ms / self.acquired, 2) if self.acquired else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 2),
+        }
+
+    #대기열이 빌 때까지 토큰이 생기는 대로 우선순위 순서로 future를 완료
+    async def _dispatch(self) -> None:
+        while self._queue:
+            if self._queue[0][2].done():
+                heapq.heappop(self._queue)
+                continue
+            if self._take():
+                heapq.heappop(self._queue)[2].set_result(None)
+                continue
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    #토큰을 충전한 뒤 1개가 있으면 꺼냄
+    def _take(self) -> bool:
+        now = self.clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    #사용하지 않은 토큰 1개를 되돌림 (burst를 넘지 않음)
+    def _release(self) -> None:
+        self._tokens = min(float(self.burst), self._tokens + 1)
+
+    def _record_wait(self, wait_ms: float) -> None:
+        self.acquired += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
@@ -0,0 +1,5 @@
+#서비스 공용 트레이서
+from shared.tracing import Tracer
+
+#MCP 서버 전역 트레이서 (앱 lifespan에서 설정값으로 configure)
+TRACER = Tracer("mcp_server")
@@ -1,54 +1,423 @@
 # 타입 힌트를 나중에 평가하도록 해서 최신 문법·순환 참조 문제를 줄임
 from __future__ import annotations
 
-from fastapi import FastAPI, HTTPException
+# 배치 요청의 각 호출을 동시에 실행하기 위한 비동기 모듈
+import asyncio
+
+# JSON-RPC 메서드 처리 시간을 측정하기 위한 모듈
+import time
+
+# 앱 시작/종료 시점에 자원을 관리하는 lifespan을 만들기 위한 데코레이터
+from contextlib import asynccontextmanager
+
+# 공급자별 상태 데이터 클래스를 dict로 변환하기 위한 함수
+from dataclasses import asdict
+
+# 운임 달력/추이 조회 기간 파싱
+from datetime import date
+
+# lifespan 제너레이터의 타입 힌트
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+# /metrics로 내보내는 지표와 라우트별 요청 시간 기록 미들웨어
+from mcp_server.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT, REGISTRY, RPC_METHOD_DURATION
+from shared.metrics import CONTENT_TYPE, MetricsMiddleware
+# BE에서 받은 traceparent를 이어 받아 단계별 스팬을 기록하는 트레이서
+from mcp_server.core.tracing import TRACER
+from shared.tracing import TracingMiddleware
+# 요청/응답 본문 형식(JSON/msgpack)과 압축(zstd/gzip) 협상, orjson 기반 직렬화
+from shared.wire import FAST_JSON_RESPONSE, BodyTooLargeError, decode_body, dumps_json, encode_body
 # 프로젝트 공통 설정을 가져오는 설정 로더 함수
 from mcp_server.core.config import get_settings
+# 모든 어댑터가 함께 쓰는 공유 커넥션 풀 생성 함수
+from mcp_server.core.http_client import create_http_client
 # MCP서버가 따르는 JSON-RPC 프로토콜용 자료형과 예외
-from mcp_server.protocols.json_rpc import JSONRPCError, JSONRPCException, JSONRPCRequest, JSONRPCResponse
+from mcp_server.protocols.json_rpc import (
+    INTERNAL_ERROR,
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    JSONRPCError,
+    JSONRPCException,
+    JSONRPCRequest,
+    JSONRPCResponse,
+    is_notification,
+    parse_request,
+    request_id_of,
+)
 # 외부 항공권 API 통합 호출 서비스
 from mcp_server.services.api_integrator import FlightAPIIntegrator
-# 항공권 리스트에서 최저가 항공권을 분석하는 서비스
-from mcp_server.services.flight_analyzer import FlightAnalyzer
+# 항공권 리스트에서 최저가/상위 K개 항공권을 분석하는 서비스
+from mcp_server.services.flight_analyzer import FlightAnalyzer, RankingWeights
+# 스트리밍 검색에서 공급자 응답을 도착 순서대로 이어서 병합하는 클래스
+from mcp_server.services.itinerary_merger import ItineraryMerger
+# 월(YYYY-MM)을 조회 기간으로 바꾸는 함수
+from mcp_server.services.fare_history import month_range
+# 검색 파라미터 정규화/검증 함수 (스트리밍 검색 시작 전 검증)
+from mcp_server.services.search_params import normalize_search_params
+# 인기 노선을 주기적으로 미리 캐싱하는 스케줄러
+from mcp_server.services.cache_prewarmer import CachePrewarmer
 
-# FastAPI 앱 인스턴스를 생성
-# 모든 엔드포인트(@app.get, @app.post)는 이 객체에 등록
-app = FastAPI(title="MCP Server")
 # 여러 항공권 API들을 통합해서 호출
 integrator = FlightAPIIntegrator()
 # 항공편 리스트를 분석
 analyzer = FlightAnalyzer()
+# 인기 노선 사전 캐싱 (PREWARM_ENABLED일 때만 lifespan에서 시작)
+prewarmer = CachePrewarmer(integrator)
+
+# 앱 시작 시 공유 HTTP 커넥션 풀을 만들어 모든 어댑터에 주입하고, 종료 시 깔끔하게 닫음
+# 요청마다 TCP+TLS 연결을 새로 맺지 않고 keep-alive 연결을 재사용
+# 트레이스 샘플링 비율/내보내기 파일도 여기서 설정하고, 종료 시 남은 스팬을 기록
+# 사전 캐싱 스케줄러는 공유 클라이언트를 주입한 뒤 시작하고, 클라이언트를 닫기 전에 멈춤
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    TRACER.configure(settings)
+    http_client = create_http_client(settings, integrator.base_urls())
+    integrator.bind_http_client(http_client)
+    prewarmer.start()
+    try:
+        yield
+    finally:
+        await prewarmer.stop()
+        integrator.bind_http_client(None)
+        await http_client.aclose()
+        TRACER.shutdown()
+
+# FastAPI 앱 인스턴스를 생성
+# 모든 엔드포인트(@app.get, @app.post)는 이 객체에 등록
+# 기본 응답 클래스는 orjson 직렬화 (orjson이 없으면 표준 JSONResponse)
+app = FastAPI(title="MCP Server", lifespan=lifespan, default_response_class=FAST_JSON_RESPONSE)
+# 라우트별 요청 처리 시간 / 진행 중인 요청 수 기록
+app.add_middleware(MetricsMiddleware, duration=HTTP_REQUEST_DURATION, in_flight=HTTP_REQUESTS_IN_FLIGHT)
+# 요청마다 루트 스팬 생성 (traceparent 헤더가 있으면 BE의 트레이스를 이어 받음)
+app.add_middleware(TracingMiddleware, tracer=TRACER)
+
+# 지표에 기록하는 JSON-RPC 메서드 이름
+RPC_METHODS = ("searchFlights", "getFareCalendar", "getFareTrend")
+
+# getFareCalendar로 한 번에 조회할 수 있는 최대 일수
+MAX_CALENDAR_DAYS = 366
 
 # JSON-RPC 요청을 처리하는 엔드포인트
-# 요청 Body를 JSONRPCRequest 모델로 자동 검증 받고
-# 응답도 JSONRPCResponse 모델 형식으로 반환하는 비동기 함수
-@app.post("/rpc", response_model=JSONRPCResponse)
-async def handle_json_rpc(request: JSONRPCRequest) -> JSONRPCResponse:
-    # 모든 JSON-RPC 처리 과정에서 발생하는 예외를 잡아서 에러응답으로 반환
-    try:
-        # method 값이 searchFlights일 때만 실제 항공권 검색 로직을 실행
-        if request.method == "searchFlights":
-            params = request.params or {} # params가 None일 경우 오류가 나지않도록 빈 dict로 대체
-            # 외부 API에서 항공권 검색하고 리스트를 받아옴
-            flights = await integrator.search_flights(params)
-            # 받아온 항공권 리스트에서 최저가 항공권을 분석
-            cheapest = analyzer.find_cheapest(flights)
-            # JSON-RPC규격을 따르는 응답 생성
-            return JSONRPCResponse(result={"flights": flights, "cheapest": cheapest}, id=request.id)
-        # searchFlights 외의 method가 들어오면 JSON-RPC 방식으로 예외 반환
-        raise JSONRPCException(JSONRPCError(code=-32601, message="Method not found"))
-    # JSON-RPC 예외는 JSON-RPC 응답 형식으로 반환
-    except JSONRPCException as exc:
-        return JSONRPCResponse(result=None, id=request.id, error=exc.error)
+# 요청 Body는 JSON-RPC 요청 객체 하나 또는 여러 요청을 담은 배치 배열
+# 배치의 각 호출은 동시에 실행되고, 응답은 요청 순서대로 하나의 배열로 반환된다
+# 알림(id 없는 호출)은 실행만 하고 응답하지 않으며, 응답할 것이 없으면 204를 반환
+# 본문은 Content-Type(JSON/msgpack)과 Content-Encoding(zstd/gzip)에 맞게 읽고,
+# 응답은 Accept / Accept-Encoding 헤더로 협상한 형식과 압축으로 보낸다
+@app.post("/rpc")
+async def handle_json_rpc(request: Request) -> Response:
+    # 본문을 해제/파싱할 수 없으면 Parse error 응답, 해제한 본문이 너무 크면 413
+    try:
+        payload = _decode_request(request, await request.body())
+    except BodyTooLargeError:
+        return _body_too_large(request)
+    except ValueError:
+        return _rpc_response(request, _error_response(None, PARSE_ERROR, "Parse error"))
+
+    # 배치 요청: 빈 배열은 Invalid Request 단건 응답
+    if isinstance(payload, list):
+        if not payload:
+            return _rpc_response(request, _error_response(None, INVALID_REQUEST, "Invalid Request"))
+        responses = [response for response in await _handle_batch(payload) if response is not None]
+        return _rpc_response(request, responses) if responses else Response(status_code=204)
+
+    # 단건 요청
+    try:
+        response = await _handle_entry(payload)
     # 예상하지 못한 모든 오류는 HTTP 500 서버 에러로 변환
     except Exception as exc:  # pragma: no cover - placeholder for better error handling
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+    return _rpc_response(request, response) if response is not None else Response(status_code=204)
+
+# 배치의 요청들을 동시에 실행, rpc_batch_max_concurrency로 동시 실행 수를 제한
+# 한 호출의 예상치 못한 오류는 해당 호출만 Internal error로 응답하고 나머지는 정상 처리
+async def _handle_batch(entries: List[Any]) -> List[JSONRPCResponse | None]:
+    semaphore = asyncio.Semaphore(max(1, get_settings().rpc_batch_max_concurrency))
+
+    async def run(entry: Any) -> JSONRPCResponse | None:
+        async with semaphore:
+            try:
+                return await _handle_entry(entry)
+            except Exception as exc:
+                response = _error_response(request_id_of(entry), INTERNAL_ERROR, "Internal error")
+                response.error.data = {"detail": str(exc)}
+                return None if is_notification(entry) else response
+
+    return list(await asyncio.gather(*(run(entry) for entry in entries)))
+
+# 요청 객체 하나를 검증하고 실행, 알림이면 None 반환
+async def _handle_entry(entry: Any) -> JSONRPCResponse | None:
+    try:
+        rpc_request = parse_request(entry)
+    # 구조가 잘못된 요청은 알림 여부와 관계없이 오류 응답
+    except JSONRPCException as exc:
+        return JSONRPCResponse(result=None, id=request_id_of(entry), error=exc.error)
+    response = await dispatch(rpc_request)
+    return None if is_notification(entry) else response
+
+# 검증된 JSON-RPC 요청 하나를 method에 맞게 실행하고 응답을 만드는 함수
+async def dispatch(request: JSONRPCRequest) -> JSONRPCResponse:
+    started = time.perf_counter()
+    outcome = "error"
+    # 메서드 실행 구간을 스팬으로 기록 (공급자 호출/분석 스팬의 부모)
+    with TRACER.span(f"rpc {request.method}", {"rpc.method": request.method}) as span:
+        # JSON-RPC 처리 과정에서 발생하는 JSON-RPC 예외를 잡아서 에러응답으로 반환
+        try:
+            params = request.params or {} # params가 None일 경우 오류가 나지않도록 빈 dict로 대체
+            # method 값이 searchFlights일 때 실제 항공권 검색 로직을 실행
+            if request.method == "searchFlights":
+                result = await search_flights(params)
+            # 운임 이력 조회 (공급자를 호출하지 않음)
+            elif request.method == "getFareCalendar":
+                result = await get_fare_calendar(params)
+            elif request.method == "getFareTrend":
+                result = await get_fare_trend(params)
+            # 그 외의 method가 들어오면 JSON-RPC 방식으로 예외 반환
+            else:
+                raise JSONRPCException(JSONRPCError(code=METHOD_NOT_FOUND, message="Method not found"))
+            outcome = "ok"
+            return JSONRPCResponse(result=result, id=request.id)
+        # JSON-RPC 예외는 JSON-RPC 응답 형식으로 반환
+        except JSONRPCException as exc:
+            span.set("rpc.error_code", exc.error.code)
+            return JSONRPCResponse(result=None, id=request.id, error=exc.error)
+        # 메서드별 처리 시간 기록 (알 수 없는 메서드는 레이블이 늘어나지 않도록 하나로 묶음)
+        finally:
+            method = request.method if request.method in RPC_METHODS else "unknown"
+            RPC_METHOD_DURATION.observe(time.perf_counter() - started, method, outcome)
+
+# searchFlights 메서드의 실제 처리 함수
+# 결과의 flights는 전체 항공편이 아니라 랭킹 점수 기준 상위 top_k개 (total은 랭킹 전 전체 개수)
+async def search_flights(params: Dict[str, Any]) -> Dict[str, Any]:
+    # 랭킹 옵션(top_k, weights, preferred_airlines)은 공급자 검색/캐시 키에 영향을 주지 않음
+    top_k, weights, preferred_airlines = _ranking_options(params)
+    # 외부 API들을 동시에 호출해서 항공권 리스트와 공급자별 상태를 받아옴
+    # 마감 시간을 넘긴 공급자가 있어도 나머지 공급자의 결과는 그대로 반환됨
+    with TRACER.span("integrator.search_flights") as span:
+        outcome = await integrator.search_flights(params)
+        span.set("flights", len(outcome.flights))
+    # 받아온 항공권 리스트에서 최저가 항공권과 상위 K개를 분석
+    with TRACER.span("analyzer.rank", {"flights": len(outcome.flights), "top_k": top_k}):
+        cheapest = analyzer.find_cheapest(outcome.flights)
+        ranked = analyzer.rank(outcome.flights, top_k, weights, preferred_airlines)
+    # JSON-RPC규격을 따르는 결과 생성 (providers: 공급자별 ok/timeout/error 및 소요 시간)
+    return {
+        "flights": ranked,
+        "total": len(outcome.flights),
+        "cheapest": cheapest,
+        "providers": [asdict(status) for status in outcome.providers],
+    }
+
+# 요청 파라미터와 설정값으로 랭킹 옵션을 만든다 (잘못된 값은 Invalid params 오류)
+def _ranking_options(params: Dict[str, Any]) -> tuple[int, RankingWeights, List[str]]:
+    settings = get_settings()
+    try:
+        # top_k를 보내지 않았을 때만 기본값 (0, 음수도 그대로 검증해서 거부)
+        top_k = params.get("top_k")
+        top_k = settings.ranking_top_k if top_k is None else int(top_k)
+        weights = RankingWeights().merged(settings.ranking_weights).merged(params.get("weights"))
+        preferred_airlines = params.get("preferred_airlines") or settings.preferred_airlines
+        # 항공사 이름 하나를 문자열로 보낸 경우 글자 단위로 나누지 않도록 목록으로 감쌈
+        if isinstance(preferred_airlines, str):
+            preferred_airlines = [preferred_airlines]
+        preferred_airlines = [str(airline) for airline in preferred_airlines]
+    except (TypeError, ValueError, AttributeError) as exc:
+        raise JSONRPCException(JSONRPCError(code=INVALID_PARAMS, message="Invalid params", data={"detail": str(exc)}))
+    if top_k < 1:
+        raise JSONRPCException(JSONRPCError(code=INVALID_PARAMS, message="Invalid params", data={"detail": "top_k must be >= 1"}))
+    return min(top_k, settings.ranking_max_top_k), weights, preferred_airlines
+
+# getFareCalendar 메서드: 운임 이력에 쌓인 견적으로 만든 노선의 출발일별 최저가 달력
+# params: origin, destination, month(YYYY-MM) 또는 start_date/end_date(YYYY-MM-DD), currency(선택, 기본 DEFAULT_CURRENCY)
+# 각 날짜의 min_price는 지금까지 관측된 최저가, latest_price는 가장 최근 견적 묶음의 최저가
+async def get_fare_calendar(params: Dict[str, Any]) -> Dict[str, Any]:
+    store = _fare_history()
+    origin, destination, currency = _route_params(params)
+    try:
+        if params.get("month"):
+            start, end = month_range(str(params["month"]))
+        else:
+            start = date.fromisoformat(str(params["start_date"]))
+            end = date.fromisoformat(str(params.get("end_date") or params["start_date"]))
+    except (KeyError, ValueError) as exc:
+        raise _invalid_params(f"month or start_date/end_date required: {exc}")
+    if end < start or (end - start).days >= MAX_CALENDAR_DAYS:
+        raise _invalid_params(f"date range must be 1 to {MAX_CALENDAR_DAYS} days")
+    with TRACER.span("fare_history.calendar", {"origin": origin, "destination": destination}):
+        days = await asyncio.to_thread(store.calendar, origin, destination, start, end, currency)
+    return {
+        "origin": origin,
+        "destination": destination,
+        "currency": currency,
+        "days": days,
+        "cheapest": min(days, key=lambda day: day["min_price"], default=None),
+    }
+
+# getFareTrend 메서드: 특정 출발일 운임의 관측일별 최저가 추이
+# params: origin, destination, departure_date, days(선택, 최근 며칠, 기본 30), currency(선택)
+async def get_fare_trend(params: Dict[str, Any]) -> Dict[str, Any]:
+    store = _fare_history()
+    origin, destination, currency = _route_params(params)
+    try:
+        departure_date = date.fromisoformat(str(params["departure_date"]))
+        days = int(params.get("days") or 30)
+    except (KeyError, TypeError, ValueError) as exc:
+        raise _invalid_params(f"departure_date required: {exc}")
+    if days < 1:
+        raise _invalid_params("days must be >= 1")
+    with TRACER.span("fare_history.trend", {"origin": origin, "destination": destination}):
+        points = await asyncio.to_thread(store.trend, origin, destination, departure_date, currency, days)
+    return {
+        "origin": origin,
+        "destination": destination,
+        "departure_date": departure_date.isoformat(),
+        "currency": currency,
+        "points": points,
+    }
+
+# 운임 이력 저장소, 비활성화(FARE_HISTORY_ENABLED=false)되어 있으면 Internal error
+def _fare_history() -> Any:
+    if integrator.fare_history is None:
+        raise JSONRPCException(JSONRPCError(code=INTERNAL_ERROR, message="Fare history is disabled"))
+    return integrator.fare_history
+
+# 운임 이력 조회 공통 파라미터 (출발지, 도착지, 통화), 공항 코드는 대문자로 정규화
+def _route_params(params: Dict[str, Any]) -> tuple[str, str, str]:
+    origin = str(params.get("origin") or "").strip().upper()
+    destination = str(params.get("destination") or "").strip().upper()
+    if not origin or not destination:
+        raise _invalid_params("origin and destination are required")
+    currency = str(params.get("currency") or get_settings().default_currency).strip().upper()
+    return origin, destination, currency
+
+def _invalid_params(detail: str) -> JSONRPCException:
+    return JSONRPCException(JSONRPCError(code=INVALID_PARAMS, message="Invalid params", data={"detail": detail}))
+
+# searchFlights의 스트리밍 버전 엔드포인트 (NDJSON, 한 줄에 이벤트 하나)
+# 공급자가 응답할 때마다 provider 이벤트를 보내고, 마지막에 최저가와 공급자별 상태를 담은 summary 이벤트를 보낸다
+# 요청 Body는 단건 JSON-RPC 요청이며, 잘못된 요청은 일반 JSON-RPC 오류 응답으로 반환
+@app.post("/rpc/stream")
+async def handle_json_rpc_stream(request: Request) -> Response:
+    try:
+        payload = _decode_request(request, await request.body())
+    except BodyTooLargeError:
+        return _body_too_large(request)
+    except ValueError:
+        return _rpc_response(request, _error_response(None, PARSE_ERROR, "Parse error"))
+    try:
+        rpc_request = parse_request(payload)
+    except JSONRPCException as exc:
+        return _rpc_response(request, JSONRPCResponse(result=None, id=request_id_of(payload), error=exc.error))
+    if rpc_request.method != "searchFlights":
+        return _rpc_response(request, _error_response(rpc_request.id, METHOD_NOT_FOUND, "Method not found"))
+    # 스트림을 시작한 뒤에는 오류 응답을 보낼 수 없으므로 파라미터를 먼저 검증
+    try:
+        normalize_search_params(rpc_request.params or {})
+    except JSONRPCException as exc:
+        return _rpc_response(request, JSONRPCResponse(result=None, id=rpc_request.id, error=exc.error))
+
+    return StreamingResponse(
+        _stream_search_events(rpc_request.params or {}, rpc_request.id),
+        media_type="application/x-ndjson",
+    )
+
+# 스트리밍 검색 이벤트를 NDJSON 줄 단위로 생성하는 제너레이터
+# 공급자 응답이 올 때마다 앞서 보낸 결과와 이어서 병합해서 같은 여정은 한 번만 보낸다
+# - flights: 처음 등장한 여정 (앞서 보낸 여정 수 + 순서가 곧 전체 결과 안의 위치)
+# - updated: 이미 보낸 여정 중 더 싼 판매처가 오거나 alternates가 늘어난 여정 ({"index": 위치, "flight": 병합된 여정})
+async def _stream_search_events(params: Dict[str, Any], request_id: Optional[str | int]) -> AsyncIterator[bytes]:
+    merger = ItineraryMerger()
+    statuses = []
+    async for provider_flights, status in integrator.stream_flights(params):
+        added, changed = merger.add(status.provider, provider_flights)
+        statuses.append(status)
+        yield _ndjson_line(
+            {
+                "id": request_id,
+                "event": "provider",
+                "provider": asdict(status),
+                "flights": added,
+                "updated": [{"index": position, "flight": merger.merged[position]} for position in changed],
+            }
+        )
+    yield _ndjson_line(
+        {
+            "id": request_id,
+            "event": "summary",
+            "cheapest": analyzer.find_cheapest(merger.merged),
+            "count": len(merger.merged),
+            "providers": [asdict(status) for status in statuses],
+        }
+    )
+
+# 이벤트 하나를 NDJSON 한 줄(bytes)로 직렬화
+def _ndjson_line(event: Dict[str, Any]) -> bytes:
+    return dumps_json(event) + b"\n"
+
+# 오류 코드와 메시지로 JSON-RPC 오류 응답 생성
+def _error_response(request_id: Any, code: int, message: str) -> JSONRPCResponse:
+    return JSONRPCResponse(result=None, id=request_id, error=JSONRPCError(code=code, message=message))
+
+# 요청 본문을 Content-Type / Content-Encoding 헤더에 맞게 파싱 (잘못된 본문은 ValueError)
+# 압축 해제 크기는 rpc_max_body_bytes까지만 허용 (작은 압축 본문이 매우 크게 풀리는 경우 차단)
+def _decode_request(request: Request, body: bytes) -> Any:
+    return decode_body(
+        body,
+        request.headers.get("content-type"),
+        request.headers.get("content-encoding"),
+        get_settings().rpc_max_body_bytes,
+    )
+
+# 본문이 rpc_max_body_bytes를 넘는 요청은 413 + Invalid Request 오류 응답
+def _body_too_large(request: Request) -> Response:
+    response = _rpc_response(request, _error_response(None, INVALID_REQUEST, "Request body too large"))
+    response.status_code = 413
+    return response
+
+# JSON-RPC 응답(단건 또는 배치 list)을 협상한 형식/압축의 HTTP 응답으로 변환
+def _rpc_response(request: Request, content: JSONRPCResponse | List[JSONRPCResponse]) -> Response:
+    payload = [_response_dict(response) for response in content] if isinstance(content, list) else _response_dict(content)
+    body, headers = encode_body(
+        payload,
+        request.headers.get("accept"),
+        request.headers.get("accept-encoding"),
+        get_settings().rpc_compress_min_bytes,
+    )
+    return Response(content=body, headers=headers)
+
+# 응답 데이터 클래스를 dict로 변환
+# asdict는 result 안의 항공편 목록까지 모두 깊은 복사하므로, 최상위 필드만 옮긴다
+def _response_dict(response: JSONRPCResponse) -> Dict[str, Any]:
+    return {
+        "result": response.result,
+        "id": response.id,
+        "jsonrpc": response.jsonrpc,
+        "error": asdict(response.error) if response.error is not None else None,
+    }
 
 # HTTP GET /health 요청이 들어왔을 때 실행되는 헬스체크 엔드포인트
 # 보통 모니터링/로드밸런서가 주기적으로 호출해서 서버가 살아있는지, 기본설정이 정상 로드 되는지 확인시 사용
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> dict[str, Any]:
     # 환경변수/설정 파일에서 읽어온 Settings 객체를 가져옴
     settings = get_settings()
-    # 서버 상태(ok)와 현재 사용 중인 기본 통화 코드를 함께 반환
-    return {"status": "ok", "currency": settings.default_currency}
+    # 서버 상태(ok)와 현재 사용 중인 기본 통화 코드, 캐시 히트/미스 및 요청 병합 통계,
+    # 공급자별 회로 차단기 상태와 헤지 요청 수, 사전 캐싱 스케줄/마지막 실행 통계를 함께 반환
+    return {
+        "status": "ok",
+        "currency": settings.default_currency,
+        "cache": integrator.cache.stats() if integrator.cache is not None else None,
+        "coalescing": integrator.single_flight.stats(),
+        "providers": integrator.provider_health(),
+        "fare_history": integrator.fare_history.stats() if integrator.fare_history is not None else None,
+        "prewarm": prewarmer.stats(),
+    }
+
+# Prometheus 형식의 지표 엔드포인트 (요청 시간, 공급자별 호출 시간/결과, 모의 응답 대체 횟수, 캐시 조회 결과)
+@app.get("/metrics")
+async def metrics() -> Response:
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
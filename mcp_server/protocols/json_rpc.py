@@ -48,4 +48,32 @@ class JSONRPCException(Exception):
         #부모 클래스의 생성자 호출 및 오류 객체 저장
         super().__init__(error.message)
         #오류 객체 전체를 속성으로 저장, 예외 발생 시 상세 정보에 접근 가능
-        self.error = error
\ No newline at end of file
+        self.error = error
+
+#JSON-RPC 2.0 표준 오류 코드
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+#요청 객체에 id 멤버가 없으면 알림(notification)이며, 응답을 돌려주지 않는다
+def is_notification(data: Any) -> bool:
+    return isinstance(data, dict) and "id" not in data
+
+#요청 객체에서 id를 꺼냄, id를 알 수 없으면 None (오류 응답의 id는 null)
+def request_id_of(data: Any) -> Optional[str | int]:
+    request_id = data.get("id") if isinstance(data, dict) else None
+    return request_id if isinstance(request_id, (str, int)) and not isinstance(request_id, bool) else None
+
+#JSON으로 파싱된 요청 객체 하나를 검증해서 JSONRPCRequest로 변환
+#구조가 잘못되었거나 jsonrpc 멤버가 정확히 "2.0"이 아닌 경우 Invalid Request 오류를 예외로 던짐
+def parse_request(data: Any) -> JSONRPCRequest:
+    if not isinstance(data, dict) or data.get("jsonrpc") != "2.0" or not isinstance(data.get("method"), str):
+        raise JSONRPCException(JSONRPCError(code=INVALID_REQUEST, message="Invalid Request"))
+    params = data.get("params")
+    if params is not None and not isinstance(params, dict):
+        raise JSONRPCException(JSONRPCError(code=INVALID_REQUEST, message="Invalid Request"))
+    if "id" in data and data["id"] is not None and request_id_of(data) is None:
+        raise JSONRPCException(JSONRPCError(code=INVALID_REQUEST, message="Invalid Request"))
+    return JSONRPCRequest(method=data["method"], params=params, id=request_id_of(data), jsonrpc=data["jsonrpc"])
@@ -4,8 +4,23 @@ from __future__ import annotations
 # 비동기 프로그래밍을 위한 모듈
 import asyncio
 
+# 비동기 함수 여부를 확인하기 위한 모듈
+import inspect
+
+# 로그를 분류하고 관리하기 위한 모듈
+import logging
+
+# 공급자별 소요 시간을 측정하기 위한 모듈
+import time
+
+# 공급자별 호출 상태를 담는 데이터 클래스를 정의하기 위한 모듈
+from dataclasses import dataclass, field
+
 # 타입 힌트로 사용되는 모듈
-from typing import Any, Dict, List 
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+# HTTP 클라이언트 라이브러리
+import httpx
 
 # ProviderB API 어댑터
 from mcp_server.adapters.api_provider_b_adapter import ProviderBAdapter 
@@ -13,19 +28,305 @@ from mcp_server.adapters.api_provider_b_adapter import ProviderBAdapter
 # Skyscanner API 어댑터
 from mcp_server.adapters.skyscanner_adapter import SkyScannerAdapter
 
+# 프로젝트 환경설정 값을 가져오는 모듈
+from mcp_server.core.config import get_settings
+
+# 사전 캐싱에서 회로가 열린 공급자를 건너뛰기 위한 상태 값
+from mcp_server.core.circuit_breaker import OPEN
+
+# 공급자 호출 시간/결과와 캐시 조회 결과를 기록하는 지표
+from mcp_server.core.metrics import FARE_CACHE_LOOKUPS, PROVIDER_CALL_DURATION
+
+# 공급자 조회/호출 구간을 요청 트레이스의 스팬으로 기록
+from mcp_server.core.tracing import TRACER
+
+# 백그라운드 갱신 호출의 우선순위를 지정하기 위한 컨텍스트 변수
+from mcp_server.core.rate_limiter import PRIORITY_PREWARM, PRIORITY_REFRESH, request_priority
+
+# 공급자 응답을 보관하는 TTL + LRU 캐시
+from mcp_server.services.fare_cache import MISS, STALE, FareCache
+
+# 공급자 견적을 쌓고 출발일별 최저가 달력을 갱신하는 운임 이력 저장소
+from mcp_server.services.fare_history import FareHistoryStore
+
+# 여러 공급자가 판매하는 같은 여정을 하나로 합치는 함수
+from mcp_server.services.itinerary_merger import merge_itineraries
+
+# 공급자 응답 가격을 설정 통화의 정수 보조 단위로 변환하는 클래스
+from mcp_server.services.price_normalizer import PriceNormalizer
+
+# 검색 파라미터 정규화 / 캐시 키 생성 함수
+from mcp_server.services.search_params import normalize_search_params, search_key
+
+# 동시에 들어온 같은 검색을 하나의 공급자 호출로 합치는 유틸리티
+from mcp_server.services.single_flight import SingleFlight
+
+# 공급자 호출 결과 상태 값 (정상 / 마감 시간 초과 / 오류)
+STATUS_OK = "ok"
+STATUS_TIMEOUT = "timeout"
+STATUS_ERROR = "error"
+
+# 사전 캐싱 결과 중 ok/timeout/error 외의 값
+# (캐시가 아직 충분히 신선해서 호출 안 함 / 회로 차단기가 열려 있어 호출 안 함 / 모의 응답이라 저장 안 함)
+PREWARM_WARM = "warm"
+PREWARM_SKIPPED = "skipped"
+PREWARM_MOCK = "mock"
+
+# 공급자 한 곳의 호출 결과를 JSON-RPC 응답에 실어 보내기 위한 데이터 클래스
+@dataclass(slots=True)
+class ProviderStatus:
+    #공급자 이름 (어댑터의 NAME)
+    provider: str
+    #ok / timeout / error 중 하나
+    status: str
+    #호출에 걸린 시간 (밀리초)
+    elapsed_ms: float
+    #해당 공급자가 돌려준 항공편 수
+    count: int = 0
+    #오류가 발생했을 때의 메시지 (선택적)
+    error: Optional[str] = None
+    #캐시에서 제공된 경우 fresh / stale (선택적)
+    cache: Optional[str] = None
+
+# 통합 검색 결과 (병합된 항공편 목록 + 공급자별 상태)
+@dataclass(slots=True)
+class SearchOutcome:
+    flights: List[Dict[str, Any]] = field(default_factory=list)
+    providers: List[ProviderStatus] = field(default_factory=list)
+
 """여러 API 제공자들을 동시에 호출해서 응답을 합치는 클래스"""
 
 class FlightAPIIntegrator:
     
     # 외부에서 adapter를 주입받을 수 있고, 없으면 기본값으로 새로 생성하는 생성자
-    def __init__(self, skyscanner: SkyScannerAdapter | None = None, provider_b: ProviderBAdapter | None = None) -> None:
+    def __init__(
+        self,
+        skyscanner: SkyScannerAdapter | None = None,
+        provider_b: ProviderBAdapter | None = None,
+        cache: FareCache | None = None,
+        fare_history: FareHistoryStore | None = None,
+    ) -> None:
+        self.settings = get_settings()
+        self.logger = logging.getLogger(__name__)
+        # 공급자 응답 캐시 (비활성화 시 None)
+        self.cache = cache if cache is not None else self._build_cache()
+        # 공급자 견적 이력 + 최저가 달력 (비활성화 시 None)
+        self.fare_history = fare_history if fare_history is not None else FareHistoryStore.from_settings(self.settings)
+        # 같은 키에 대한 백그라운드 갱신이 중복 실행되지 않도록 진행 중인 키를 기록
+        self._refreshing: set = set()
+        # 백그라운드 갱신 태스크가 가비지 컬렉션되지 않도록 참조를 보관
+        self._background_tasks: set = set()
+        # 같은 정규화 파라미터로 동시에 들어온 검색은 하나의 공급자 호출을 공유
+        self.single_flight = SingleFlight()
+        # 공급자 응답 가격을 DEFAULT_CURRENCY로 변환 (캐시에는 변환된 결과가 저장됨)
+        self.normalizer = PriceNormalizer.from_settings(self.settings)
         self.skyscanner = skyscanner or SkyScannerAdapter() 
         self.provider_b = provider_b or ProviderBAdapter()
+        # 공급자 이름 -> 어댑터, 등록된 모든 어댑터를 동시에 호출
+        self.adapters: Dict[str, Any] = {}
+        self.register(self.skyscanner)
+        self.register(self.provider_b)
+
+    # 어댑터를 이름(NAME) 기준으로 등록하는 함수
+    def register(self, adapter: Any) -> None:
+        self.adapters[adapter.NAME] = adapter
+
+    # 앱 lifespan이 관리하는 공유 HTTP 클라이언트를 모든 어댑터에 주입 (None이면 주입 해제)
+    def bind_http_client(self, client: httpx.AsyncClient | None) -> None:
+        for adapter in self.adapters.values():
+            adapter.client = client
+
+    # 등록된 어댑터들의 기본 URL 목록 (호스트별 커넥션 풀 구성에 사용)
+    def base_urls(self) -> List[str]:
+        return [getattr(adapter, "base_url", getattr(adapter, "BASE_URL", "")) for adapter in self.adapters.values()]
+
+    # 공급자별 회로 차단기 상태와 헤지 요청 통계 (stats를 제공하는 어댑터만)
+    def provider_health(self) -> Dict[str, Any]:
+        return {name: adapter.stats() for name, adapter in self.adapters.items() if hasattr(adapter, "stats")}
+
+    # 공급자별 마감 시간(초), 별도 설정이 없으면 provider_timeout_seconds를 사용
+    def deadline_for(self, name: str) -> float:
+        return float(self.settings.provider_deadlines.get(name, self.settings.provider_timeout_seconds))
+
+    # 공급자별 캐시 TTL(초), 별도 설정이 없으면 fare_cache_ttl_seconds를 사용
+    def cache_ttl_for(self, name: str) -> float:
+        return float(self.settings.fare_cache_provider_ttls.get(name, self.settings.fare_cache_ttl_seconds))
     
-    # 파라미터를 받아서, 비동기적으로 여러 API를 호출한 뒤, 항공편 리스트를 결과로 돌려주는 함수
-    async def search_flights(self, params: Dict[str, Any]) -> List[Dict[str, Any]]: 
-        skyscanner_results = await asyncio.to_thread(self.skyscanner.search_flights, params) # 동기 함수 호출을 비동기적으로 처리 (skyscanner는 동기 함수)
-        provider_b_results = await self.provider_b.search_flights(params) # 비동기 함수 직접 호출 (provider_b는 비동기 함수)
-        return [*skyscanner_results, *provider_b_results] # 두 결과 리스트를 합쳐서 반환 
-    
-    # 개선사항 현재는 API 순차 실행 -> 병렬 실행으로 변경 가능 (asyncio.gather 등 사용)
\ No newline at end of file
+    # 파라미터를 받아서, 등록된 모든 API를 동시에 호출한 뒤, 항공편 리스트와 공급자별 상태를 돌려주는 함수
+    # 마감 시간을 넘긴 공급자는 결과에서 빠지고, 나머지 공급자의 결과만으로 응답을 만든다
+    # 공급자에는 정규화된 검색 파라미터만 전달하며, 같은 파라미터의 캐시가 있으면 공급자를 호출하지 않는다
+    # 같은 검색이 이미 진행 중이면 새로 호출하지 않고 그 결과를 함께 받는다
+    async def search_flights(self, params: Dict[str, Any]) -> SearchOutcome: 
+        provider_params = normalize_search_params(params)
+        key = search_key(provider_params)
+        return await self.single_flight.do(key, lambda: self._fan_out(provider_params, key))
+
+    # 공급자 응답이 도착하는 순서대로 (항공편 목록, 상태)를 하나씩 내보내는 스트리밍 검색 함수
+    # 가장 빠른 공급자의 결과를 바로 전달할 수 있도록 전체 완료를 기다리지 않는다
+    # 소비자가 중간에 멈추면(연결 끊김) 아직 끝나지 않은 공급자 호출은 취소한다
+    async def stream_flights(self, params: Dict[str, Any]) -> AsyncIterator[Tuple[List[Dict[str, Any]], ProviderStatus]]:
+        provider_params = normalize_search_params(params)
+        key = search_key(provider_params)
+        tasks = [
+            asyncio.ensure_future(self._search_provider(name, adapter, provider_params, key))
+            for name, adapter in self.adapters.items()
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    # 등록된 모든 공급자를 동시에 호출해서 결과를 합치는 함수
+    async def _fan_out(self, params: Dict[str, Any], key: str) -> SearchOutcome:
+        calls = [self._search_provider(name, adapter, params, key) for name, adapter in self.adapters.items()]
+        results = await asyncio.gather(*calls)
+        # 같은 여정은 최저가 판매처 하나로 병합 (다른 판매처는 alternates에 기록)
+        return SearchOutcome(
+            flights=merge_itineraries((status.provider, flights) for flights, status in results),
+            providers=[status for _, status in results],
+        )
+
+    # 캐시를 먼저 확인하고, 없을 때만 공급자를 호출하는 함수
+    # TTL이 지난(stale) 항목은 그대로 제공하면서 백그라운드에서 갱신한다
+    async def _search_provider(
+        self, name: str, adapter: Any, params: Dict[str, Any], key: str
+    ) -> Tuple[List[Dict[str, Any]], ProviderStatus]:
+        cache_key = (name, key)
+        with TRACER.span("provider.search", {"provider": name}) as span:
+            if self.cache is not None:
+                cached, state = self.cache.get(cache_key)
+                FARE_CACHE_LOOKUPS.inc(name, state)
+                span.set("cache", state)
+                if state != MISS:
+                    if state == STALE:
+                        self._schedule_refresh(name, adapter, params, cache_key)
+                    return list(cached), ProviderStatus(name, STATUS_OK, 0.0, count=len(cached), cache=state)
+
+            flights, status = await self._call_adapter(name, adapter, params)
+            self._store(name, cache_key, flights, status)
+            self._record_history(name, params, flights, status)
+            return flights, status
+
+    # 사전 캐싱: 공급자별 캐시가 min_ttl초 이상 신선하게 남아 있지 않을 때만 공급자를 호출해서 캐시에 저장
+    # 호출 한도 대기열에서 사용자 검색/백그라운드 갱신보다 뒤로 밀리고, 회로 차단기가 열린 공급자는 건너뜀
+    # 공급자 이름 -> warm / skipped / mock / ok / timeout / error 를 반환
+    async def prewarm(self, params: Dict[str, Any], min_ttl: float) -> Dict[str, str]:
+        if self.cache is None:
+            return {}
+        provider_params = normalize_search_params(params)
+        key = search_key(provider_params)
+        token = request_priority.set(PRIORITY_PREWARM)
+        try:
+            names = list(self.adapters)
+            results = await asyncio.gather(
+                *(self._prewarm_provider(name, self.adapters[name], provider_params, (name, key), min_ttl) for name in names)
+            )
+        finally:
+            request_priority.reset(token)
+        return dict(zip(names, results))
+
+    async def _prewarm_provider(
+        self, name: str, adapter: Any, params: Dict[str, Any], cache_key: Tuple[str, str], min_ttl: float
+    ) -> str:
+        if self.cache.remaining(cache_key) >= min_ttl:
+            return PREWARM_WARM
+        breaker = getattr(adapter, "breaker", None)
+        if breaker is not None and breaker.state == OPEN:
+            return PREWARM_SKIPPED
+        flights, status = await self._call_adapter(name, adapter, params)
+        self._store(name, cache_key, flights, status)
+        self._record_history(name, params, flights, status)
+        if status.status == STATUS_OK and flights and all(flight.get("is_mock") for flight in flights):
+            return PREWARM_MOCK
+        return status.status
+
+    # 정상 응답만 캐시에 저장 (오류/마감 초과/모의 응답은 저장하지 않음)
+    def _store(self, name: str, cache_key: Tuple[str, str], flights: List[Dict[str, Any]], status: ProviderStatus) -> None:
+        if self.cache is None or status.status != STATUS_OK:
+            return
+        if any(flight.get("is_mock") for flight in flights):
+            return
+        self.cache.set(cache_key, flights, self.cache_ttl_for(name))
+
+    # 정상 응답의 견적을 운임 이력에 기록 (SQLite 쓰기는 스레드에서 실행해서 응답을 막지 않음)
+    def _record_history(self, name: str, params: Dict[str, Any], flights: List[Dict[str, Any]], status: ProviderStatus) -> None:
+        if self.fare_history is None or status.status != STATUS_OK:
+            return
+        if all(flight.get("is_mock") for flight in flights):
+            return
+        task = asyncio.create_task(asyncio.to_thread(self.fare_history.record, name, flights, params))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_history_recorded)
+
+    def _on_history_recorded(self, task: asyncio.Task) -> None:
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error("Failed to record fare history: %s", task.exception())
+
+    # stale 항목을 백그라운드에서 갱신하는 태스크를 예약 (같은 키는 한 번만)
+    def _schedule_refresh(self, name: str, adapter: Any, params: Dict[str, Any], cache_key: Tuple[str, str]) -> None:
+        if cache_key in self._refreshing:
+            return
+        self._refreshing.add(cache_key)
+        task = asyncio.create_task(self._refresh(name, adapter, params, cache_key))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    # 공급자를 다시 호출해서 캐시 항목을 갱신
+    async def _refresh(self, name: str, adapter: Any, params: Dict[str, Any], cache_key: Tuple[str, str]) -> None:
+        # 백그라운드 갱신은 호출 한도 대기열에서 사용자 검색보다 뒤로 밀림 (태스크 자체 컨텍스트에만 적용)
+        request_priority.set(PRIORITY_REFRESH)
+        try:
+            flights, status = await self._call_adapter(name, adapter, params)
+            self._store(name, cache_key, flights, status)
+            self._record_history(name, params, flights, status)
+        finally:
+            self._refreshing.discard(cache_key)
+
+    # 설정값으로 캐시를 생성, 비활성화 시 None
+    def _build_cache(self) -> FareCache | None:
+        if not self.settings.fare_cache_enabled:
+            return None
+        return FareCache(
+            max_entries=self.settings.fare_cache_max_entries,
+            max_bytes=self.settings.fare_cache_max_bytes,
+            stale_seconds=self.settings.fare_cache_stale_seconds,
+        )
+
+    # 어댑터 하나를 마감 시간 안에서 호출하고 (결과, 상태)를 반환, 예외는 밖으로 던지지 않는다
+    async def _call_adapter(self, name: str, adapter: Any, params: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], ProviderStatus]:
+        with TRACER.span("provider.call", {"provider": name}) as span:
+            started = time.perf_counter()
+            try:
+                flights = await asyncio.wait_for(self._invoke(adapter, params), timeout=self.deadline_for(name))
+            except asyncio.TimeoutError:
+                self.logger.warning("%s missed its deadline of %.1fs", name, self.deadline_for(name))
+                PROVIDER_CALL_DURATION.observe(time.perf_counter() - started, name, STATUS_TIMEOUT)
+                span.set("status", STATUS_TIMEOUT)
+                return [], ProviderStatus(name, STATUS_TIMEOUT, self._elapsed_ms(started))
+            except Exception as exc:
+                self.logger.error("%s search failed: %s", name, exc)
+                PROVIDER_CALL_DURATION.observe(time.perf_counter() - started, name, STATUS_ERROR)
+                span.set("status", STATUS_ERROR)
+                return [], ProviderStatus(name, STATUS_ERROR, self._elapsed_ms(started), error=str(exc))
+            PROVIDER_CALL_DURATION.observe(time.perf_counter() - started, name, STATUS_OK)
+            span.set("status", STATUS_OK)
+            span.set("count", len(flights))
+            # 공급자 응답 한 묶음의 가격을 한 번에 변환
+            flights = self.normalizer.normalize(flights, getattr(adapter, "CURRENCY", None))
+            return flights, ProviderStatus(name, STATUS_OK, self._elapsed_ms(started), count=len(flights))
+
+    # 비동기 어댑터는 직접 await, 동기 어댑터는 스레드에서 실행
+    @staticmethod
+    async def _invoke(adapter: Any, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if inspect.iscoroutinefunction(adapter.search_flights):
+            return await adapter.search_flights(params)
+        return await asyncio.to_thread(adapter.search_flights, params)
+
+    # 시작 시각부터 지금까지의 경과 시간을 밀리초로 반환
+    @staticmethod
+    def _elapsed_ms(started: float) -> float:
+        return round((time.perf_counter() - started) * 1000, 2)
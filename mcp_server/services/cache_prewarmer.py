@@ -0,0 +1,178 @@
+# 타입 힌트를 문자열로 처리하여 순방향 참조 문제 해결
+from __future__ import annotations
+
+# 주기 실행 태스크와 동시 실행 수 제한을 위한 비동기 모듈
+import asyncio
+
+# 월의 일 수를 계산하기 위한 표준 모듈
+import calendar
+
+# 로그를 분류하고 관리하기 위한 모듈
+import logging
+
+# 검색 시작 시각/실행 주기에 더하는 무작위 지연(jitter)
+import random
+
+# 실행 시각과 소요 시간을 측정하기 위한 모듈
+import time
+
+# 태스크 취소 시 CancelledError를 무시하기 위한 모듈
+from contextlib import suppress
+
+# 다가오는 날짜 구간 계산
+from datetime import date
+
+# 타입 힌트로 사용되는 모듈
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 프로젝트 환경설정 값을 가져오는 모듈
+from mcp_server.core.config import MCPSettings, get_settings
+
+# 사전 캐싱 한 주기를 트레이스로 기록
+from mcp_server.core.tracing import TRACER
+
+# 월(YYYY-MM)과 여행 기간으로 (출발일, 귀국일) 구간 목록을 생성
+# BE의 generate_date_windows(FE의 generateDatesForMonth)와 같은 규칙이어야 사용자 검색과 캐시 키가 일치한다
+def date_windows(year: int, month: int, duration: int, count: int = 5) -> List[Tuple[date, date]]:
+    days_in_month = calendar.monthrange(year, month)[1]
+    windows: List[Tuple[date, date]] = []
+    max_start_day = days_in_month - duration
+    if max_start_day < 1:
+        return windows
+    for index in range(count):
+        start_day = (index * max_start_day) // count + 1
+        return_day = min(start_day + duration - 1, days_in_month)
+        window = (date(year, month, start_day), date(year, month, return_day))
+        if window not in windows:
+            windows.append(window)
+    return windows
+
+""" 인기 노선의 다가오는 날짜 구간을 주기적으로 미리 검색해서 공급자 캐시를 채워 두는 스케줄러 """
+
+class CachePrewarmer:
+
+    # integrator: FlightAPIIntegrator (prewarm 메서드로 공급자별 캐시를 채움)
+    def __init__(
+        self,
+        integrator: Any,
+        settings: MCPSettings | None = None,
+        rng: random.Random | None = None,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        self.integrator = integrator
+        self.settings = settings or get_settings()
+        self.rng = rng or random.Random()
+        self.today = today
+        self.logger = logging.getLogger(__name__)
+        self._task: Optional[asyncio.Task] = None
+        self._next_run_at: Optional[float] = None
+        # 통계
+        self.runs = 0
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    # 사전 캐싱 사용 여부 (설정이 켜져 있고 공급자 캐시가 있을 때만)
+    @property
+    def enabled(self) -> bool:
+        return bool(self.settings.prewarm_enabled and self.integrator.cache is not None and self.settings.prewarm_routes)
+
+    # 이번 주기에 미리 검색할 파라미터 목록
+    # 노선 x (이번 달부터 prewarm_months_ahead개월) x 여행 기간 x 월별 출발일, 이미 지난 출발일은 제외
+    def schedule(self) -> List[Dict[str, Any]]:
+        today = self.today()
+        searches: List[Dict[str, Any]] = []
+        for route in self.settings.prewarm_routes:
+            origin, _, destination = route.partition("-")
+            if not origin or not destination:
+                self.logger.warning("Ignoring prewarm route %r, expected ORIGIN-DESTINATION", route)
+                continue
+            for offset in range(max(0, self.settings.prewarm_months_ahead)):
+                year, month = divmod(today.year * 12 + today.month - 1 + offset, 12)
+                for duration in self.settings.prewarm_durations:
+                    for departure_date, return_date in date_windows(year, month + 1, duration, self.settings.prewarm_windows_per_month):
+                        if departure_date < today:
+                            continue
+                        searches.append(
+                            {
+                                "origin": origin,
+                                "destination": destination,
+                                "departure_date": departure_date.isoformat(),
+                                "return_date": return_date.isoformat(),
+                                "passengers": 1,
+                            }
+                        )
+        return searches
+
+    # 한 주기 실행: 검색마다 0~jitter초 무작위로 늦게 시작하고, 동시에 prewarm_max_concurrency개까지만 실행
+    # 다음 주기 전에 TTL이 끝나는 캐시 항목만 공급자를 다시 호출한다 (나머지는 warm)
+    async def run_once(self) -> Dict[str, Any]:
+        searches = self.schedule()
+        jitter = max(0.0, self.settings.prewarm_jitter_seconds)
+        min_ttl = self.settings.prewarm_interval_seconds + jitter
+        semaphore = asyncio.Semaphore(max(1, self.settings.prewarm_max_concurrency))
+        results: Dict[str, int] = {}
+        started_at, started = time.time(), time.perf_counter()
+
+        async def warm(params: Dict[str, Any]) -> None:
+            await asyncio.sleep(self.rng.uniform(0, jitter))
+            async with semaphore:
+                try:
+                    outcome = await self.integrator.prewarm(params, min_ttl)
+                except Exception as exc:
+                    self.logger.error("Prewarm of %s failed: %s", params, exc)
+                    outcome = {}
+                    results["failed"] = results.get("failed", 0) + 1
+            for status in outcome.values():
+                results[status] = results.get(status, 0) + 1
+
+        with TRACER.span("prewarm.run", {"searches": len(searches)}):
+            await asyncio.gather(*(warm(params) for params in searches))
+        self.runs += 1
+        self.last_run = {
+            "started_at": started_at,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            "searches": len(searches),
+            "results": results,
+        }
+        return self.last_run
+
+    # 앱 lifespan에서 호출, 비활성화되어 있으면 아무것도 하지 않음
+    def start(self) -> None:
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self._next_run_at = None
+
+    # /health에 노출할 스케줄과 마지막 실행 통계
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None and not self._task.done(),
+            "routes": list(self.settings.prewarm_routes),
+            "months_ahead": self.settings.prewarm_months_ahead,
+            "durations": list(self.settings.prewarm_durations),
+            "interval_seconds": self.settings.prewarm_interval_seconds,
+            "next_run_in_seconds": round(max(0.0, self._next_run_at - time.time()), 1) if self._next_run_at else None,
+            "runs": self.runs,
+            "last_run": self.last_run,
+        }
+
+    # 시작 직후 한 번 실행하고, 이후 interval ± jitter초마다 반복 (한 주기의 실패는 다음 주기에 영향 없음)
+    async def _loop(self) -> None:
+        jitter = max(0.0, self.settings.prewarm_jitter_seconds)
+        delay = self.rng.uniform(0, jitter)
+        while True:
+            self._next_run_at = time.time() + delay
+            await asyncio.sleep(delay)
+            try:
+                await self.run_once()
+            except Exception as exc:
+                self.logger.error("Prewarm run failed: %s", exc)
+            delay = max(0.0, self.settings.prewarm_interval_seconds + self.rng.uniform(-jitter, jitter))
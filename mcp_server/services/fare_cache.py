@@ -0,0 +1,133 @@
+# 타입 힌트를 문자열로 처리하여 순방향 참조 문제 해결
+from __future__ import annotations
+
+# 캐시 항목의 대략적인 크기(바이트)를 계산하기 위한 모듈
+import json
+
+# TTL 계산에 사용하는 단조 증가 시계
+import time
+
+# LRU 순서를 유지하기 위한 순서 있는 딕셔너리
+from collections import OrderedDict
+
+# 캐시 항목을 표현하기 위한 데이터 클래스
+from dataclasses import dataclass
+
+# 타입 힌트로 사용되는 모듈
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# 캐시 조회 결과 상태 (TTL 이내 / TTL 경과했지만 제공 가능 / 없음)
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+# 캐시에 저장되는 항목 하나
+@dataclass(slots=True)
+class CacheEntry:
+    # 저장된 항공편 목록
+    value: List[Dict[str, Any]]
+    # 이 시각까지는 신선한 값
+    expires_at: float
+    # 이 시각까지는 만료되었어도 제공 가능 (백그라운드 갱신 동안)
+    stale_until: float
+    # 대략적인 크기 (바이트)
+    size: int
+
+""" 공급자 응답을 메모리에 보관하는 TTL + LRU 캐시 (stale-while-revalidate 지원) """
+
+class FareCache:
+
+    # 최대 항목 수, 최대 바이트 수, TTL 경과 후 stale 상태로 제공할 시간(초)을 받는 생성자
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        max_bytes: int = 32 * 1024 * 1024,
+        stale_seconds: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_seconds = stale_seconds
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        # 통계 카운터
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # 키로 캐시를 조회하고 (값, 상태)를 반환, 조회된 항목은 가장 최근 사용으로 이동
+    def get(self, key: Hashable) -> Tuple[Optional[List[Dict[str, Any]]], str]:
+        entry = self._entries.get(key)
+        now = self.clock()
+        if entry is None or now >= entry.stale_until:
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None, MISS
+        self._entries.move_to_end(key)
+        if now < entry.expires_at:
+            self.hits += 1
+            return entry.value, FRESH
+        self.stale_hits += 1
+        return entry.value, STALE
+
+    # 키에 값을 저장, 한도(항목 수/바이트)를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    def set(self, key: Hashable, value: List[Dict[str, Any]], ttl: float) -> None:
+        if ttl <= 0:
+            return
+        size = self._approximate_size(value)
+        # 항목 하나가 전체 한도보다 크면 저장하지 않음
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        now = self.clock()
+        self._entries[key] = CacheEntry(value, now + ttl, now + ttl + self.stale_seconds, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    # 항목이 신선하게 남아 있는 시간(초), 없거나 TTL이 지났으면 0 (통계/LRU 순서에 영향 없음)
+    def remaining(self, key: Hashable) -> float:
+        entry = self._entries.get(key)
+        if entry is None:
+            return 0.0
+        return max(0.0, entry.expires_at - self.clock())
+
+    # 특정 키 또는 전체 캐시를 비우는 함수
+    def invalidate(self, key: Hashable | None = None) -> None:
+        if key is None:
+            self._entries.clear()
+            self._bytes = 0
+        elif key in self._entries:
+            self._remove(key)
+
+    # 히트/미스 카운터와 현재 사용량을 반환
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # 항목을 삭제하고 사용 바이트를 갱신
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    # JSON 직렬화 길이로 항목의 대략적인 메모리 크기를 추정
+    @staticmethod
+    def _approximate_size(value: List[Dict[str, Any]]) -> int:
+        return len(json.dumps(value, default=str, separators=(",", ":")))
@@ -0,0 +1,226 @@
+# 타입 힌트를 문자열로 처리하여 순방향 참조 문제 해결
+from __future__ import annotations
+
+# 로컬 운임 이력 저장소 (표준 라이브러리 SQLite)
+import sqlite3
+
+# 여러 스레드(asyncio.to_thread)에서 같은 연결을 쓰기 위한 잠금
+import threading
+
+# 관측 시각 기록용 시계
+import time
+
+# 조회 기간/월 계산을 위한 날짜 모듈
+from datetime import date, timedelta
+
+# 저장 파일 경로 처리
+from pathlib import Path
+
+# 타입 힌트로 사용되는 모듈
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 공급자가 돌려준 정규화된 항공편(견적)을 모두 기록하는 운임 이력 저장소
+# - fare_quotes: 견적을 그대로 쌓는 추가 전용(append-only) 테이블
+# - fare_calendar: 노선(출발지, 도착지) x 출발일 x 통화별 최저가를 미리 계산해 둔 달력
+#   견적 묶음이 들어올 때마다 출발일별 최저가만 upsert해서 증분으로 갱신한다
+# 월 달력/가격 추이 조회는 공급자를 호출하지 않고 이 인덱스만 읽어서 밀리초 단위로 응답한다
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fare_quotes (
+    id INTEGER PRIMARY KEY,
+    observed_at REAL NOT NULL,
+    provider TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    departure_date TEXT NOT NULL,
+    return_date TEXT,
+    airline TEXT,
+    flight_numbers TEXT,
+    price INTEGER NOT NULL,
+    currency TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_fare_quotes_route_day_observed
+    ON fare_quotes (origin, destination, departure_date, observed_at);
+CREATE TABLE IF NOT EXISTS fare_calendar (
+    origin TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    departure_date TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    min_price INTEGER NOT NULL,
+    min_provider TEXT,
+    min_airline TEXT,
+    min_observed_at REAL NOT NULL,
+    latest_price INTEGER NOT NULL,
+    latest_provider TEXT,
+    latest_airline TEXT,
+    observed_at REAL NOT NULL,
+    quotes INTEGER NOT NULL,
+    PRIMARY KEY (origin, destination, currency, departure_date)
+) WITHOUT ROWID;
+"""
+
+# 출발일 하나의 견적 묶음을 달력에 반영하는 upsert
+# min_*: 지금까지 관측된 최저가, latest_*: 가장 최근 묶음의 최저가 (오래된 최저가와 구분하기 위함)
+# SQLite의 UPDATE SET 우변은 모두 갱신 전 값을 참조하므로 min_price 비교 순서와 무관하다
+_UPSERT_CALENDAR = """
+INSERT INTO fare_calendar (
+    origin, destination, departure_date, currency,
+    min_price, min_provider, min_airline, min_observed_at,
+    latest_price, latest_provider, latest_airline, observed_at, quotes
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (origin, destination, currency, departure_date) DO UPDATE SET
+    min_provider = CASE WHEN excluded.min_price < min_price THEN excluded.min_provider ELSE min_provider END,
+    min_airline = CASE WHEN excluded.min_price < min_price THEN excluded.min_airline ELSE min_airline END,
+    min_observed_at = CASE WHEN excluded.min_price < min_price THEN excluded.min_observed_at ELSE min_observed_at END,
+    min_price = MIN(min_price, excluded.min_price),
+    latest_price = CASE WHEN excluded.observed_at >= observed_at THEN excluded.latest_price ELSE latest_price END,
+    latest_provider = CASE WHEN excluded.observed_at >= observed_at THEN excluded.latest_provider ELSE latest_provider END,
+    latest_airline = CASE WHEN excluded.observed_at >= observed_at THEN excluded.latest_airline ELSE latest_airline END,
+    observed_at = MAX(observed_at, excluded.observed_at),
+    quotes = quotes + excluded.quotes
+"""
+
+# 견적 한 건을 저장할 행 (fare_quotes 컬럼 순서)
+QuoteRow = Tuple[float, str, str, str, str, Optional[str], Optional[str], Optional[str], int, str]
+
+""" 운임 이력 + 출발일별 최저가 달력 저장소 (SQLite 파일 또는 메모리) """
+
+class FareHistoryStore:
+
+    # path: SQLite 파일 경로 (":memory:"면 프로세스 메모리에만 보관)
+    def __init__(self, path: str | Path = ":memory:", clock: Callable[[], float] = time.time) -> None:
+        self.path = str(path)
+        self.clock = clock
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        if self.path != ":memory:":
+            # 기록 중에도 조회가 막히지 않도록 WAL, 커밋마다 fsync하지 않도록 synchronous=NORMAL
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        # 통계 카운터
+        self.recorded = 0
+
+    # 설정값으로 저장소 생성, 비활성화 시 None
+    @classmethod
+    def from_settings(cls, settings: Any) -> Optional["FareHistoryStore"]:
+        if not settings.fare_history_enabled:
+            return None
+        return cls(settings.fare_history_path or ":memory:")
+
+    # 한 공급자 응답의 견적들을 기록하고 달력을 증분 갱신 (트랜잭션 1회)
+    # 가격/출발일이 없는 항공편과 모의 응답은 기록하지 않음, 기록한 견적 수를 반환
+    # params: 항공편에 출발지/도착지/출발일이 없을 때 사용할 검색 파라미터
+    def record(self, provider: str, flights: Iterable[Dict[str, Any]], params: Optional[Dict[str, Any]] = None) -> int:
+        params = params or {}
+        observed_at = self.clock()
+        rows: List[QuoteRow] = []
+        # (출발지, 도착지, 출발일, 통화) -> [최저가, 항공사, 견적 수]
+        cheapest: Dict[Tuple[str, str, str, str], List[Any]] = {}
+        for flight in flights:
+            price = flight.get("price")
+            if flight.get("is_mock") or not isinstance(price, int) or isinstance(price, bool):
+                continue
+            origin = _code(flight.get("origin") or params.get("origin"))
+            destination = _code(flight.get("destination") or params.get("destination"))
+            departure_date = str(flight.get("departure_date") or params.get("departure_date") or "")[:10]
+            currency = _code(flight.get("currency")) or "UNKNOWN"
+            if not origin or not destination or not departure_date:
+                continue
+            airline = flight.get("airline")
+            numbers = flight.get("flight_numbers") or flight.get("flight_number")
+            if isinstance(numbers, (list, tuple)):
+                numbers = ",".join(str(number) for number in numbers)
+            rows.append(
+                (observed_at, provider, origin, destination, departure_date, flight.get("return_date"), airline, numbers, price, currency)
+            )
+            key = (origin, destination, departure_date, currency)
+            day = cheapest.get(key)
+            if day is None:
+                cheapest[key] = [price, airline, 1]
+            else:
+                if price < day[0]:
+                    day[0], day[1] = price, airline
+                day[2] += 1
+        if not rows:
+            return 0
+
+        calendar_rows = [
+            (*key, price, provider, airline, observed_at, price, provider, airline, observed_at, count)
+            for key, (price, airline, count) in cheapest.items()
+        ]
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.executemany(
+                    "INSERT INTO fare_quotes (observed_at, provider, origin, destination, departure_date, return_date,"
+                    " airline, flight_numbers, price, currency) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._connection.executemany(_UPSERT_CALENDAR, calendar_rows)
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self.recorded += len(rows)
+        return len(rows)
+
+    # 노선의 출발일별 최저가 달력 (start ~ end, 양 끝 포함), 기록이 없는 날은 빠짐
+    def calendar(self, origin: str, destination: str, start: date, end: date, currency: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT departure_date, min_price, min_provider, min_airline, min_observed_at,"
+                " latest_price, latest_provider, latest_airline, observed_at, quotes"
+                " FROM fare_calendar WHERE origin = ? AND destination = ? AND currency = ?"
+                " AND departure_date BETWEEN ? AND ? ORDER BY departure_date",
+                (_code(origin), _code(destination), _code(currency), start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return [
+            {
+                "departure_date": row[0],
+                "min_price": row[1],
+                "min_provider": row[2],
+                "min_airline": row[3],
+                "min_observed_at": row[4],
+                "latest_price": row[5],
+                "latest_provider": row[6],
+                "latest_airline": row[7],
+                "observed_at": row[8],
+                "quotes": row[9],
+            }
+            for row in rows
+        ]
+
+    # 특정 출발일 운임의 관측일별 최저가 추이 (최근 days일)
+    def trend(self, origin: str, destination: str, departure_date: date, currency: str, days: int = 30) -> List[Dict[str, Any]]:
+        since = self.clock() - days * 86400
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT date(observed_at, 'unixepoch') AS day, MIN(price), COUNT(*) FROM fare_quotes"
+                " WHERE origin = ? AND destination = ? AND departure_date = ? AND observed_at >= ? AND currency = ?"
+                " GROUP BY day ORDER BY day",
+                (_code(origin), _code(destination), departure_date.isoformat(), since, _code(currency)),
+            ).fetchall()
+        return [{"day": row[0], "min_price": row[1], "quotes": row[2]} for row in rows]
+
+    # /health에 노출할 통계
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            days = self._connection.execute("SELECT COUNT(*) FROM fare_calendar").fetchone()[0]
+        return {"path": self.path, "recorded": self.recorded, "calendar_days": days}
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+# 월(YYYY-MM)의 첫날과 마지막 날, 형식이 잘못되면 ValueError
+def month_range(month: str) -> Tuple[date, date]:
+    start = date.fromisoformat(f"{month}-01")
+    end = (start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+    return start, end
+
+# 공항/통화 코드는 대소문자/공백 차이를 무시 (검색 파라미터 정규화와 동일)
+def _code(value: Any) -> str:
+    return str(value).strip().upper() if value else ""
@@ -1,27 +1,121 @@
 # 타입 힌트를 문자열로 처리하여 순방향 참조 문제 해결
 from __future__ import annotations
 
+# 전체 정렬 없이 상위 K개만 고르기 위한 힙 모듈 (O(n log k))
+import heapq
+
+# 랭킹 가중치를 묶어 두기 위한 데이터 클래스
+from dataclasses import dataclass, fields
+
 # 평균을 계산하기 위한 표준 라이브러리
 from statistics import mean
 
-# 타입 힌트로 사용되는 모듈 
-from typing import Dict, List
+# 타입 힌트로 사용되는 모듈
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# 항공편 dict에서 소요 시간(분)과 경유 횟수를 읽을 키
+DURATION_FIELD = "duration_minutes"
+STOPS_FIELD = "stops"
+
+""" 랭킹 점수 계산에 쓰이는 기준별 가중치 (0이면 해당 기준을 무시) """
+
+@dataclass(slots=True)
+class RankingWeights:
+    # 가격 가중치 (기본값: 가격만으로 순위 결정)
+    price: float = 1.0
+    # 총 소요 시간 가중치
+    duration: float = 0.0
+    # 경유 횟수 가중치
+    stops: float = 0.0
+    # 선호 항공사가 아닐 때 받는 벌점의 가중치
+    airline: float = 0.0
+
+    # {"price": 1, "duration": 0.5} 형태의 dict로 기본 가중치 일부를 덮어써서 새 가중치를 만든다
+    # 알 수 없는 기준이나 음수 가중치는 ValueError
+    def merged(self, overrides: Optional[Mapping[str, Any]]) -> "RankingWeights":
+        values = {field.name: getattr(self, field.name) for field in fields(self)}
+        for name, value in (overrides or {}).items():
+            if name not in values:
+                raise ValueError(f"Unknown ranking criterion: {name}")
+            weight = float(value)
+            if weight < 0:
+                raise ValueError(f"Ranking weight must be >= 0: {name}")
+            values[name] = weight
+        return RankingWeights(**values)
 
 """ 가장 싼 항공편 데이터 분석을 위한 유틸리티 클래스 """
 
 class FlightAnalyzer:
-    
+
     # 항공편 목록에서 가장 저렴한 항공편을 찾아 반환하는 함수
     def find_cheapest(self, flights: List[Dict[str, int]]) -> Dict[str, int] | None:
         if not flights:
             return None
-        
-        # 가격이 없는 항목은 무한대로 간주하여 가장 싼 항공편에서 제외
-        return min(flights, key=lambda flight: flight.get("price", float("inf"))) 
-    
+
+        # 가격이 없는(또는 None인) 항목은 무한대로 간주하여 가장 싼 항공편에서 제외
+        return min(flights, key=lambda flight: flight["price"] if flight.get("price") is not None else float("inf"))
+
     # 항공편 목록에서 평균 가격을 계산하여 반환하는 함수
-    def average_price(self, flights: List[Dict[str, int]]) -> float | None: 
+    def average_price(self, flights: List[Dict[str, int]]) -> float | None:
         prices = [flight.get("price") for flight in flights if flight.get("price") is not None] # 가격이 None이 아닌 항공편의 가격만 추출
         if not prices: #가격이 없는 경우 None 반환
             return None
-        return float(mean(prices)) # 평균 가격을 계산하여 반환
\ No newline at end of file
+        return float(mean(prices)) # 평균 가격을 계산하여 반환
+
+    # 가중치 점수가 낮은 순으로 상위 top_k개 항공편을 반환하는 함수
+    # 가격/소요 시간/경유 횟수는 목록 안에서 0~1로 정규화(min-max)하고, 값이 없으면 가장 나쁜 값(1)으로 간주
+    # 점수가 같으면 입력 순서를 유지하며, 원본 dict는 수정하지 않고 "score"가 추가된 복사본을 반환
+    def rank(
+        self,
+        flights: List[Dict[str, Any]],
+        top_k: int = 10,
+        weights: RankingWeights | None = None,
+        preferred_airlines: Iterable[str] = (),
+    ) -> List[Dict[str, Any]]:
+        if not flights or top_k <= 0:
+            return []
+        weights = weights or RankingWeights()
+        # 항공사 이름 하나만 문자열로 받은 경우 글자 단위로 나누지 않도록 목록으로 감쌈
+        if isinstance(preferred_airlines, str):
+            preferred_airlines = [preferred_airlines]
+        preferred = {airline.lower() for airline in preferred_airlines}
+
+        # 기준별 정규화 함수 (가중치가 0인 기준은 계산하지 않음)
+        criteria = [
+            (weights.price, self._normalizer(flights, "price")),
+            (weights.duration, self._normalizer(flights, DURATION_FIELD) if weights.duration else None),
+            (weights.stops, self._normalizer(flights, STOPS_FIELD) if weights.stops else None),
+        ]
+        criteria = [(weight, normalize) for weight, normalize in criteria if weight and normalize]
+
+        def score(flight: Dict[str, Any]) -> float:
+            total = sum(weight * normalize(flight) for weight, normalize in criteria)
+            if weights.airline and preferred and str(flight.get("airline", "")).lower() not in preferred:
+                total += weights.airline
+            return total
+
+        # (점수, 입력 순서) 튜플로 비교해서 동점일 때도 결과가 항상 같도록 함
+        scored: Iterable[Tuple[float, int]] = ((score(flight), index) for index, flight in enumerate(flights))
+        top = heapq.nsmallest(top_k, scored)
+        return [{**flights[index], "score": round(value, 6)} for value, index in top]
+
+    # 필드 값을 목록 내 최솟값 0, 최댓값 1로 정규화하는 함수를 만든다
+    @staticmethod
+    def _normalizer(flights: List[Dict[str, Any]], field: str):
+        values = [flight[field] for flight in flights if _is_number(flight.get(field))]
+        if not values:
+            return None
+        low, high = min(values), max(values)
+        span = high - low
+
+        def normalize(flight: Dict[str, Any]) -> float:
+            value = flight.get(field)
+            if not _is_number(value):
+                return 1.0
+            return (value - low) / span if span else 0.0
+
+        return normalize
+
+# 정규화에 쓸 수 있는 숫자인지 확인 (bool은 int의 하위 타입이지만 가격/시간/경유 값으로 보지 않음)
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
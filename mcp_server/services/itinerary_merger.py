@@ -0,0 +1,79 @@
+# 타입 힌트를 문자열로 처리하여 순방향 참조 문제 해결
+from __future__ import annotations
+
+# 타입 힌트로 사용되는 모듈
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+# 같은 항공편인지 판단할 때 사용하는 필드 (항공사 + 편명 + 구간 + 날짜 + 좌석 등급)
+_FINGERPRINT_FIELDS = ("origin", "destination", "departure_date", "return_date", "cabin")
+
+# 항공편 dict로부터 공급자와 무관하게 같은 여정이면 같은 값이 나오는 지문(fingerprint)을 만드는 함수
+# 편명(flight_numbers 또는 flight_number)이 없으면 같은 여정인지 확신할 수 없으므로 None (병합하지 않음)
+def itinerary_fingerprint(flight: Dict[str, Any]) -> Optional[Hashable]:
+    numbers = flight.get("flight_numbers") or flight.get("flight_number")
+    if not numbers:
+        return None
+    if isinstance(numbers, str):
+        numbers = [numbers]
+    carrier = str(flight.get("carrier") or flight.get("airline") or "").strip().upper()
+    return (
+        carrier,
+        tuple(str(number).replace(" ", "").upper() for number in numbers),
+        *(str(flight.get(field) or "").strip().upper() for field in _FINGERPRINT_FIELDS),
+    )
+
+# 공급자별 항공편 목록을 하나로 합치면서 같은 여정은 최저가 판매처 하나로 병합하는 함수
+# 지문 -> 결과 위치의 해시 인덱스로 한 번만 순회하므로 O(n)
+# 각 항목에는 provider(판매 공급자)와 alternates(다른 공급자의 같은 여정 가격 목록)가 붙고, 결과 순서는 처음 등장한 순서
+# 입력 dict는 수정하지 않음
+def merge_itineraries(batches: Iterable[Tuple[str, List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+    merger = ItineraryMerger()
+    for provider, flights in batches:
+        merger.add(provider, flights)
+    return merger.merged
+
+""" 공급자 응답이 도착할 때마다 이어서 병합하는 클래스 (스트리밍 검색용) """
+
+class ItineraryMerger:
+
+    def __init__(self) -> None:
+        # 지금까지 병합된 결과 (merge_itineraries의 결과와 같은 형식)
+        self.merged: List[Dict[str, Any]] = []
+        # 지문 -> merged 안의 위치
+        self._index: Dict[Hashable, int] = {}
+
+    # 공급자 하나의 항공편 목록을 병합하고 (새로 추가된 여정 목록, 이번 목록으로 대표 판매처/alternates가 바뀐 기존 여정 위치)를 반환
+    # 새 여정은 merged 끝에 추가되므로, 이전까지 받은 여정 수 + 순서가 곧 merged 안의 위치
+    def add(self, provider: str, flights: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[int]]:
+        merged, index = self.merged, self._index
+        start = len(merged)
+        changed = set()
+        for flight in flights:
+            offer = {**flight, "provider": provider, "alternates": []}
+            fingerprint = itinerary_fingerprint(flight)
+            position = index.get(fingerprint) if fingerprint is not None else None
+            if position is None:
+                if fingerprint is not None:
+                    index[fingerprint] = len(merged)
+                merged.append(offer)
+                continue
+
+            current = merged[position]
+            if _price_key(offer) < _price_key(current):
+                # 더 싼 판매처가 대표가 되고, 기존 대표와 그 대체 목록은 alternates로 옮김
+                offer["alternates"] = [*current["alternates"], _alternate(current)]
+                merged[position] = offer
+            else:
+                current["alternates"].append(_alternate(offer))
+            if position < start:
+                changed.add(position)
+        return merged[start:], sorted(changed)
+
+# 가격이 없는 판매처는 가장 비싼 것으로 간주
+def _price_key(flight: Dict[str, Any]) -> float:
+    price = flight.get("price")
+    return price if price is not None else float("inf")
+
+# alternates에 기록할 다른 판매처 정보
+def _alternate(flight: Dict[str, Any]) -> Dict[str, Any]:
+    return {"provider": flight["provider"], "price": flight.get("price"), "currency": flight.get("currency")}
@@ -0,0 +1,76 @@
+# 타입 힌트를 문자열로 처리하여 순방향 참조 문제 해결
+from __future__ import annotations
+
+# 로컬 환율표(JSON)를 읽기 위한 모듈
+import json
+
+# 로그를 분류하고 관리하기 위한 모듈
+import logging
+
+# 기본 환율표 파일 경로를 계산하기 위한 모듈
+from pathlib import Path
+
+# 타입 힌트로 사용되는 모듈
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 환경설정 클래스
+from mcp_server.core.config import MCPSettings
+
+# 가격 값 -> (금액, 통화) 파싱 (BE와 함께 사용하는 공용 모듈)
+from shared.prices import parse_amount
+
+# 저장소에 함께 배포되는 기본 환율표 (기준 통화 1단위당 각 통화 금액)
+DEFAULT_RATES_PATH = Path(__file__).resolve().parent.parent / "data" / "fx_rates.json"
+
+# 보조 단위가 없는 통화 (그 외 통화는 소수점 2자리 = 1/100 단위)
+_ZERO_DECIMAL_CURRENCIES = {"KRW", "JPY", "VND", "IDR", "CLP", "ISK", "HUF", "TWD"}
+
+# 통화의 보조 단위 자릿수 (KRW -> 0, USD -> 2)
+def minor_unit_exponent(currency: str) -> int:
+    return 0 if currency in _ZERO_DECIMAL_CURRENCIES else 2
+
+"""공급자 응답의 가격을 설정된 통화의 정수 보조 단위(minor unit)로 맞추는 클래스"""
+
+class PriceNormalizer:
+
+    # target_currency: 변환할 통화 / rates: 기준 통화 1단위당 각 통화 금액
+    def __init__(self, target_currency: str, rates: Dict[str, float]) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.target_currency = target_currency.upper()
+        self.rates = {code.upper(): float(rate) for code, rate in rates.items() if rate}
+        if self.target_currency not in self.rates:
+            raise ValueError(f"No FX rate for target currency {self.target_currency}")
+        # 통화별 변환 계수 (원래 금액 x 계수 = 목표 통화 보조 단위)
+        scale = 10 ** minor_unit_exponent(self.target_currency)
+        target_rate = self.rates[self.target_currency]
+        self._factors = {code: target_rate / rate * scale for code, rate in self.rates.items()}
+
+    # 설정값(default_currency, fx_rates_path)으로 생성
+    @classmethod
+    def from_settings(cls, settings: MCPSettings) -> "PriceNormalizer":
+        return cls(settings.default_currency, load_rates(settings.fx_rates_path))
+
+    # 항공편 목록의 가격을 한 번에 변환해서 새 dict 목록으로 반환 (입력 dict는 수정하지 않음)
+    # price: 목표 통화의 정수 보조 단위, currency: 목표 통화 / 해석할 수 없는 가격은 None
+    def normalize(self, flights: List[Dict[str, Any]], provider_currency: Optional[str] = None) -> List[Dict[str, Any]]:
+        fallback = (provider_currency or self.target_currency).upper()
+        normalized: List[Dict[str, Any]] = []
+        for flight in flights:
+            price = flight.get("price")
+            amount, currency = parse_amount(price, str(flight.get("currency") or fallback).upper())
+            factor = self._factors.get(currency or "")
+            if amount is None or factor is None:
+                if price is not None:
+                    self.logger.warning("Could not normalize price %r (%s)", price, currency)
+                converted = None
+            else:
+                converted = int(round(amount * factor))
+            normalized.append({**flight, "price": converted, "currency": self.target_currency})
+        return normalized
+
+# 환율표 JSON 파일을 읽어 {통화: 기준 통화 1단위당 금액} dict로 반환
+# 파일 형식: {"base": "USD", "rates": {"USD": 1.0, "KRW": 1350.0, ...}}
+def load_rates(path: Optional[str] = None) -> Dict[str, float]:
+    with open(path or DEFAULT_RATES_PATH, encoding="utf-8") as file:
+        table = json.load(file)
+    return {str(code).upper(): float(rate) for code, rate in table["rates"].items()}
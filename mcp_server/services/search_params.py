@@ -0,0 +1,54 @@
+# 타입 힌트를 문자열로 처리하여 순방향 참조 문제 해결
+from __future__ import annotations
+
+# 정규화된 파라미터를 안정적인 문자열 키로 직렬화하기 위한 모듈
+import json
+
+# 타입 힌트로 사용되는 모듈
+from typing import Any, Dict
+
+# 잘못된 파라미터를 JSON-RPC Invalid params 오류로 알리기 위한 모듈
+from mcp_server.protocols.json_rpc import INVALID_PARAMS, JSONRPCError, JSONRPCException
+
+# 공급자 검색에 영향을 주는 파라미터 (이 외의 값은 공급자에 전달하지 않고 캐시 키에도 포함하지 않음)
+SEARCH_FIELDS = ("origin", "destination", "departure_date", "return_date", "passengers", "cabin")
+
+# 공항 코드처럼 대소문자/공백 차이를 무시해야 하는 필드
+_CODE_FIELDS = ("origin", "destination", "cabin")
+
+# 검색 파라미터를 정규화하는 함수
+# 공항 코드는 대문자로, 날짜는 공백 제거, 승객 수는 정수(기본 1)로 맞추고 빈 값은 제거
+# 승객 수가 1 이상의 정수가 아니면 Invalid params 오류
+def normalize_search_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    normalized: Dict[str, Any] = {}
+    for field in SEARCH_FIELDS:
+        value = params.get(field)
+        if value is None or value == "":
+            continue
+        if field in _CODE_FIELDS:
+            value = str(value).strip().upper()
+        elif field == "passengers":
+            value = _passengers(value)
+        else:
+            value = str(value).strip()
+        normalized[field] = value
+    normalized.setdefault("passengers", 1)
+    return normalized
+
+# 정규화된 파라미터로부터 같은 검색이면 항상 같은 값이 나오는 키를 만드는 함수
+def search_key(params: Dict[str, Any]) -> str:
+    return json.dumps(normalize_search_params(params), sort_keys=True, separators=(",", ":"))
+
+# 승객 수를 정수로 변환 (bool, 숫자가 아닌 값, 1 미만은 Invalid params 오류)
+def _passengers(value: Any) -> int:
+    try:
+        if isinstance(value, bool):
+            raise ValueError(value)
+        passengers = int(value)
+    except (TypeError, ValueError):
+        passengers = 0
+    if passengers < 1:
+        raise JSONRPCException(
+            JSONRPCError(code=INVALID_PARAMS, message="Invalid params", data={"detail": f"Invalid passengers: {value!r}"})
+        )
+    return passengers
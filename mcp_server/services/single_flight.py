@@ -0,0 +1,53 @@
+# 타입 힌트를 문자열로 처리하여 순방향 참조 문제 해결
+from __future__ import annotations
+
+# 진행 중인 작업을 여러 호출자가 함께 기다리기 위한 비동기 모듈
+import asyncio
+
+# 타입 힌트로 사용되는 모듈
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+""" 같은 키로 동시에 들어온 호출을 하나의 실행으로 합치는 single-flight 유틸리티 클래스 """
+
+class SingleFlight:
+
+    def __init__(self) -> None:
+        # 키 -> 진행 중인 공유 태스크
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        # 통계 카운터 (전체 호출 / 실제 실행 / 합쳐진 호출)
+        self.calls = 0
+        self.executions = 0
+        self.merged = 0
+
+    # 같은 키의 작업이 진행 중이면 그 결과를 함께 기다리고, 없으면 새로 실행하는 함수
+    # 공유 작업은 asyncio.shield로 감싸서, 호출자 한 명이 취소(연결 끊김)되어도 작업은 계속 진행된다
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        else:
+            self.merged += 1
+        return await asyncio.shield(task)
+
+    # 현재 진행 중인 작업 수와 호출 통계를 반환
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "merged": self.merged,
+            "in_flight": len(self._in_flight),
+        }
+
+    # 작업이 끝나면 진행 중 목록에서 제거
+    # 기다리는 호출자가 모두 취소된 경우에도 예외가 "처리되지 않음" 경고로 남지 않도록 확인한다
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
@@ -2,20 +2,26 @@
 import asyncio
 # 테스트 자동화 프레임 워크(테스트 실행용)
 import pytest
+# 공유 클라이언트 주입을 검증하기 위한 HTTP 클라이언트 라이브러리
+import httpx
 
 # MCP 서버의 어댑터 클래스(항공권 API 연동용)를 불러옴
 from mcp_server.adapters.api_provider_b_adapter import ProviderBAdapter
 from mcp_server.adapters.skyscanner_adapter import SkyScannerAdapter
+# 헤지 요청 지연 계산에 쓰이는 회로 차단기
+from mcp_server.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+# API 키가 있는 설정을 직접 만들기 위한 설정 클래스
+from mcp_server.core.config import MCPSettings
 
 # Skyscanner API 키가 없는 환경을 가정하고 mock 데이터가 반환되는지 테스트하는 함수
-# 동기요청으로 받아온 응답을 어댑터에서 표준 구조로 가공해서 반환하는지 확인
+# 비동기요청으로 받아온 응답을 어댑터에서 표준 구조로 가공해서 반환하는지 확인
 def test_skyscanner_adapter_returns_mock_without_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.delenv("SKYSCANNER_API_KEY", raising=False) # SKYSCANNER_API_KEY라는 환경 변수를 삭제해서 API키가 없도록 만든다 -> 이 테스트 실행 중에는 없는 것처럼 위장
     # Skyscanner API에 연결하는 어댑터 객체 생성
     adapter = SkyScannerAdapter()
 
     # 실제로 항공권 데이터를 가져오는 함수. 현재는 mock 데이터를 반환(인천->나리타 mock검색 실행)
-    results = adapter.search_flights({"origin": "ICN", "destination": "NRT"})
+    results = asyncio.run(adapter.search_flights({"origin": "ICN", "destination": "NRT"}))
     # assert를 활용해 결과가 비어있지 않은지 확인
     assert results, "Expected mock results when API key is missing"
 
@@ -30,3 +36,86 @@ def test_provider_b_adapter_returns_mock_without_api_key(monkeypatch: pytest.Mon
     # assert를 활용해 결과가 비어있지 않은지 확인
     assert results, "Expected mock results when API key is missing"
 
+
+# 주입받은 공유 클라이언트로 요청을 보내고, 호출 후에도 클라이언트를 닫지 않는지 확인
+def test_adapter_uses_injected_shared_client() -> None:
+    requested_urls = []
+
+    # 실제 네트워크 대신 응답을 돌려주는 테스트용 transport
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_urls.append(str(request.url))
+        return httpx.Response(200, json={"itineraries": [{"airline": "Shared Pool Air", "price": 1}]})
+
+    async def run() -> tuple:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            adapter = SkyScannerAdapter(client=client)
+            adapter.settings = MCPSettings(skyscanner_api_key="test-key")
+            first = await adapter.search_flights({"origin": "ICN", "destination": "NRT"})
+            second = await adapter.search_flights({"origin": "ICN", "destination": "NRT"})
+            return first, second, client.is_closed
+
+    first, second, closed = asyncio.run(run())
+    assert first == second == [{"airline": "Shared Pool Air", "price": 1}]
+    assert len(requested_urls) == 2
+    assert not closed
+
+
+# 첫 요청이 최근 지연 백분위수보다 오래 걸리면 헤지 요청을 보내고 먼저 도착한 응답을 쓰는지 확인
+def test_adapter_hedges_slow_request() -> None:
+    calls = []
+
+    # 첫 요청만 느리게 응답하는 테스트용 transport
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            await asyncio.sleep(1.0)
+        return httpx.Response(200, json={"itineraries": [{"airline": f"Attempt {len(calls)}", "price": 1}]})
+
+    async def run() -> list:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            adapter = SkyScannerAdapter(client=client)
+            adapter.settings = MCPSettings(skyscanner_api_key="test-key", hedge_enabled=True, hedge_min_delay_ms=10)
+            # 최근 호출 지연이 모두 10ms였던 것으로 기록
+            adapter.breaker = CircuitBreaker(min_calls=3)
+            for _ in range(3):
+                adapter.breaker.record_success(10)
+            results = await adapter.search_flights({"origin": "ICN", "destination": "NRT"})
+            return [results, adapter.stats()]
+
+    results, stats = asyncio.run(run())
+    assert results == [{"airline": "Attempt 2", "price": 1}]
+    assert stats["hedges"] == 1
+    assert stats["hedge_wins"] == 1
+
+
+# HALF_OPEN 시험 호출이 잘못된 본문(200 + JSON이 아닌 응답)으로 실패해도 실패로 기록되어
+# 회로가 다시 OPEN이 되고, open_seconds 뒤에는 다음 시험 호출이 허용되는지 확인
+def test_adapter_records_malformed_body_probe_as_failure() -> None:
+    now = [0.0]
+    bodies = [b"<html>not json</html>", b'{"itineraries": [{"airline": "Recovered Air", "price": 1}]}']
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=bodies.pop(0), headers={"content-type": "application/json"})
+
+    async def run() -> list:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            adapter = SkyScannerAdapter(client=client)
+            adapter.settings = MCPSettings(skyscanner_api_key="test-key", enable_mock_providers=False)
+            adapter.breaker = CircuitBreaker(min_calls=1, open_seconds=10, clock=lambda: now[0])
+            adapter.breaker.record_failure(10)
+            assert adapter.breaker.state == OPEN
+
+            now[0] = 10
+            with pytest.raises(ValueError):
+                await adapter.search_flights({"origin": "ICN", "destination": "NRT"})
+            assert adapter.breaker.state == OPEN
+
+            now[0] = 20
+            assert adapter.breaker.allow() and adapter.breaker.state == HALF_OPEN
+            adapter.breaker.abandon()
+            results = await adapter.search_flights({"origin": "ICN", "destination": "NRT"})
+            return [results, adapter.breaker.state]
+
+    results, state = asyncio.run(run())
+    assert results == [{"airline": "Recovered Air", "price": 1}]
+    assert state == CLOSED
@@ -0,0 +1,140 @@
+# 여러 공급자를 동시에 호출하는 FlightAPIIntegrator의 단위 테스트 모듈
+import asyncio
+import time
+
+from mcp_server.core.config import MCPSettings
+from mcp_server.services.api_integrator import FlightAPIIntegrator
+from mcp_server.services.fare_cache import FareCache
+
+
+# 지정한 시간만큼 기다린 뒤 항공편 1건을 돌려주는 테스트용 비동기 어댑터
+class FakeAsyncAdapter:
+    def __init__(self, name: str, delay: float, price: int) -> None:
+        self.NAME = name
+        self.delay = delay
+        self.price = price
+        self.calls = 0
+
+    async def search_flights(self, params):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return [{"airline": self.NAME, "price": self.price}]
+
+
+# 호출하면 항상 예외를 던지는 테스트용 동기 어댑터
+class BrokenSyncAdapter:
+    NAME = "broken"
+
+    def search_flights(self, params):
+        raise RuntimeError("provider down")
+
+
+# 테스트용 어댑터만 등록된 통합기를 만드는 헬퍼 함수
+def build_integrator(*adapters, deadlines=None, cache=None) -> FlightAPIIntegrator:
+    integrator = FlightAPIIntegrator(skyscanner=adapters[0], provider_b=adapters[1], cache=cache if cache is not None else FareCache())
+    integrator.settings = MCPSettings(provider_deadlines=deadlines or {})
+    integrator.adapters = {}
+    for adapter in adapters:
+        integrator.register(adapter)
+    return integrator
+
+
+# 공급자들이 순차가 아니라 동시에 호출되는지 검증 (0.2초 + 0.2초가 아니라 약 0.2초)
+def test_providers_run_concurrently() -> None:
+    integrator = build_integrator(FakeAsyncAdapter("a", 0.2, 100), FakeAsyncAdapter("b", 0.2, 200))
+
+    started = time.perf_counter()
+    outcome = asyncio.run(integrator.search_flights({}))
+    elapsed = time.perf_counter() - started
+
+    assert len(outcome.flights) == 2
+    assert elapsed < 0.35
+
+
+# 마감 시간을 넘긴 공급자는 timeout 상태로 기록되고, 나머지 결과는 그대로 반환되는지 검증
+def test_slow_provider_times_out_with_partial_results() -> None:
+    integrator = build_integrator(
+        FakeAsyncAdapter("fast", 0.0, 100),
+        FakeAsyncAdapter("slow", 1.0, 200),
+        deadlines={"slow": 0.05},
+    )
+
+    outcome = asyncio.run(integrator.search_flights({}))
+    statuses = {status.provider: status for status in outcome.providers}
+
+    assert outcome.flights == [{"airline": "fast", "price": 100, "currency": "KRW", "provider": "fast", "alternates": []}]
+    assert statuses["fast"].status == "ok"
+    assert statuses["slow"].status == "timeout"
+    assert statuses["slow"].elapsed_ms < 500
+
+
+# 예외를 던진 공급자는 error 상태로 기록되고 검색 전체는 실패하지 않는지 검증
+def test_failing_provider_reports_error() -> None:
+    integrator = build_integrator(FakeAsyncAdapter("ok", 0.0, 100), BrokenSyncAdapter())
+
+    outcome = asyncio.run(integrator.search_flights({}))
+    statuses = {status.provider: status for status in outcome.providers}
+
+    assert len(outcome.flights) == 1
+    assert statuses["broken"].status == "error"
+    assert statuses["broken"].error == "provider down"
+
+
+# 같은 검색을 반복하면 두 번째부터는 공급자를 호출하지 않고 캐시에서 응답하는지 검증
+def test_repeated_search_is_served_from_cache() -> None:
+    first, second = FakeAsyncAdapter("a", 0.0, 100), FakeAsyncAdapter("b", 0.0, 200)
+    integrator = build_integrator(first, second)
+
+    async def run():
+        await integrator.search_flights({"origin": "ICN", "destination": "NRT"})
+        return await integrator.search_flights({"origin": "icn", "destination": "nrt"})
+
+    outcome = asyncio.run(run())
+
+    assert first.calls == second.calls == 1
+    assert len(outcome.flights) == 2
+    assert {status.cache for status in outcome.providers} == {"fresh"}
+
+
+# TTL이 지난 항목은 즉시 제공되고, 백그라운드에서 공급자를 다시 호출해 갱신하는지 검증
+def test_stale_entry_is_served_and_refreshed_in_background() -> None:
+    clock = [0.0]
+    first, second = FakeAsyncAdapter("a", 0.0, 100), FakeAsyncAdapter("b", 0.0, 200)
+    integrator = build_integrator(first, second, cache=FareCache(stale_seconds=60, clock=lambda: clock[0]))
+
+    async def run():
+        await integrator.search_flights({"destination": "NRT"})
+        clock[0] = integrator.cache_ttl_for("a") + 1
+        outcome = await integrator.search_flights({"destination": "NRT"})
+        await asyncio.gather(*integrator._background_tasks)
+        return outcome
+
+    outcome = asyncio.run(run())
+
+    assert {status.cache for status in outcome.providers} == {"stale"}
+    assert first.calls == second.calls == 2
+
+
+# 동시에 들어온 같은 검색은 공급자를 한 번만 호출하고 결과를 공유하는지 검증
+def test_identical_concurrent_searches_are_coalesced() -> None:
+    first, second = FakeAsyncAdapter("a", 0.05, 100), FakeAsyncAdapter("b", 0.05, 200)
+    integrator = build_integrator(first, second)
+
+    async def run():
+        return await asyncio.gather(*(integrator.search_flights({"destination": "NRT"}) for _ in range(3)))
+
+    outcomes = asyncio.run(run())
+
+    assert first.calls == second.calls == 1
+    assert all(len(outcome.flights) == 2 for outcome in outcomes)
+    assert integrator.single_flight.stats()["merged"] == 2
+
+
+# 스트리밍 검색은 공급자 응답이 도착하는 순서대로 결과를 내보내는지 검증
+def test_stream_yields_fastest_provider_first() -> None:
+    integrator = build_integrator(FakeAsyncAdapter("slow", 0.1, 100), FakeAsyncAdapter("fast", 0.0, 200))
+
+    async def run():
+        return [status.provider async for _, status in integrator.stream_flights({"destination": "NRT"})]
+
+    assert asyncio.run(run()) == ["fast", "slow"]
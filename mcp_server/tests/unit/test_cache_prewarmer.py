@@ -0,0 +1,72 @@
+# MCP 서버 내부의 services/cache_prewarmer.py의 사전 캐싱 스케줄/실행을 테스트하는 단위 테스트 모듈
+import asyncio
+import random
+from datetime import date
+
+from mcp_server.core.config import MCPSettings
+from mcp_server.core.rate_limiter import PRIORITY_PREWARM, request_priority
+from mcp_server.services.api_integrator import FlightAPIIntegrator
+from mcp_server.services.cache_prewarmer import CachePrewarmer, date_windows
+from mcp_server.services.fare_cache import FRESH, FareCache
+
+
+# 호출될 때의 우선순위를 기록하고 항공편 1건을 돌려주는 테스트용 어댑터
+class RecordingAdapter:
+    def __init__(self, name: str) -> None:
+        self.NAME = name
+        self.priorities = []
+
+    async def search_flights(self, params):
+        self.priorities.append(request_priority.get())
+        return [{"airline": self.NAME, "price": 100000, "departure_date": params["departure_date"]}]
+
+
+def build_prewarmer(**overrides):
+    options = {"prewarm_routes": ["ICN-NRT"], "prewarm_months_ahead": 1, "prewarm_durations": [7], "prewarm_jitter_seconds": 0}
+    settings = MCPSettings(prewarm_enabled=True, **{**options, **overrides})
+    adapters = [RecordingAdapter("a"), RecordingAdapter("b")]
+    integrator = FlightAPIIntegrator(skyscanner=adapters[0], provider_b=adapters[1], cache=FareCache())
+    integrator.settings = settings
+    integrator.adapters = {}
+    for adapter in adapters:
+        integrator.register(adapter)
+    prewarmer = CachePrewarmer(integrator, settings, rng=random.Random(0), today=lambda: date(2025, 4, 10))
+    return prewarmer, integrator, adapters
+
+
+# 날짜 구간은 BE 유연 검색과 같은 규칙이고, 이미 지난 출발일은 스케줄에서 빠짐
+def test_schedule_uses_flexible_search_windows() -> None:
+    assert date_windows(2025, 4, 7) == [
+        (date(2025, 4, 1), date(2025, 4, 7)),
+        (date(2025, 4, 5), date(2025, 4, 11)),
+        (date(2025, 4, 10), date(2025, 4, 16)),
+        (date(2025, 4, 14), date(2025, 4, 20)),
+        (date(2025, 4, 19), date(2025, 4, 25)),
+    ]
+    prewarmer, _, _ = build_prewarmer(prewarm_months_ahead=2)
+
+    schedule = prewarmer.schedule()
+    departures = [search["departure_date"] for search in schedule]
+    assert departures[:3] == ["2025-04-10", "2025-04-14", "2025-04-19"]
+    assert departures[3] == "2025-05-01" and len(schedule) == 8
+    assert schedule[0] == {
+        "origin": "ICN", "destination": "NRT", "departure_date": "2025-04-10", "return_date": "2025-04-16", "passengers": 1
+    }
+
+
+# 사전 캐싱 호출은 PREWARM 우선순위로 실행되어 캐시를 채우고, 다음 주기에는 신선한 항목을 다시 호출하지 않음
+def test_run_once_fills_cache_then_stays_warm() -> None:
+    prewarmer, integrator, adapters = build_prewarmer()
+
+    async def scenario():
+        first = await prewarmer.run_once()
+        second = await prewarmer.run_once()
+        outcome = await integrator.search_flights(prewarmer.schedule()[0])
+        return first, second, outcome
+
+    first, second, outcome = asyncio.run(scenario())
+    assert first["searches"] == 3 and first["results"] == {"ok": 6}
+    assert second["results"] == {"warm": 6}
+    assert adapters[0].priorities == [PRIORITY_PREWARM] * 3
+    assert {status.cache for status in outcome.providers} == {FRESH}
+    assert prewarmer.stats()["runs"] == 2
@@ -0,0 +1,47 @@
+# MCP 서버 내부의 core/circuit_breaker.py의 회로 차단기 상태 전이를 테스트하는 단위 테스트 모듈
+from mcp_server.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+# 시간을 직접 조절할 수 있는 테스트용 시계
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# 오류가 임계 비율을 넘으면 OPEN이 되어 호출을 막고, open_seconds 후 시험 호출 1건만 허용하는지 검증
+def test_breaker_opens_on_errors_and_recovers_after_probe() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(window=4, min_calls=4, error_rate_threshold=0.5, open_seconds=10, clock=clock)
+
+    for failed in (False, True, False, True):
+        assert breaker.allow()
+        breaker.record_failure(10) if failed else breaker.record_success(10)
+
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+    # open_seconds가 지나면 HALF_OPEN에서 시험 호출 1건만 허용
+    clock.now = 10
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_success(10)
+    assert breaker.state == CLOSED
+    assert breaker.stats()["trips"] == 1
+    assert breaker.stats()["rejected"] == 2
+
+
+# 성공했더라도 느린 호출이 임계 비율을 넘으면 회로가 열리는지 검증
+def test_breaker_opens_on_slow_calls() -> None:
+    breaker = CircuitBreaker(window=5, min_calls=3, slow_call_ms=100, slow_rate_threshold=0.6, clock=FakeClock())
+
+    for elapsed in (150, 20, 300):
+        breaker.record_success(elapsed)
+
+    assert breaker.state == OPEN
+    # 지연 백분위수는 표본이 min_calls 이상일 때만 계산
+    assert breaker.latency_percentile(0.5) == 150
@@ -0,0 +1,63 @@
+# 공급자 응답 캐시(FareCache)의 TTL/LRU 동작을 검증하는 단위 테스트 모듈
+from mcp_server.services.fare_cache import FRESH, MISS, STALE, FareCache
+from mcp_server.services.search_params import search_key
+
+
+# 테스트에서 시간을 직접 조절하기 위한 가짜 시계
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# TTL 이내에는 fresh, TTL 경과 후 stale 기간에는 stale, 그 이후에는 miss로 조회되는지 검증
+def test_entry_goes_fresh_then_stale_then_miss() -> None:
+    clock = FakeClock()
+    cache = FareCache(stale_seconds=30, clock=clock)
+    cache.set("k", [{"price": 1}], ttl=10)
+
+    assert cache.get("k") == ([{"price": 1}], FRESH)
+    clock.now = 15
+    assert cache.get("k") == ([{"price": 1}], STALE)
+    clock.now = 45
+    assert cache.get("k") == (None, MISS)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["stale_hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+# 항목 수 한도를 넘으면 가장 오래 사용되지 않은 항목이 제거되는지 검증
+def test_evicts_least_recently_used_by_count() -> None:
+    cache = FareCache(max_entries=2)
+    cache.set("a", [], ttl=10)
+    cache.set("b", [], ttl=10)
+    cache.get("a")
+    cache.set("c", [], ttl=10)
+
+    assert cache.get("b")[1] == MISS
+    assert cache.get("a")[1] == FRESH
+    assert cache.get("c")[1] == FRESH
+    assert cache.stats()["evictions"] == 1
+
+
+# 바이트 한도를 넘으면 오래된 항목부터 제거되는지 검증
+def test_evicts_by_approximate_bytes() -> None:
+    flights = [{"airline": "x" * 100, "price": 1}]
+    cache = FareCache(max_bytes=300)
+    cache.set("a", flights, ttl=10)
+    cache.set("b", flights, ttl=10)
+    cache.set("c", flights, ttl=10)
+
+    assert len(cache) == 2
+    assert cache.get("a")[1] == MISS
+    assert cache.stats()["bytes"] <= 300
+
+
+# 대소문자/공백/불필요한 파라미터 차이가 있어도 같은 검색이면 같은 키가 나오는지 검증
+def test_search_key_normalizes_params() -> None:
+    first = search_key({"origin": "icn ", "destination": "NRT", "departure_date": "2024-04-01"})
+    second = search_key({"destination": "nrt", "origin": "ICN", "departure_date": "2024-04-01", "passengers": "1", "top_k": 5})
+
+    assert first == second
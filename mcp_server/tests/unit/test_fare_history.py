@@ -0,0 +1,71 @@
+# MCP 서버 내부의 services/fare_history.py의 운임 이력 기록과 최저가 달력 갱신을 테스트하는 단위 테스트 모듈
+from datetime import date
+
+import pytest
+
+from mcp_server.services.fare_history import FareHistoryStore, month_range
+
+PARAMS = {"origin": "icn", "destination": "nrt", "departure_date": "2025-12-01"}
+
+
+# 테스트에서 관측 시각을 직접 지정할 수 있는 시계
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def flight(price, airline="KE", departure_date="2025-12-01", **extra):
+    return {"price": price, "currency": "KRW", "airline": airline, "departure_date": departure_date, **extra}
+
+
+# 달력은 출발일별 역대 최저가(min_*)와 가장 최근 묶음의 최저가(latest_*)를 따로 유지하고 견적 수를 누적
+def test_calendar_tracks_min_and_latest_incrementally() -> None:
+    clock = FakeClock(1_760_000_000.0)
+    store = FareHistoryStore(clock=clock)
+
+    assert store.record("skyscanner", [flight(300000), flight(250000, "OZ"), flight(280000, departure_date="2025-12-02")], PARAMS) == 3
+    clock.now += 3600
+    assert store.record("provider_b", [flight(320000, "7C")], PARAMS) == 1
+
+    (first, second) = store.calendar("ICN", "NRT", date(2025, 12, 1), date(2025, 12, 31), "krw")
+    assert first["departure_date"] == "2025-12-01"
+    assert (first["min_price"], first["min_provider"], first["min_airline"]) == (250000, "skyscanner", "OZ")
+    assert (first["latest_price"], first["latest_provider"], first["latest_airline"]) == (320000, "provider_b", "7C")
+    assert first["quotes"] == 3
+    assert second["departure_date"] == "2025-12-02" and second["min_price"] == 280000
+    assert store.stats()["recorded"] == 4
+
+
+# 모의 응답, 가격이 정수가 아닌 항공편은 기록하지 않음
+def test_record_skips_mock_and_unpriced_flights() -> None:
+    store = FareHistoryStore()
+    flights = [flight(100000, is_mock=True), flight(None), flight("90000"), flight(True)]
+    assert store.record("skyscanner", flights, PARAMS) == 0
+    assert store.calendar("ICN", "NRT", date(2025, 12, 1), date(2025, 12, 1), "KRW") == []
+
+
+# 가격 추이는 관측일별 최저가, 조회 기간(days) 이전의 견적은 제외
+def test_trend_groups_quotes_by_observed_day() -> None:
+    clock = FakeClock(1_760_000_000.0)
+    store = FareHistoryStore(clock=clock)
+    store.record("skyscanner", [flight(300000)], PARAMS)
+    clock.now += 86400
+    store.record("skyscanner", [flight(290000), flight(310000)], PARAMS)
+    clock.now += 40 * 86400
+    store.record("skyscanner", [flight(270000)], PARAMS)
+
+    points = store.trend("ICN", "NRT", date(2025, 12, 1), "KRW", days=30)
+    assert [(point["min_price"], point["quotes"]) for point in points] == [(270000, 1)]
+    points = store.trend("ICN", "NRT", date(2025, 12, 1), "KRW", days=60)
+    assert [(point["min_price"], point["quotes"]) for point in points] == [(300000, 1), (290000, 2), (270000, 1)]
+
+
+# 월(YYYY-MM) -> 첫날/마지막 날, 잘못된 형식은 ValueError
+def test_month_range() -> None:
+    assert month_range("2024-02") == (date(2024, 2, 1), date(2024, 2, 29))
+    assert month_range("2025-12") == (date(2025, 12, 1), date(2025, 12, 31))
+    with pytest.raises(ValueError):
+        month_range("2025-13")
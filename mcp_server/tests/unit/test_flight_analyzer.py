@@ -1,7 +1,7 @@
 # flight_analyzer.py는 항공편 데이터를 분석하는 기능이 들어있는 모듈
 
 # MCP 서버 내부의 services/flight_analyzer.py의 FlightAnalyzer 클래스를 테스트하는 단위 테스트 모듈
-from mcp_server.services.flight_analyzer import FlightAnalyzer
+from mcp_server.services.flight_analyzer import FlightAnalyzer, RankingWeights
 
 # FlightAnalyzer클래스의 find_cheapest가 항공권데이터(flights)중 가장 싼 항공편을 정확히 찾아 반환하는지 검증
 def test_find_cheapest_returns_lowest_price() -> None:
@@ -36,3 +36,67 @@ def test_average_price_handles_missing_prices() -> None:
     # 예상 평균가와 일치하는지 검증
     assert average == 600000.0
 
+
+
+# rank가 가격순 상위 K개만 반환하고, 동점일 때는 입력 순서를 유지하는지 검증
+def test_rank_returns_top_k_with_stable_ties() -> None:
+    # 입력 값 : 최저가(400000)가 두 건인 항공권목록
+    flights = [
+        {"price": 500000, "airline": "A"},
+        {"price": 400000, "airline": "B"},
+        {"price": 900000, "airline": "C"},
+        {"price": 400000, "airline": "D"},
+    ]
+
+    ranked = FlightAnalyzer().rank(flights, top_k=3)
+
+    # 상위 3개만, 동점인 B가 D보다 먼저 와야 함
+    assert [flight["airline"] for flight in ranked] == ["B", "D", "A"]
+    # 원본 dict는 수정되지 않아야 함 (score는 복사본에만 추가)
+    assert "score" not in flights[1]
+
+
+# 가격 외에 소요 시간/경유/선호 항공사 가중치를 주면 순위가 바뀌는지 검증
+def test_rank_applies_multi_criteria_weights() -> None:
+    flights = [
+        {"price": 400000, "airline": "Cheap Air", "duration_minutes": 600, "stops": 2},
+        {"price": 450000, "airline": "Fast Air", "duration_minutes": 150, "stops": 0},
+    ]
+    weights = RankingWeights(price=1.0, duration=1.0, stops=0.5)
+
+    # 가격만 보면 Cheap Air가 1위
+    assert FlightAnalyzer().rank(flights, top_k=1)[0]["airline"] == "Cheap Air"
+    # 소요 시간/경유 가중치를 주면 Fast Air가 1위
+    assert FlightAnalyzer().rank(flights, top_k=1, weights=weights)[0]["airline"] == "Fast Air"
+    # 선호 항공사 벌점만 줘도 순위가 바뀜
+    preferred = RankingWeights().merged({"airline": 2})
+    ranked = FlightAnalyzer().rank(flights, top_k=1, weights=preferred, preferred_airlines=["fast air"])
+    assert ranked[0]["airline"] == "Fast Air"
+
+
+# bool 가격은 숫자(True == 1)로 보지 않고 값이 없는 항공편처럼 가장 나쁜 점수를 받는지 검증
+def test_rank_treats_bool_prices_as_missing() -> None:
+    flights = [
+        {"price": True, "airline": "Bool Air"},
+        {"price": 400000, "airline": "A"},
+        {"price": 420000, "airline": "B"},
+        {"price": 500000, "airline": "C"},
+    ]
+
+    ranked = FlightAnalyzer().rank(flights, top_k=4)
+
+    assert [flight["airline"] for flight in ranked] == ["A", "B", "Bool Air", "C"]
+    assert ranked[2]["score"] == 1.0
+
+
+# 선호 항공사를 문자열 하나로 넘겨도 글자 단위가 아닌 항공사 이름 하나로 처리하는지 검증
+def test_rank_accepts_single_preferred_airline_string() -> None:
+    flights = [
+        {"price": 400000, "airline": "a"},
+        {"price": 450000, "airline": "Fast Air"},
+    ]
+    weights = RankingWeights().merged({"airline": 2})
+
+    ranked = FlightAnalyzer().rank(flights, top_k=2, weights=weights, preferred_airlines="Fast Air")
+
+    assert [flight["airline"] for flight in ranked] == ["Fast Air", "a"]
@@ -0,0 +1,57 @@
+# MCP 서버 내부의 services/itinerary_merger.py의 공급자 간 중복 여정 병합을 테스트하는 단위 테스트 모듈
+from mcp_server.services.itinerary_merger import ItineraryMerger, itinerary_fingerprint, merge_itineraries
+
+
+# 같은 항공사/편명/날짜의 여정은 최저가 하나로 병합되고 다른 판매처는 alternates에 남는지 검증
+def test_merge_keeps_cheapest_offer_and_records_alternates() -> None:
+    skyscanner = [
+        {"airline": "KE", "flight_numbers": ["KE 703"], "departure_date": "2025-01-10", "price": 500000},
+        {"airline": "OZ", "flight_number": "OZ102", "departure_date": "2025-01-10", "price": 450000},
+    ]
+    provider_b = [
+        {"airline": "ke", "flight_numbers": ["KE703"], "departure_date": "2025-01-10", "price": 480000},
+        {"airline": "KE", "flight_numbers": ["KE703"], "departure_date": "2025-01-11", "price": 300000},
+    ]
+
+    merged = merge_itineraries([("skyscanner", skyscanner), ("provider_b", provider_b)])
+
+    # KE703(1/10)은 한 건으로 합쳐지고, 처음 등장한 순서는 유지됨
+    assert [(flight["airline"], flight["price"]) for flight in merged] == [("ke", 480000), ("OZ", 450000), ("KE", 300000)]
+    assert merged[0]["provider"] == "provider_b"
+    assert merged[0]["alternates"] == [{"provider": "skyscanner", "price": 500000, "currency": None}]
+    # 입력 dict는 수정되지 않음
+    assert "provider" not in skyscanner[0]
+
+
+# 편명이 없는 항공편은 같은 여정인지 알 수 없으므로 병합하지 않는지 검증
+def test_flights_without_flight_numbers_are_not_merged() -> None:
+    flight = {"airline": "Mock Air", "departure_date": "2025-01-10", "price": 1}
+
+    assert itinerary_fingerprint(flight) is None
+    assert len(merge_itineraries([("a", [flight]), ("b", [flight])])) == 2
+
+
+# 공급자 목록을 하나씩 이어서 병합하면 새 여정과 대표 판매처가 바뀐 기존 여정 위치를 따로 돌려주는지 검증
+def test_incremental_merge_reports_new_and_changed_itineraries() -> None:
+    merger = ItineraryMerger()
+    first = [
+        {"airline": "KE", "flight_numbers": ["KE703"], "departure_date": "2025-01-10", "price": 500000},
+        {"airline": "OZ", "flight_number": "OZ102", "departure_date": "2025-01-10", "price": 450000},
+    ]
+    second = [
+        {"airline": "KE", "flight_numbers": ["KE703"], "departure_date": "2025-01-10", "price": 480000},
+        {"airline": "OZ", "flight_number": "OZ102", "departure_date": "2025-01-10", "price": 470000},
+        {"airline": "JL", "flight_number": "JL90", "departure_date": "2025-01-10", "price": 390000},
+        {"airline": "JL", "flight_number": "JL90", "departure_date": "2025-01-10", "price": 380000},
+    ]
+
+    added, changed = merger.add("skyscanner", first)
+    assert ([flight["airline"] for flight in added], changed) == (["KE", "OZ"], [])
+
+    added, changed = merger.add("provider_b", second)
+    # 이번 목록 안에서 처음 등장한 JL90은 새 여정이며 (중복은 그 안에서 병합), 기존 두 여정은 바뀐 위치로 보고됨
+    assert [(flight["airline"], flight["price"]) for flight in added] == [("JL", 380000)]
+    assert changed == [0, 1]
+    assert merger.merged[0]["price"] == 480000 and merger.merged[0]["provider"] == "provider_b"
+    assert merger.merged[1]["alternates"] == [{"provider": "provider_b", "price": 470000, "currency": None}]
+    assert merger.merged == merge_itineraries([("skyscanner", first), ("provider_b", second)])
@@ -0,0 +1,50 @@
+# JSON-RPC 요청 검증/알림 판별 함수의 단위 테스트 모듈
+import pytest
+
+from mcp_server.protocols.json_rpc import INVALID_REQUEST, JSONRPCException, is_notification, parse_request
+
+
+# 올바른 요청 객체가 JSONRPCRequest로 변환되는지 검증
+def test_parse_request_accepts_valid_call() -> None:
+    request = parse_request({"jsonrpc": "2.0", "method": "searchFlights", "params": {"destination": "NRT"}, "id": 7})
+
+    assert request.method == "searchFlights"
+    assert request.params == {"destination": "NRT"}
+    assert request.id == 7
+
+
+# method가 없거나 params 형식이 잘못된 요청은 Invalid Request 예외가 발생하는지 검증
+@pytest.mark.parametrize(
+    "data",
+    [
+        1,
+        {"jsonrpc": "2.0", "id": 1},
+        {"jsonrpc": "2.0", "method": "searchFlights", "params": [1, 2]},
+        {"jsonrpc": "2.0", "method": "x", "id": {"a": 1}},
+    ],
+)
+def test_parse_request_rejects_invalid_objects(data) -> None:
+    with pytest.raises(JSONRPCException) as exc_info:
+        parse_request(data)
+
+    assert exc_info.value.error.code == INVALID_REQUEST
+
+
+# jsonrpc 멤버가 없거나 정확히 "2.0"이 아닌 요청은 Invalid Request 예외가 발생하는지 검증
+@pytest.mark.parametrize("version", [None, "1.0", 2.0, "2"])
+def test_parse_request_requires_jsonrpc_2_0(version) -> None:
+    data = {"method": "searchFlights", "id": 1}
+    if version is not None:
+        data["jsonrpc"] = version
+
+    with pytest.raises(JSONRPCException) as exc_info:
+        parse_request(data)
+
+    assert exc_info.value.error.code == INVALID_REQUEST
+
+
+# id 멤버가 없는 호출만 알림으로 판별하는지 검증 (id가 null인 호출은 일반 요청)
+def test_is_notification_depends_on_missing_id() -> None:
+    assert is_notification({"method": "searchFlights"})
+    assert not is_notification({"method": "searchFlights", "id": None})
+    assert not is_notification({"method": "searchFlights", "id": "a"})
@@ -0,0 +1,36 @@
+# 공용 모듈 shared/metrics.py의 지표 레지스트리를 테스트하는 단위 테스트 모듈
+from shared.metrics import Registry
+
+
+# 히스토그램이 누적 구간 개수/합계/개수를 Prometheus 텍스트 형식으로 내보내는지 검증
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = Registry()
+    histogram = registry.histogram("demo_seconds", "Demo latency", ("route",), buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, "/rpc")
+
+    lines = registry.render().splitlines()
+    assert 'demo_seconds_bucket{route="/rpc",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{route="/rpc",le="1"} 2' in lines
+    assert 'demo_seconds_bucket{route="/rpc",le="+Inf"} 3' in lines
+    assert 'demo_seconds_count{route="/rpc"} 3' in lines
+    assert histogram.count("/rpc") == 3
+
+
+# 카운터/게이지가 레이블별로 따로 집계되고 레이블 값의 따옴표가 이스케이프되는지 검증
+def test_counter_and_gauge_by_label() -> None:
+    registry = Registry()
+    fallbacks = registry.counter("demo_total", "Demo counter", ("provider",))
+    in_flight = registry.gauge("demo_in_flight", "Demo gauge")
+
+    fallbacks.inc("skyscanner")
+    fallbacks.inc("skyscanner")
+    fallbacks.inc('say "hi"')
+    in_flight.inc()
+    in_flight.dec()
+
+    text = registry.render()
+    assert 'demo_total{provider="skyscanner"} 2' in text
+    assert 'demo_total{provider="say \\"hi\\""} 1' in text
+    assert "demo_in_flight 0" in text
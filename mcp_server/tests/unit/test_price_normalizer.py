@@ -0,0 +1,43 @@
+# MCP 서버 내부의 services/price_normalizer.py의 가격 파싱/통화 변환을 테스트하는 단위 테스트 모듈
+from mcp_server.services.price_normalizer import PriceNormalizer, parse_amount
+
+# 테스트용 환율표 (1 USD 기준)
+RATES = {"USD": 1.0, "KRW": 1400.0, "EUR": 0.5}
+
+
+# 통화 표기와 천 단위 구분자가 섞인 가격 문자열을 (금액, 통화)로 파싱하는지 검증
+def test_parse_amount_handles_common_formats() -> None:
+    assert parse_amount("1,234.50 EUR", None) == (1234.5, "EUR")
+    assert parse_amount("€1.234,50", None) == (1234.5, "EUR")
+    assert parse_amount("₩750,000", None) == (750000.0, "KRW")
+    assert parse_amount(690000, "KRW") == (690000.0, "KRW")
+    assert parse_amount({"amount": "99.9", "currency": "usd"}, None) == (99.9, "USD")
+    assert parse_amount("price on request", "KRW") == (None, None)
+
+
+# 여러 통화의 가격이 목표 통화의 정수 보조 단위로 변환되고 원본 dict는 수정되지 않는지 검증
+def test_normalize_converts_to_target_minor_units() -> None:
+    flights = [
+        {"airline": "A", "price": "1,234.50 EUR"},
+        {"airline": "B", "price": 100, "currency": "USD"},
+        {"airline": "C", "price": 750000},
+        {"airline": "D", "price": "sold out"},
+    ]
+
+    krw = PriceNormalizer("KRW", RATES).normalize(flights, provider_currency="KRW")
+    usd = PriceNormalizer("USD", RATES).normalize(flights, provider_currency="KRW")
+
+    # EUR 1234.5 -> USD 2469 -> KRW 3,456,600 / KRW는 보조 단위가 없음
+    assert [flight["price"] for flight in krw] == [3456600, 140000, 750000, None]
+    # USD는 센트 단위 정수
+    assert [flight["price"] for flight in usd] == [246900, 10000, 53571, None]
+    assert {flight["currency"] for flight in usd} == {"USD"}
+    assert flights[0]["price"] == "1,234.50 EUR"
+
+
+# dict 금액은 숫자/문자열 모두 처리하고, bool이나 해석할 수 없는 금액은 None으로 보는지 검증
+def test_parse_amount_of_dict_amounts() -> None:
+    assert parse_amount({"amount": 120, "currency": "eur"}, "KRW") == (120.0, "EUR")
+    assert parse_amount({"amount": "1.234,50"}, "EUR") == (1234.5, "EUR")
+    assert parse_amount({"amount": True, "currency": "USD"}, None) == (None, "USD")
+    assert parse_amount({"amount": "n/a", "currency": "USD"}, None) == (None, "USD")
@@ -0,0 +1,71 @@
+# 비동기 함수 실행을 위한 내장 모듈
+import asyncio
+# 대기열의 다음 호출에 토큰을 넘겨주는 동작을 재현하기 위한 힙 모듈
+import heapq
+
+# MCP 서버 내부의 core/rate_limiter.py의 토큰 버킷 + 우선순위 대기열을 테스트하는 단위 테스트 모듈
+from mcp_server.core.rate_limiter import (
+    PRIORITY_INTERACTIVE,
+    PRIORITY_PREWARM,
+    PRIORITY_REFRESH,
+    PriorityRateLimiter,
+    request_priority,
+)
+
+
+# burst만큼은 바로 통과하고, 그 뒤 대기 중인 호출은 우선순위(사용자 검색 먼저) 순서로 나가는지 검증
+def test_queued_calls_are_released_by_priority() -> None:
+    order = []
+
+    async def call(limiter: PriorityRateLimiter, name: str, priority: int) -> None:
+        request_priority.set(priority)
+        await limiter.acquire()
+        order.append(name)
+
+    async def run() -> PriorityRateLimiter:
+        limiter = PriorityRateLimiter(rate=50, burst=1)
+        await limiter.acquire()
+        # 토큰이 없는 상태에서 낮은 우선순위부터 대기열에 들어감
+        await asyncio.gather(
+            call(limiter, "prewarm", PRIORITY_PREWARM),
+            call(limiter, "refresh", PRIORITY_REFRESH),
+            call(limiter, "user", PRIORITY_INTERACTIVE),
+        )
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert order == ["user", "refresh", "prewarm"]
+    stats = limiter.stats()
+    assert stats["acquired"] == 4
+    assert stats["queued"] == 3
+    assert stats["max_wait_ms"] > 0
+
+
+# 토큰이 없으면 try_acquire는 기다리지 않고 False를 반환하는지 검증
+def test_try_acquire_does_not_wait() -> None:
+    limiter = PriorityRateLimiter(rate=1, burst=2)
+
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+# 토큰을 받은 직후(깨어나기 전) 취소된 호출은 토큰을 버킷에 돌려주는지 검증 (헤지/마감 시간 취소)
+def test_cancelled_waiter_returns_granted_token() -> None:
+    async def run() -> bool:
+        # 시간이 흐르지 않는 시계: 토큰이 충전되지 않음
+        limiter = PriorityRateLimiter(rate=1, burst=1, clock=lambda: 0.0)
+        assert limiter.try_acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        # _dispatch와 같이 대기열의 첫 호출에 토큰을 넘겨준 뒤, 그 호출이 깨어나기 전에 취소
+        heapq.heappop(limiter._queue)[2].set_result(None)
+        waiter.cancel()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            pass
+        limiter._dispatcher.cancel()
+        return limiter.try_acquire()
+
+    assert asyncio.run(run())
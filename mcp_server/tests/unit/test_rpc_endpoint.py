@@ -0,0 +1,121 @@
+# MCP 서버 /rpc 엔드포인트의 JSON-RPC 배치/알림 처리를 테스트하는 단위 테스트 모듈
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mcp_server import main
+from mcp_server.main import app
+from mcp_server.services.api_integrator import ProviderStatus
+from mcp_server.protocols.json_rpc import INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND
+
+
+# 공급자 API 키가 없는 환경이라 searchFlights는 모의 응답으로 처리됨
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.delenv("SKYSCANNER_API_KEY", raising=False)
+    monkeypatch.delenv("PROVIDER_B_API_KEY", raising=False)
+    return TestClient(app)
+
+
+def search_call(request_id=None, **params) -> dict:
+    call = {"jsonrpc": "2.0", "method": "searchFlights", "params": {"origin": "ICN", "destination": "NRT", **params}}
+    if request_id is not None:
+        call["id"] = request_id
+    return call
+
+
+# 정상 호출/잘못된 호출/알림이 섞인 배치는 알림을 제외한 호출마다 요청 순서대로 응답하는지 검증
+def test_mixed_batch_answers_each_call_in_request_order(client: TestClient) -> None:
+    batch = [
+        search_call("first"),
+        {"jsonrpc": "2.0", "method": "unknownMethod", "id": 2},
+        search_call(),  # 알림
+        {"jsonrpc": "2.0", "params": {}, "id": 3},  # method 없음
+        1,  # 요청 객체가 아님
+        search_call(4, top_k=1),
+    ]
+
+    response = client.post("/rpc", json=batch)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body] == ["first", 2, 3, None, 4]
+    assert body[0]["error"] is None and body[0]["result"]["flights"]
+    assert body[1]["error"]["code"] == METHOD_NOT_FOUND
+    assert body[2]["error"]["code"] == INVALID_REQUEST
+    assert body[3]["error"]["code"] == INVALID_REQUEST
+    assert body[4]["error"] is None and len(body[4]["result"]["flights"]) == 1
+
+
+# 빈 배치는 배열이 아닌 Invalid Request 단건 응답
+def test_empty_batch_is_invalid_request(client: TestClient) -> None:
+    response = client.post("/rpc", json=[])
+
+    assert response.status_code == 200
+    assert response.json()["error"]["code"] == INVALID_REQUEST
+    assert response.json()["id"] is None
+
+
+# 알림만 담은 배치와 단건 알림은 실행만 하고 본문 없이 204로 응답
+def test_notification_only_batch_returns_no_content(client: TestClient) -> None:
+    response = client.post("/rpc", json=[search_call(), {"jsonrpc": "2.0", "method": "unknownMethod"}])
+
+    assert response.status_code == 204
+    assert response.content == b""
+    assert client.post("/rpc", json=search_call()).status_code == 204
+
+
+# 승객 수가 숫자가 아니면 HTTP 500이 아니라 Invalid params 오류로 응답하는지 검증 (스트리밍 검색 포함)
+@pytest.mark.parametrize("path", ["/rpc", "/rpc/stream"])
+def test_invalid_passengers_is_invalid_params(client: TestClient, path: str) -> None:
+    response = client.post(path, json=search_call(9, passengers="abc"))
+
+    assert response.status_code == 200
+    assert response.json()["id"] == 9
+    assert response.json()["error"]["code"] == INVALID_PARAMS
+
+
+# top_k가 0, 음수, 숫자가 아닌 값이면 기본값으로 대체하지 않고 Invalid params 오류로 응답하는지 검증
+@pytest.mark.parametrize("top_k", [0, -3, "many"])
+def test_out_of_range_top_k_is_invalid_params(client: TestClient, top_k) -> None:
+    response = client.post("/rpc", json=search_call(5, top_k=top_k))
+
+    assert response.json()["error"]["code"] == INVALID_PARAMS
+
+
+# jsonrpc 멤버가 없거나 "2.0"이 아닌 호출은 실행하지 않고 Invalid Request로 응답하는지 검증
+def test_call_without_jsonrpc_2_0_is_invalid_request(client: TestClient) -> None:
+    legacy = {"method": "searchFlights", "params": {"origin": "ICN", "destination": "NRT"}, "id": 6}
+
+    single = client.post("/rpc", json=legacy).json()
+    batch = client.post("/rpc", json=[legacy, {**legacy, "jsonrpc": "1.0", "id": 7}, search_call(8)]).json()
+
+    assert single["id"] == 6 and single["error"]["code"] == INVALID_REQUEST
+    assert [item["id"] for item in batch] == [6, 7, 8]
+    assert [item["error"]["code"] for item in batch[:2]] == [INVALID_REQUEST, INVALID_REQUEST]
+    assert batch[2]["error"] is None
+
+
+# 스트리밍 검색은 공급자 응답 사이의 같은 여정을 한 번만 보내고, 더 싼 판매처는 updated로 같은 위치에 다시 보내는지 검증
+def test_stream_sends_each_itinerary_once(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    ke703 = {"airline": "KE", "flight_numbers": ["KE703"], "departure_date": "2025-01-10"}
+    batches = [
+        ("skyscanner", [{**ke703, "price": 500000}, {"airline": "OZ", "flight_number": "OZ102", "price": 450000}]),
+        ("provider_b", [{**ke703, "price": 480000}, {"airline": "JL", "flight_number": "JL90", "price": 390000}]),
+    ]
+
+    async def stream_flights(params):
+        for provider, flights in batches:
+            yield flights, ProviderStatus(provider, "ok", 1.0, count=len(flights))
+
+    monkeypatch.setattr(main.integrator, "stream_flights", stream_flights)
+
+    response = client.post("/rpc/stream", json=search_call(1))
+    first, second, summary = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [flight["airline"] for flight in first["flights"]] == ["KE", "OZ"] and first["updated"] == []
+    assert [flight["airline"] for flight in second["flights"]] == ["JL"]
+    assert [(change["index"], change["flight"]["price"]) for change in second["updated"]] == [(0, 480000)]
+    assert summary["count"] == 3
+    assert summary["cheapest"]["airline"] == "JL"
@@ -0,0 +1,60 @@
+# 같은 키의 동시 호출을 하나로 합치는 SingleFlight의 단위 테스트 모듈
+import asyncio
+
+from mcp_server.services.single_flight import SingleFlight
+
+
+# 동시에 들어온 같은 키의 호출은 한 번만 실행되고 모두 같은 결과를 받는지 검증
+def test_concurrent_calls_share_one_execution() -> None:
+    single_flight = SingleFlight()
+    executions = []
+
+    async def work():
+        executions.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def run():
+        return await asyncio.gather(*(single_flight.do("key", work) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert results == ["result"] * 5
+    assert len(executions) == 1
+    assert single_flight.stats() == {"calls": 5, "executions": 1, "merged": 4, "in_flight": 0}
+
+
+# 호출자 한 명이 취소되어도 공유 작업은 취소되지 않고 다른 호출자는 결과를 받는지 검증
+def test_cancelled_caller_does_not_cancel_shared_work() -> None:
+    single_flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def run():
+        first = asyncio.ensure_future(single_flight.do("key", work))
+        second = asyncio.ensure_future(single_flight.do("key", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second, first.cancelled()
+
+    result, first_cancelled = asyncio.run(run())
+
+    assert result == "done"
+    assert first_cancelled
+
+
+# 작업이 끝난 뒤의 호출은 다시 새로 실행되는지 검증
+def test_completed_work_is_not_reused() -> None:
+    single_flight = SingleFlight()
+    executions = []
+
+    async def work():
+        executions.append(1)
+        return len(executions)
+
+    async def run():
+        return await single_flight.do("key", work), await single_flight.do("key", work)
+
+    assert asyncio.run(run()) == (1, 2)
@@ -0,0 +1,58 @@
+# 공용 모듈 shared/tracing.py의 트레이스 전파/스팬 기록을 테스트하는 단위 테스트 모듈
+import json
+
+from shared.tracing import FileSpanExporter, Tracer, parse_traceparent, trace_headers
+
+REMOTE = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+# traceparent 헤더 파싱: 정상 값은 (trace_id, parent_id, sampled), 잘못된 값은 None
+def test_parse_traceparent() -> None:
+    assert parse_traceparent(REMOTE) == ("0af7651916cd43dd8448eb211c80319c", "b7ad6b7169203331", True)
+    assert parse_traceparent(REMOTE[:-2] + "00")[2] is False
+    assert parse_traceparent("00-" + "0" * 32 + "-b7ad6b7169203331-01") is None
+    assert parse_traceparent("garbage") is None
+    assert parse_traceparent(None) is None
+
+
+# 상위 서비스의 트레이스를 이어 받은 스팬과 자식 스팬이 같은 트레이스로 한 번에 파일에 기록되는지 검증
+def test_spans_continue_remote_trace_and_export(tmp_path) -> None:
+    path = tmp_path / "spans.jsonl"
+    tracer = Tracer("test", exporter=FileSpanExporter(path, "test"))
+
+    with tracer.span("POST /rpc", remote=REMOTE) as root:
+        with tracer.span("provider.call", {"provider": "skyscanner"}) as child:
+            assert trace_headers()["traceparent"] == child.traceparent()
+        # 루트 스팬이 끝나기 전에는 파일에 쓰지 않음
+        assert not path.exists()
+    # 기록 스레드가 넘겨받은 스팬을 모두 쓸 때까지 기다림
+    tracer.shutdown()
+
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [span["name"] for span in spans] == ["provider.call", "POST /rpc"]
+    assert {span["trace_id"] for span in spans} == {"0af7651916cd43dd8448eb211c80319c"}
+    assert spans[0]["parent_id"] == root.span_id
+    assert spans[1]["parent_id"] == "b7ad6b7169203331"
+    assert spans[0]["attributes"] == {"provider": "skyscanner"}
+    assert trace_headers() == {}
+
+
+# 샘플링되지 않은 트레이스는 ID는 전파하지만 기록하지 않고, 예외는 status=error로 기록되는지 검증
+def test_sampling_and_error_status(tmp_path) -> None:
+    path = tmp_path / "spans.jsonl"
+    tracer = Tracer("test", sample_rate=0.0, exporter=FileSpanExporter(path, "test"))
+
+    with tracer.span("unsampled") as span:
+        assert span.traceparent().endswith("-00")
+    assert not path.exists()
+
+    tracer.sample_rate = 1.0
+    try:
+        with tracer.span("failing"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    tracer.shutdown()
+    (record,) = [json.loads(line) for line in path.read_text().splitlines()]
+    assert record["status"] == "error"
+    assert record["attributes"]["error"] == "RuntimeError"
@@ -0,0 +1,79 @@
+# 공용 모듈 shared/wire.py의 본문 형식/압축 협상과 MCP 서버 /rpc의 적용을 테스트하는 단위 테스트 모듈
+import asyncio
+import gzip
+from datetime import date
+
+import httpx
+import pytest
+
+from shared.wire import MEDIA_JSON, MEDIA_MSGPACK, BodyTooLargeError, decode_body, encode_body, negotiate_encoding
+from mcp_server.main import app
+
+# /rpc에 본문을 그대로 보내고 응답을 돌려받는 헬퍼 함수
+def post_rpc(content: bytes, headers) -> httpx.Response:
+    async def send() -> httpx.Response:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://mcp") as client:
+            return await client.post("/rpc", content=content, headers=headers)
+
+    return asyncio.run(send())
+
+
+PAYLOAD = {"result": {"flights": [{"airline": "KE", "price": 350000, "departure_date": date(2025, 4, 1)}] * 50}, "id": 1}
+
+
+# Accept-Encoding을 보내지 않았거나 본문이 작으면 압축하지 않고, 크면 gzip으로 압축 후 그대로 복원되는지 검증
+def test_json_body_is_gzipped_only_above_threshold() -> None:
+    body, headers = encode_body(PAYLOAD)
+    assert headers["content-type"] == MEDIA_JSON and "content-encoding" not in headers
+
+    body, headers = encode_body(PAYLOAD, MEDIA_JSON, "gzip, deflate", min_bytes=10**9)
+    assert "content-encoding" not in headers
+
+    body, headers = encode_body(PAYLOAD, MEDIA_JSON, "gzip, deflate", min_bytes=64)
+    assert headers["content-encoding"] == "gzip"
+    decoded = decode_body(body, headers["content-type"], headers["content-encoding"])
+    assert decoded["result"]["flights"][0] == {"airline": "KE", "price": 350000, "departure_date": "2025-04-01"}
+    assert negotiate_encoding("br;q=1, identity") is None
+
+
+# 해제/파싱할 수 없는 본문은 ValueError
+def test_decode_body_rejects_invalid_bodies() -> None:
+    with pytest.raises(ValueError):
+        decode_body(b"{not json")
+    with pytest.raises(ValueError):
+        decode_body(b"{}", MEDIA_JSON, "br")
+
+
+# msgpack이 설치되어 있으면 Accept 헤더로 msgpack 본문을 받고, msgpack 요청 본문도 읽을 수 있는지 검증
+def test_msgpack_round_trip() -> None:
+    msgpack = pytest.importorskip("msgpack")
+    body, headers = encode_body(PAYLOAD, f"{MEDIA_MSGPACK}, {MEDIA_JSON};q=0.9")
+    assert headers["content-type"] == MEDIA_MSGPACK
+    assert decode_body(body, MEDIA_MSGPACK)["result"]["flights"][0]["price"] == 350000
+
+    request = msgpack.packb({"jsonrpc": "2.0", "method": "unknown", "id": 3})
+    response = post_rpc(request, {"content-type": MEDIA_MSGPACK, "accept": MEDIA_MSGPACK})
+    assert msgpack.unpackb(response.content)["error"]["code"] == -32601
+
+
+# /rpc는 gzip으로 압축된 요청 본문을 읽고, 잘못된 본문은 Parse error로 응답하는지 검증
+def test_rpc_endpoint_reads_compressed_requests() -> None:
+    headers = {"content-type": MEDIA_JSON, "content-encoding": "gzip"}
+    response = post_rpc(gzip.compress(b'{"jsonrpc": "2.0", "method": "unknown", "id": 4}'), headers)
+    assert response.json()["error"]["code"] == -32601
+
+    response = post_rpc(b"\x00garbage", headers)
+    assert response.json()["error"]["code"] == -32700
+
+
+# 해제한 크기가 max_bytes를 넘는 압축 본문(압축 폭탄)은 끝까지 풀지 않고 거부하며, /rpc는 413으로 응답하는지 검증
+def test_decompression_is_capped() -> None:
+    bomb = gzip.compress(b" " * 20 * 1024 * 1024)
+    assert len(bomb) < 64 * 1024
+    with pytest.raises(BodyTooLargeError):
+        decode_body(bomb, MEDIA_JSON, "gzip", max_bytes=1024 * 1024)
+    assert decode_body(gzip.compress(b"[1, 2]"), MEDIA_JSON, "gzip", max_bytes=6) == [1, 2]
+
+    response = post_rpc(bomb, {"content-type": MEDIA_JSON, "content-encoding": "gzip"})
+    assert response.status_code == 413
+    assert response.json()["error"]["code"] == -32600
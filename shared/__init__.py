@@ -0,0 +1 @@
+#BE와 MCP 서버가 함께 사용하는 공용 모듈 (지표, 트레이싱, JSON-RPC 본문 형식/압축 협상, 가격 문자열 파싱)
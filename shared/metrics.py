@@ -0,0 +1,175 @@
+#타입 어노테이션 평가 방식을 변화시키는 모듈
+from __future__ import annotations
+
+#관측값이 들어갈 히스토그램 구간을 이진 탐색으로 찾기 위한 모듈
+from bisect import bisect_left
+
+#요청 처리 시간을 측정하기 위한 모듈
+import time
+
+#타입 힌트로 사용되는 모듈
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+#외부 라이브러리 없이 Prometheus 텍스트 형식(/metrics)으로 내보내는 최소한의 지표 레지스트리 (BE와 MCP 서버 공용)
+#서비스별 레지스트리와 지표 정의는 각 서비스의 core/metrics.py에 있다
+#지표는 모두 이벤트 루프 스레드에서 기록되므로 잠금 없이 dict/list 증가만 수행 (요청당 수백 ns 수준)
+
+#기본 지연 시간 구간(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+#레이블 값 튜플
+Labels = Tuple[str, ...]
+
+#지표 공통 기반 클래스 (이름, 설명, 레이블 이름)
+class _Metric:
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+
+    def _labels(self, values: Labels, extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+#증가만 하는 누적 카운터
+class Counter(_Metric):
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        lines.extend(f"{self.name}{self._labels(labels)} {_number(value)}" for labels, value in self._values.items())
+        return lines
+
+#올라가고 내려가는 현재 값 (진행 중인 요청 수 등)
+class Gauge(Counter):
+    TYPE = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+#구간별 관측 횟수 + 합계 + 개수를 기록하는 히스토그램
+class Histogram(_Metric):
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        #레이블 -> [구간별 개수..., +Inf 개수, 합계]
+        self._series: Dict[Labels, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0.0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    #관측 횟수 (테스트/상태 확인용)
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for labels, series in self._series.items():
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                bucket = self._labels(labels, 'le="' + _number(bound) + '"')
+                lines.append(f"{self.name}_bucket{bucket} {_number(cumulative)}")
+            cumulative += series[len(self.buckets)]
+            bucket = self._labels(labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{bucket} {_number(cumulative)}")
+            lines.append(f"{self.name}_sum{self._labels(labels)} {series[-1]!r}")
+            lines.append(f"{self.name}_count{self._labels(labels)} {_number(cumulative)}")
+        return lines
+
+#지표 모음, /metrics 응답 본문을 만든다
+class Registry:
+
+    def __init__(self) -> None:
+        self._metrics: List[_Metric] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: Any) -> Any:
+        self._metrics.append(metric)
+        return metric
+
+#HTTP 요청마다 라우트별 처리 시간과 진행 중인 요청 수를 기록하는 ASGI 미들웨어
+#라우트는 실제 경로가 아니라 등록된 경로 템플릿으로 기록해 레이블 수가 늘어나지 않도록 함
+class MetricsMiddleware:
+
+    def __init__(self, app: Callable, duration: Histogram, in_flight: Gauge) -> None:
+        self.app = app
+        self.duration = duration
+        self.in_flight = in_flight
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = ["500"]
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = str(message["status"])
+            await send(message)
+
+        started = time.perf_counter()
+        self.in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.in_flight.dec()
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            self.duration.observe(time.perf_counter() - started, path, scope["method"], status[0])
+
+#Prometheus 텍스트 형식의 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
@@ -0,0 +1,74 @@
+#타입 어노테이션 평가 방식을 변화시키는 모듈
+from __future__ import annotations
+
+#"1,234.50 EUR", "₩750,000" 같은 가격 문자열을 파싱하기 위한 정규식 모듈
+import re
+
+#같은 가격 문자열의 파싱 결과를 캐시하기 위한 데코레이터
+from functools import lru_cache
+
+#타입 힌트로 사용되는 모듈
+from typing import Any, Optional, Tuple
+
+#가격 문자열에 자주 쓰이는 통화 기호
+_CURRENCY_SYMBOLS = {"₩": "KRW", "¥": "JPY", "€": "EUR", "£": "GBP", "$": "USD"}
+
+_CODE_PATTERN = re.compile(r"\b([A-Z]{3})\b")
+_NUMBER_PATTERN = re.compile(r"-?\d[\d,.\s]*")
+
+#가격 값에서 (금액, 통화)를 추출하는 함수
+#숫자는 fallback_currency로 간주하고, {"amount", "currency"} dict와 "1,234.50 EUR" 같은 문자열도 처리
+#해석할 수 없으면 (None, None)
+def parse_amount(value: Any, fallback_currency: Optional[str]) -> Tuple[Optional[float], Optional[str]]:
+    if value is None or isinstance(value, bool):
+        return None, None
+    if isinstance(value, (int, float)):
+        return float(value), fallback_currency
+    if isinstance(value, dict):
+        amount = value.get("amount")
+        #dict 금액은 대부분 숫자이므로 문자열일 때만 파싱
+        if isinstance(amount, (int, float)) and not isinstance(amount, bool):
+            amount = float(amount)
+        else:
+            amount = _parse_text(amount, None)[0] if isinstance(amount, str) else None
+        return amount, str(value.get("currency") or fallback_currency or "").upper() or None
+    if not isinstance(value, str):
+        return None, None
+    return _parse_text(value, fallback_currency)
+
+#가격 문자열 파싱 (통화 코드/기호 + 숫자)
+#공급자 응답의 가격 문자열은 같은 값이 반복되므로 문자열별 결과를 캐시해서 정규식을 다시 실행하지 않음
+@lru_cache(maxsize=4096)
+def _parse_text(value: str, fallback_currency: Optional[str]) -> Tuple[Optional[float], Optional[str]]:
+    text = value.strip()
+    code = _CODE_PATTERN.search(text.upper())
+    currency = code.group(1) if code else next(
+        (symbol_code for symbol, symbol_code in _CURRENCY_SYMBOLS.items() if symbol in text),
+        fallback_currency,
+    )
+    number = _NUMBER_PATTERN.search(text)
+    if not number:
+        return None, None
+    amount = _parse_number(number.group(0))
+    return (amount, currency) if amount is not None else (None, None)
+
+#천 단위 구분자와 소수점이 섞인 숫자 문자열을 float로 변환
+#쉼표/마침표가 모두 있으면 뒤에 오는 쪽이 소수점, 하나만 있으면 뒤에 정확히 3자리가 올 때 천 단위 구분자로 본다
+def _parse_number(raw: str) -> Optional[float]:
+    digits = raw.replace(" ", "").rstrip(",.")
+    if "," in digits and "." in digits:
+        decimal = "," if digits.rfind(",") > digits.rfind(".") else "."
+        thousands = "." if decimal == "," else ","
+        digits = digits.replace(thousands, "").replace(decimal, ".")
+    else:
+        for separator in (",", "."):
+            if separator in digits:
+                head, _, tail = digits.rpartition(separator)
+                if len(tail) == 3 or digits.count(separator) > 1:
+                    digits = digits.replace(separator, "")
+                else:
+                    digits = head.replace(separator, "") + "." + tail
+    try:
+        return float(digits)
+    except ValueError:
+        return None
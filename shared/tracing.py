@@ -0,0 +1,340 @@
+#타입 어노테이션 평가 방식을 변화시키는 모듈
+from __future__ import annotations
+
+#스팬 파일을 한 줄에 하나씩 JSON으로 기록하기 위한 모듈
+import json
+
+#파일 기록 오류를 남기기 위한 로깅 모듈
+import logging
+
+#트레이스/스팬 ID 생성과 샘플링 판단에 쓰는 난수 모듈
+import os
+import random
+
+#스팬 묶음을 이벤트 루프 밖의 기록 스레드로 넘기기 위한 모듈
+import queue
+import threading
+
+#스팬 시작 시각(에포크)과 소요 시간 측정을 위한 모듈
+import time
+
+#현재 요청의 활성 스팬을 비동기 태스크별로 보관하기 위한 컨텍스트 변수
+from contextvars import ContextVar
+
+#스팬을 with 블록으로 열고 닫기 위한 데코레이터
+from contextlib import contextmanager
+
+#스팬 데이터 클래스
+from dataclasses import dataclass, field
+
+#내보낼 파일 경로 처리
+from pathlib import Path
+
+#타입 힌트로 사용되는 모듈
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+#BE -> MCP 서버 -> 공급자 호출 단계별 소요 시간을 기록하는 최소한의 분산 트레이싱
+#트레이스 ID는 W3C traceparent 헤더(00-<trace_id>-<span_id>-<flags>)로 전달되고,
+#샘플링된 트레이스의 스팬만 로컬 JSONL 파일(또는 OTLP/JSON 형식)로 내보낸다
+#BE와 MCP 서버 공용, 서비스별 전역 트레이서(TRACER)는 각 서비스의 core/tracing.py에 있다
+
+#트레이스 컨텍스트를 전달하는 HTTP 헤더 이름
+TRACEPARENT = "traceparent"
+
+#내보내기 형식 (스팬 하나당 한 줄 / OpenTelemetry Collector의 otlpjsonfile 수신기 형식)
+FORMAT_JSONL = "jsonl"
+FORMAT_OTLP = "otlp"
+
+""" 단계 하나의 소요 시간 기록 (이름, 트레이스/스팬 ID, 부모 스팬, 속성, 상태) """
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    sampled: bool
+    start_ns: int = 0
+    duration_ns: int = 0
+    status: str = "ok"
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    #같은 프로세스 안에 부모 스팬이 없는 스팬 (요청의 첫 스팬) 여부
+    local_root: bool = False
+    _started: int = 0
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    #하위 호출에 전달할 traceparent 헤더 값
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+#현재 활성 스팬 (요청/태스크마다 독립적)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+#현재 스팬을 부모로 하는 traceparent 헤더 (활성 스팬이 없으면 빈 dict)
+def trace_headers(span: Optional[Span] = None) -> Dict[str, str]:
+    span = span or _current_span.get()
+    return {TRACEPARENT: span.traceparent()} if span is not None else {}
+
+#traceparent 헤더를 (trace_id, parent_span_id, sampled)로 파싱, 형식이 잘못되면 None
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    if not value:
+        return None
+    parts = value.strip().lower().split("-")
+    if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16 or len(parts[3]) != 2:
+        return None
+    version, trace_id, span_id, flags = parts[:4]
+    if version == "ff" or trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    try:
+        int(trace_id, 16), int(span_id, 16)
+        sampled = bool(int(flags, 16) & 1)
+    except ValueError:
+        return None
+    return trace_id, span_id, sampled
+
+def _new_id(nbytes: int) -> str:
+    return os.urandom(nbytes).hex()
+
+""" 끝난 스팬을 모아 두었다가 요청 단위로 기록 스레드에 넘겨 파일에 추가하는 내보내기 """
+
+class FileSpanExporter:
+
+    def __init__(self, path: str | Path, service: str, fmt: str = FORMAT_JSONL, max_buffer: int = 256) -> None:
+        if fmt not in (FORMAT_JSONL, FORMAT_OTLP):
+            raise ValueError(f"Unknown trace export format: {fmt}")
+        self.path = Path(path)
+        self.service = service
+        self.format = fmt
+        self.max_buffer = max_buffer
+        self.logger = logging.getLogger(__name__)
+        self._buffer: List[Span] = []
+        #기록 스레드로 넘긴 스팬 묶음 (None은 종료 신호)
+        self._queue: "queue.SimpleQueue[Optional[List[Span]]]" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+
+    #요청의 첫 스팬이 끝나거나 버퍼가 차면 기록 스레드로 넘김 (요청 처리 중에는 파일 I/O를 하지 않음)
+    def export(self, span: Span) -> None:
+        self._buffer.append(span)
+        if span.local_root or len(self._buffer) >= self.max_buffer:
+            self.flush()
+
+    #모아 둔 스팬을 기록 스레드로 넘김 (기다리지 않음), 기록 스레드는 처음 필요할 때 시작
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        spans, self._buffer = self._buffer, []
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name=f"{self.service}-span-writer", daemon=True)
+                self._writer.start()
+        self._queue.put(spans)
+
+    #남은 스팬을 넘기고 기록 스레드가 모두 쓸 때까지 기다린 뒤 종료 (앱 종료 시)
+    def close(self) -> None:
+        self.flush()
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+
+    #기록 스레드: 쌓여 있는 묶음을 한 번에 꺼내 파일 쓰기 1회로 기록
+    def _run(self) -> None:
+        while True:
+            batch = self._queue.get()
+            stop = batch is None
+            spans = list(batch or [])
+            while not stop:
+                try:
+                    batch = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                stop = batch is None
+                spans.extend(batch or [])
+            if spans:
+                try:
+                    self._write(spans)
+                except Exception as exc:
+                    self.logger.error("Failed to export %d spans to %s: %s", len(spans), self.path, exc)
+            if stop:
+                return
+
+    def _write(self, spans: List[Span]) -> None:
+        if self.format == FORMAT_OTLP:
+            lines = [json.dumps(self._otlp(spans), separators=(",", ":"), default=str)]
+        else:
+            lines = [
+                json.dumps({"service": self.service, **span.to_dict()}, separators=(",", ":"), default=str)
+                for span in spans
+            ]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
+
+    #OTLP/JSON ExportTraceServiceRequest 한 줄 (Collector의 otlpjsonfile 수신기로 읽을 수 있음)
+    def _otlp(self, spans: List[Span]) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", self.service)]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": self.service},
+                            "spans": [
+                                {
+                                    "traceId": span.trace_id,
+                                    "spanId": span.span_id,
+                                    "parentSpanId": span.parent_id or "",
+                                    "name": span.name,
+                                    "kind": 2 if span.local_root else 1,
+                                    "startTimeUnixNano": str(span.start_ns),
+                                    "endTimeUnixNano": str(span.start_ns + span.duration_ns),
+                                    "attributes": [_otlp_attribute(key, value) for key, value in span.attributes.items()],
+                                    "status": {"code": 2 if span.status == "error" else 1},
+                                }
+                                for span in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+""" 스팬을 만들고 샘플링/내보내기를 담당하는 트레이서 """
+
+class Tracer:
+
+    def __init__(self, service: str, sample_rate: float = 1.0, exporter: Optional[FileSpanExporter] = None) -> None:
+        self.service = service
+        self.sample_rate = sample_rate
+        self.exporter = exporter
+
+    #설정값으로 샘플링 비율과 내보내기 파일을 지정 (trace_export_path가 없으면 내보내지 않음)
+    def configure(self, settings: Any) -> None:
+        self.shutdown()
+        self.sample_rate = settings.trace_sample_rate
+        path = settings.trace_export_path
+        self.exporter = FileSpanExporter(path, self.service, settings.trace_export_format) if path else None
+
+    #남은 스팬을 기록하고 내보내기를 해제
+    def shutdown(self) -> None:
+        if self.exporter is not None:
+            self.exporter.close()
+        self.exporter = None
+
+    #현재 스팬의 자식 스팬을 열어 활성 스팬으로 지정하는 with 블록
+    #remote: 상위 서비스에서 받은 traceparent (활성 스팬이 없을 때만 사용)
+    #예외가 나면 status=error와 예외 이름을 기록하고 다시 던진다
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None, remote: Optional[str] = None) -> Iterator[Span]:
+        span = self.start(name, attributes, remote)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            self.finish(span, exc)
+            raise
+        else:
+            self.finish(span)
+        finally:
+            try:
+                _current_span.reset(token)
+            #다른 컨텍스트에서 닫힌 경우 (비동기 제너레이터 등)
+            except ValueError:
+                pass
+
+    #활성 스팬으로 지정하지 않고 스팬만 시작 (yield를 사이에 둔 스트리밍 호출 등), finish로 닫는다
+    def start(self, name: str, attributes: Optional[Dict[str, Any]] = None, remote: Optional[str] = None) -> Span:
+        parent = _current_span.get()
+        if parent is not None:
+            trace_id, parent_id, sampled, local_root = parent.trace_id, parent.span_id, parent.sampled, False
+        else:
+            context = parse_traceparent(remote)
+            if context is not None:
+                #상위 서비스의 샘플링 결정을 따름
+                trace_id, parent_id, sampled = context
+            else:
+                trace_id, parent_id, sampled = _new_id(16), None, random.random() < self.sample_rate
+            local_root = True
+        span = Span(name, trace_id, _new_id(8), parent_id, sampled, local_root=local_root)
+        if attributes:
+            span.attributes.update(attributes)
+        span.start_ns = time.time_ns()
+        span._started = time.perf_counter_ns()
+        return span
+
+    def finish(self, span: Span, error: Optional[BaseException] = None) -> None:
+        span.duration_ns = time.perf_counter_ns() - span._started
+        if error is not None:
+            span.status = "error"
+            span.attributes["error"] = type(error).__name__
+        if span.sampled and self.exporter is not None:
+            self.exporter.export(span)
+
+#들어온 HTTP 요청마다 루트 스팬을 여는 ASGI 미들웨어
+#traceparent 헤더가 있으면 상위 서비스의 트레이스를 이어 받고, 응답 헤더에 traceparent를 돌려준다
+#스팬 이름은 실제 경로가 아니라 등록된 경로 템플릿 ("POST /rpc", "POST /api/v1/search/flights")
+class TracingMiddleware:
+
+    def __init__(self, app: Callable, tracer: Tracer) -> None:
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        remote = None
+        for key, value in scope.get("headers") or ():
+            if key == b"traceparent":
+                remote = value.decode("latin-1")
+                break
+
+        with self.tracer.span(scope["method"], {"http.method": scope["method"]}, remote=remote) as span:
+            header = (b"traceparent", span.traceparent().encode("latin-1"))
+
+            async def send_with_trace(message: Dict[str, Any]) -> None:
+                if message["type"] == "http.response.start":
+                    span.set("http.status_code", message["status"])
+                    message["headers"] = [*message.get("headers", []), header]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace)
+            finally:
+                route = getattr(scope.get("route"), "path", "unmatched")
+                span.name = f"{scope['method']} {route}"
+                span.set("http.route", route)
@@ -0,0 +1,183 @@
+#타입 어노테이션 평가 방식을 변화시키는 모듈
+from __future__ import annotations
+
+#orjson이 없을 때 사용하는 표준 JSON 모듈
+import json
+
+#zstandard가 없을 때 사용하는 표준 압축 모듈
+import gzip
+
+#크기 제한을 두고 gzip 본문을 해제하기 위한 모듈
+import zlib
+
+#zstd 본문을 크기 제한을 두고 스트리밍 해제하기 위한 모듈
+import io
+
+#타입 힌트로 사용되는 모듈
+from typing import Any, Dict, List, Optional, Tuple
+
+#FastAPI 기본 응답 클래스 (orjson이 있으면 ORJSONResponse)
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+#BE <-> MCP 서버 JSON-RPC 본문의 인코딩/압축 협상 (BE와 MCP 서버 공용)
+#- 본문 형식: Accept / Content-Type 헤더로 JSON(orjson) 또는 msgpack 중 선택
+#- 압축: Accept-Encoding 헤더로 zstd 또는 gzip 중 선택, 작은 본문은 압축하지 않음
+#선택적 의존성(orjson, msgpack, zstandard)이 없으면 표준 json / gzip으로 같은 형식을 만든다
+
+#빠른 JSON 직렬화/파싱 (선택적 의존성)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson이 설치된 환경에서는 실행되지 않음
+    orjson = None
+
+#바이너리 본문 형식 (선택적 의존성)
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack이 설치된 환경에서는 실행되지 않음
+    msgpack = None
+
+#zstd 압축 (선택적 의존성)
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard가 설치된 환경에서는 실행되지 않음
+    zstandard = None
+
+#본문 형식
+MEDIA_JSON = "application/json"
+MEDIA_MSGPACK = "application/msgpack"
+_MSGPACK_TYPES = (MEDIA_MSGPACK, "application/x-msgpack", "application/vnd.msgpack")
+
+#압축 방식 (선호 순서)
+ENCODING_ZSTD = "zstd"
+ENCODING_GZIP = "gzip"
+
+#이 크기(바이트)보다 작은 본문은 압축 비용이 이득보다 크므로 압축하지 않음
+DEFAULT_COMPRESS_MIN_BYTES = 1024
+
+#해제한 본문이 max_bytes를 넘을 때 발생하는 예외 (작은 압축 본문이 매우 크게 풀리는 압축 폭탄 방지)
+class BodyTooLargeError(ValueError):
+    pass
+
+#orjson이 있으면 FastAPI 기본 응답 클래스로 ORJSONResponse 사용
+FAST_JSON_RESPONSE = ORJSONResponse if orjson is not None else JSONResponse
+
+#JSON 직렬화 (orjson이 있으면 orjson, date 등은 문자열로)
+def dumps_json(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":"), default=str, ensure_ascii=False).encode("utf-8")
+
+def loads_json(body: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+#이 프로세스에서 만들 수 있는 본문 형식 / 압축 방식을 Accept / Accept-Encoding 헤더 값으로
+def accept_header() -> str:
+    return f"{MEDIA_MSGPACK}, {MEDIA_JSON};q=0.9" if msgpack is not None else MEDIA_JSON
+
+def accept_encoding_header() -> str:
+    return f"{ENCODING_ZSTD}, {ENCODING_GZIP}" if zstandard is not None else ENCODING_GZIP
+
+#Accept 헤더로 응답 본문 형식 선택 (msgpack을 받을 수 있고 설치되어 있으면 msgpack, 그 외 JSON)
+def negotiate_media_type(accept: Optional[str]) -> str:
+    if msgpack is not None and accept and any(media in accept for media in _MSGPACK_TYPES):
+        return MEDIA_MSGPACK
+    return MEDIA_JSON
+
+#Accept-Encoding 헤더로 압축 방식 선택 (zstd > gzip, 받을 수 없으면 None)
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    offered = {part.split(";")[0].strip().lower() for part in (accept_encoding or "").split(",")}
+    if zstandard is not None and ENCODING_ZSTD in offered:
+        return ENCODING_ZSTD
+    if ENCODING_GZIP in offered:
+        return ENCODING_GZIP
+    return None
+
+#값을 협상된 형식으로 직렬화하고, min_bytes 이상이면 압축 (본문, 추가 헤더) 반환
+def encode_body(
+    value: Any,
+    accept: Optional[str] = None,
+    accept_encoding: Optional[str] = None,
+    min_bytes: int = DEFAULT_COMPRESS_MIN_BYTES,
+) -> Tuple[bytes, Dict[str, str]]:
+    media_type = negotiate_media_type(accept)
+    if media_type == MEDIA_MSGPACK:
+        body = msgpack.packb(value, default=str, use_bin_type=True)
+    else:
+        body = dumps_json(value)
+    headers = {"content-type": media_type, "vary": "Accept, Accept-Encoding"}
+    encoding = negotiate_encoding(accept_encoding)
+    if encoding is not None and len(body) >= min_bytes:
+        body = compress(body, encoding)
+        headers["content-encoding"] = encoding
+    return body, headers
+
+#Content-Type / Content-Encoding 헤더에 맞게 본문을 해제/파싱 (잘못된 본문은 ValueError)
+#max_bytes: 해제한 본문의 최대 크기, 넘으면 BodyTooLargeError (None이면 제한 없음)
+def decode_body(
+    body: bytes,
+    content_type: Optional[str] = None,
+    content_encoding: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+) -> Any:
+    try:
+        if content_encoding:
+            body = decompress(body, content_encoding.strip().lower(), max_bytes)
+        if max_bytes is not None and len(body) > max_bytes:
+            raise BodyTooLargeError(f"Body exceeds {max_bytes} bytes")
+        if content_type and any(media in content_type for media in _MSGPACK_TYPES):
+            if msgpack is None:
+                raise ValueError("msgpack body received but msgpack is not installed")
+            return msgpack.unpackb(body, raw=False)
+        return loads_json(body)
+    except ValueError:
+        raise
+    except Exception as exc:
+        raise ValueError(f"Invalid body: {exc}") from exc
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == ENCODING_ZSTD:
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    #gzip 레벨 6은 속도 대비 압축률이 좋은 기본값
+    return gzip.compress(body, compresslevel=6)
+
+#max_bytes가 있으면 그 크기 + 1바이트까지만 해제해서, 넘으면 나머지를 풀지 않고 BodyTooLargeError
+def decompress(body: bytes, encoding: str, max_bytes: Optional[int] = None) -> bytes:
+    if encoding in ("", "identity"):
+        return body
+    if encoding == ENCODING_ZSTD:
+        if zstandard is None:
+            raise ValueError("zstd body received but zstandard is not installed")
+        if max_bytes is None:
+            return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+        with zstandard.ZstdDecompressor().stream_reader(io.BytesIO(body), read_across_frames=True) as reader:
+            body = reader.read(max_bytes + 1)
+        if len(body) > max_bytes:
+            raise BodyTooLargeError(f"Decompressed body exceeds {max_bytes} bytes")
+        return body
+    if encoding in (ENCODING_GZIP, "x-gzip"):
+        if max_bytes is None:
+            return gzip.decompress(body)
+        return _gunzip_limited(body, max_bytes)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+#gzip 멤버를 차례로 해제하면서 누적 크기가 max_bytes를 넘으면 중단
+def _gunzip_limited(body: bytes, max_bytes: int) -> bytes:
+    chunks: List[bytes] = []
+    size = 0
+    while body:
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            chunk = decompressor.decompress(body, max_bytes + 1 - size)
+        except zlib.error as exc:
+            raise ValueError(f"Invalid gzip body: {exc}") from exc
+        size += len(chunk)
+        if size > max_bytes:
+            raise BodyTooLargeError(f"Decompressed body exceeds {max_bytes} bytes")
+        chunks.append(chunk)
+        if not decompressor.eof:
+            raise ValueError("Truncated gzip body")
+        body = decompressor.unused_data.lstrip(b"\x00")
+    return b"".join(chunks)
+